@@ -0,0 +1,36 @@
+# cs7349_001c_1252_final.benchmarks.bench_batch_gcd.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_batch_gcd
+
+
+import math
+import os
+import random
+import time
+
+from cs7349_001c_1252_final.scripts.batch_gcd import batch_gcd
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def run(counts=(500, 2000, 8000), bits: int = 1024) -> None:
+    for count in counts:
+        # Random odd stand-ins for moduli; primality does not affect the cost
+        moduli = [random.getrandbits(bits) | (1 << (bits - 1)) | 1 for _ in range(count)]
+        start = time.perf_counter()
+        batch_gcd(moduli, workers=os.cpu_count())
+        batch = time.perf_counter() - start
+        # Pairwise cost estimated from one row of k gcds
+        start = time.perf_counter()
+        for n in moduli:
+            math.gcd(moduli[0], n)
+        pairwise = (time.perf_counter() - start) * count / 2
+        logger.info(f"{count:6d} x {bits}-bit  batch GCD {batch:8.2f} s  pairwise ~{pairwise:8.2f} s")
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run()
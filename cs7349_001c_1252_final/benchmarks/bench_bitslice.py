@@ -0,0 +1,46 @@
+# cs7349_001c_1252_final.benchmarks.bench_bitslice.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_bitslice
+
+
+import os
+import time
+from typing import Callable
+
+from cs7349_001c_1252_final.scripts.des_cipher import generate_subkeys, process_block
+from cs7349_001c_1252_final.scripts.des_table import generate_subkeys_int, ecb_crypt_int
+from cs7349_001c_1252_final.scripts.des_bitslice import bitslice_crypt
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def blocks_per_second(fn: Callable[[bytes], bytes], data: bytes) -> float:
+    start = time.perf_counter()
+    fn(data)
+    elapsed = time.perf_counter() - start
+    return (len(data) // 8) / elapsed
+
+
+def run(key: bytes = b"secr3t_k", per_block_blocks: int = 2048, batch_blocks: int = 65536) -> None:
+    subkeys = generate_subkeys(key)
+    subkeys_int = generate_subkeys_int(key)
+
+    small = os.urandom(8 * per_block_blocks)
+    large = os.urandom(8 * batch_blocks)
+
+    reference = blocks_per_second(
+        lambda d: b''.join(process_block(d[i:i+8], subkeys) for i in range(0, len(d), 8)), small)
+    table = blocks_per_second(lambda d: ecb_crypt_int(d, subkeys_int), large)
+    bitslice = blocks_per_second(lambda d: bitslice_crypt(d, subkeys), large)
+
+    logger.info(f"process_block (bits): {reference:12,.0f} blocks/sec")
+    logger.info(f"table engine:         {table:12,.0f} blocks/sec")
+    logger.info(f"bitslice engine:      {bitslice:12,.0f} blocks/sec ({bitslice / reference:.0f}x per-block path)")
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run()
@@ -0,0 +1,54 @@
+# cs7349_001c_1252_final.benchmarks.bench_envelope.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_envelope [MEGABYTES]
+
+
+import io
+import os
+import sys
+import time
+
+from cs7349_001c_1252_final.scripts.des_modes import ctr_crypt
+from cs7349_001c_1252_final.scripts.envelope import SessionKeyCache, open_envelope, seal, seal_stream
+from cs7349_001c_1252_final.scripts.rsa_cipher import generate_rsa_keypairs
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def _rate(size: int, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return size / (time.perf_counter() - start) / 1e6
+
+
+def run(megabytes: int = 8, recipients: int = 50, bits: int = 2048, messages: int = 200) -> None:
+    keys = generate_rsa_keypairs(recipients, bits)
+    public = [key.public_key() for key in keys]
+    size = megabytes << 20
+    data = os.urandom(size)
+
+    # Bulk payload: symmetric cipher alone against a full envelope for every recipient at once
+    raw = _rate(size, lambda: ctr_crypt(data, b"secr3t_k", bytes(8)))
+    sealed = _rate(size, lambda: seal_stream(io.BytesIO(data), io.BytesIO(), public, workers=None))
+    logger.info(f"{megabytes} MB: DES-CTR {raw:.2f} MB/s, envelope for {recipients} recipients "
+                f"{sealed:.2f} MB/s ({sealed / raw:.0%} of symmetric)")
+
+    # Many small messages: the session cache removes the per-message RSA wrap and unwrap
+    message = os.urandom(4096)
+    for label, cache in (("no cache", None), ("cached", SessionKeyCache())):
+        start = time.perf_counter()
+        envelopes = [seal(message, public[:5], cache=cache) for _ in range(messages)]
+        sealing = (time.perf_counter() - start) / messages
+        start = time.perf_counter()
+        for envelope in envelopes:
+            open_envelope(envelope, keys[0], cache=cache)
+        opening = (time.perf_counter() - start) / messages
+        logger.info(f"4 KB message to 5 recipients, {label:8s}: seal {sealing * 1e3:7.3f} ms, "
+                    f"open {opening * 1e3:7.3f} ms")
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
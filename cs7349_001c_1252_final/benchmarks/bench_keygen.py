@@ -0,0 +1,55 @@
+# cs7349_001c_1252_final.benchmarks.bench_keygen.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_keygen
+
+
+import os
+import random
+import time
+
+from cs7349_001c_1252_final.scripts.number_theory import is_prime, random_prime
+from cs7349_001c_1252_final.scripts.rsa_cipher import generate_rsa_keys, generate_rsa_keypairs
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def _unsieved_prime(bits: int) -> int:
+    # Baseline: Miller-Rabin on consecutive odd candidates with no residue sieve
+    candidate = random.getrandbits(bits) | (3 << (bits - 2)) | 1
+    while not is_prime(candidate):
+        candidate += 2
+    return candidate
+
+
+def run(sizes=(1024, 2048, 4096), repeats: int = 3, parallel_keys: int = 8) -> None:
+    for bits in sizes:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            generate_rsa_keys(bits)
+        logger.info(f"{bits:5d}-bit key:  {(time.perf_counter() - start) / repeats:8.3f} s/key")
+
+    bits = 1024
+    start = time.perf_counter()
+    for _ in range(repeats):
+        random_prime(bits // 2)
+    sieved = (time.perf_counter() - start) / repeats
+    start = time.perf_counter()
+    for _ in range(repeats):
+        _unsieved_prime(bits // 2)
+    plain = (time.perf_counter() - start) / repeats
+    logger.info(f"{bits // 2}-bit prime: sieved {sieved:.3f} s, unsieved {plain:.3f} s")
+
+    max_workers = os.cpu_count() or 1
+    for workers in sorted({1, max_workers}):
+        start = time.perf_counter()
+        generate_rsa_keypairs(parallel_keys, bits=bits, workers=workers)
+        rate = parallel_keys / (time.perf_counter() - start)
+        logger.info(f"workers={workers:2d}  {rate:6.2f} {bits}-bit keys/sec")
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run()
@@ -0,0 +1,79 @@
+# cs7349_001c_1252_final.benchmarks.bench_keyring.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_keyring
+
+
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from cs7349_001c_1252_final.scripts.keyring import Keyring, write_keyring
+from cs7349_001c_1252_final.scripts.rsa_cipher import RSAPrivateKey, generate_rsa_keys
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def _json_entry(key) -> dict:
+    if isinstance(key, RSAPrivateKey):
+        return {"p": key.p, "q": key.q, "e": key.e, "d": key.d, "dp": key.dp, "dq": key.dq, "q_inv": key.q_inv}
+    return {"des": key.hex()}
+
+
+def _json_lookup(path: str, key_id: str):
+    with open(path) as f:
+        entry = json.load(f)[key_id]
+    if "des" in entry:
+        return bytes.fromhex(entry["des"])
+    return RSAPrivateKey.from_components(entry["p"], entry["q"], entry["e"], entry["d"],
+                                         entry["dp"], entry["dq"], entry["q_inv"])
+
+
+def _keyring_lookup(path: str, key_id: str):
+    with Keyring(path) as ring:
+        return ring.get(key_id)
+
+
+def _measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(count: int = 100_000, rsa_every: int = 4, bits: int = 2048) -> None:
+    # A handful of real keys cycled through the store; every rsa_every-th entry is RSA, the rest DES
+    pool = [generate_rsa_keys(bits) for _ in range(4)]
+    keys = {f"k{i:07d}": (pool[i % len(pool)] if i % rsa_every == 0 else os.urandom(8)) for i in range(count)}
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path, ring_path = os.path.join(tmp, "keys.json"), os.path.join(tmp, "keys.bin")
+        with open(json_path, 'w') as f:
+            json.dump({key_id: _json_entry(key) for key_id, key in keys.items()}, f)
+        write_keyring(ring_path, keys)
+        logger.info(f"{count} keys ({bits}-bit RSA every {rsa_every}): JSON {os.path.getsize(json_path) / 1e6:.1f} MB, "
+                    f"keyring {os.path.getsize(ring_path) / 1e6:.1f} MB")
+        targets = random.sample(sorted(keys), 5)
+        for name, fn, path in (("json", _json_lookup, json_path), ("keyring", _keyring_lookup, ring_path)):
+            results = [_measure(fn, path, key_id) for key_id in targets]
+            elapsed = sum(r[0] for r in results) / len(results)
+            peak = max(r[1] for r in results)
+            logger.info(f"{name:8s} open + one lookup {elapsed * 1e3:9.3f} ms, peak Python memory {peak / 1e6:8.2f} MB")
+        with Keyring(ring_path) as ring:
+            start = time.perf_counter()
+            for key_id in targets * 200:
+                ring.get(key_id)
+            rate = len(targets) * 200 / (time.perf_counter() - start)
+        logger.info(f"keyring lookups on an open file: {rate:,.0f}/s")
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run()
@@ -0,0 +1,70 @@
+# cs7349_001c_1252_final.benchmarks.bench_logging.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_logging
+
+
+import os
+import random
+import tempfile
+import time
+
+from cs7349_001c_1252_final.config.logging_config import LOG_FORMAT, setup_logging, shutdown_logging
+from cs7349_001c_1252_final.scripts.des_cipher import crypt_blocks
+from cs7349_001c_1252_final.scripts.des_key import DESKey
+from cs7349_001c_1252_final.scripts.rsa_cipher import encrypt, generate_rsa_keys
+
+# Logger Configuration
+import logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def _per_op(fn, ops: int, repeat: int = 10) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) / ops)
+    return best
+
+
+def _configure(mode: str, path: str) -> None:
+    shutdown_logging()
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if isinstance(h, logging.FileHandler)]:
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(logging.WARNING)
+    if mode == "queue INFO":
+        setup_logging(level="INFO", log_file=path, console=False)
+    elif mode == "queue DEBUG":
+        setup_logging(level="DEBUG", log_file=path, console=False)
+    elif mode == "sync DEBUG":
+        # The previous setup: records formatted and written on the calling thread
+        handler = logging.FileHandler(path)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(handler)
+        root.setLevel(logging.DEBUG)
+
+
+def run(blocks: int = 4096, rsa_ops: int = 200) -> None:
+    des_key = DESKey(b"secr3t_k")
+    data = os.urandom(blocks * 8)
+    rsa_key = generate_rsa_keys(2048)
+    messages = [random.randrange(rsa_key.n) for _ in range(rsa_ops)]
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("unconfigured", "queue INFO", "queue DEBUG", "sync DEBUG"):
+            _configure(mode, os.path.join(tmp, mode.replace(" ", "_") + ".log"))
+            des = _per_op(lambda: crypt_blocks(data, des_key, engine="table"), blocks)
+            rsa = _per_op(lambda: [encrypt(m, rsa_key.e, rsa_key.n) for m in messages], rsa_ops)
+            rows.append((mode, des, rsa))
+        _configure("unconfigured", "")
+    setup_logging(level="INFO", log_file=None)
+    base_des, base_rsa = rows[0][1], rows[0][2]
+    for mode, des, rsa in rows:
+        logger.info(f"{mode:13s} DES table {des * 1e6:7.2f} us/block ({des / base_des:5.2f}x)  "
+                    f"RSA-2048 encrypt {rsa * 1e6:8.2f} us/op ({rsa / base_rsa:5.2f}x)")
+
+
+if __name__ == "__main__":
+    run()
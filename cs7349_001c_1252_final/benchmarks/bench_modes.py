@@ -0,0 +1,36 @@
+# cs7349_001c_1252_final.benchmarks.bench_modes.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_modes
+
+
+import os
+import time
+
+from cs7349_001c_1252_final.scripts.des_modes import cbc_encrypt, cbc_decrypt, ctr_crypt
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def run(key: bytes = b"secr3t_k", size: int = 8 << 20) -> None:
+    iv = os.urandom(8)
+    data = os.urandom(size)
+    cipher = cbc_encrypt(data, key, iv)
+    max_workers = os.cpu_count() or 1
+    for workers in sorted({1, 2, 4, max_workers}):
+        if workers > max_workers:
+            continue
+        start = time.perf_counter()
+        ctr_crypt(data, key, iv, workers=workers)
+        ctr = size / (time.perf_counter() - start) / 1e6
+        start = time.perf_counter()
+        cbc_decrypt(cipher, key, iv, workers=workers)
+        cbc = size / (time.perf_counter() - start) / 1e6
+        logger.info(f"workers={workers:2d}  CTR {ctr:7.2f} MB/s  CBC decrypt {cbc:7.2f} MB/s")
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run()
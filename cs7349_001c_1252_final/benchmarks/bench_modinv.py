@@ -0,0 +1,42 @@
+# cs7349_001c_1252_final.benchmarks.bench_modinv.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_modinv
+
+
+import random
+import time
+
+from cs7349_001c_1252_final.scripts.number_theory import random_prime
+from cs7349_001c_1252_final.scripts.rsa_cipher import batch_mod_inv, ext_euclidean, mod_inv
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def run(bits=(256, 1024, 2048), count: int = 10_000) -> None:
+    for size in bits:
+        m = random_prime(size)
+        values = [random.randrange(1, m) for _ in range(count)]
+
+        start = time.perf_counter()
+        euclid = [ext_euclidean(v, m)[1] % m for v in values]
+        euclid_rate = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        single = [mod_inv(v, m) for v in values]
+        single_rate = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        batch = batch_mod_inv(values, m)
+        batch_rate = count / (time.perf_counter() - start)
+
+        assert euclid == single == batch
+        logger.info(f"{size:5d}-bit  ext_euclidean {euclid_rate:10,.0f}/s  mod_inv {single_rate:10,.0f}/s  "
+                    f"batch_mod_inv {batch_rate:10,.0f}/s ({batch_rate / single_rate:.1f}x)")
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run()
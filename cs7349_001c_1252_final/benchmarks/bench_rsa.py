@@ -0,0 +1,40 @@
+# cs7349_001c_1252_final.benchmarks.bench_rsa.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_rsa
+
+
+import random
+import time
+
+from cs7349_001c_1252_final.scripts.rsa_cipher import decrypt, encrypt, generate_rsa_keys
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def run(sizes=(1024, 2048, 4096), n_ops: int = 20, prime_counts=(2, 3, 4)) -> None:
+    for bits in sizes:
+        base = generate_rsa_keys(bits)
+        ciphertexts = [encrypt(random.randrange(base.n), base.e, base.n) for _ in range(n_ops)]
+        start = time.perf_counter()
+        [decrypt(c, base.d, base.n) for c in ciphertexts]
+        plain_rate = n_ops / (time.perf_counter() - start)
+        logger.info(f"{bits:5d}-bit  pow(c, d, n)     {plain_rate:8.1f} ops/sec")
+
+        two_prime_rate = None
+        for count in prime_counts:
+            key = generate_rsa_keys(bits, primes=count)
+            ciphertexts = [encrypt(random.randrange(key.n), key.e, key.n) for _ in range(n_ops)]
+            start = time.perf_counter()
+            key.decrypt_many(ciphertexts)
+            rate = n_ops / (time.perf_counter() - start)
+            two_prime_rate = two_prime_rate or rate
+            logger.info(f"{bits:5d}-bit  CRT, {count} primes  {rate:8.1f} ops/sec  "
+                        f"({rate / plain_rate:.1f}x plain, {rate / two_prime_rate:.2f}x two-prime)")
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run()
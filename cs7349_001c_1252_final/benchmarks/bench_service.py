@@ -0,0 +1,72 @@
+# cs7349_001c_1252_final.benchmarks.bench_service.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_service
+
+
+import asyncio
+import os
+import statistics
+import time
+from typing import List, Optional
+
+from cs7349_001c_1252_final.scripts.crypto_service import CryptoClient, CryptoService
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def _client_loop(client: CryptoClient, key: bytes, message: bytes, count: int, latencies: List[float]) -> None:
+    for _ in range(count):
+        start = time.perf_counter()
+        await client.des_encrypt(message, key)
+        latencies.append(time.perf_counter() - start)
+
+
+async def load(host: str = "127.0.0.1", port: Optional[int] = None, path: Optional[str] = None,
+               connections: int = 8, concurrency: int = 32, requests: int = 4000, message_size: int = 64) -> dict:
+    # Without a port or path a local instance is started for the duration of the run
+    service = None
+    if port is None and path is None:
+        service = CryptoService(host=host, port=0)
+        await service.start()
+        port = service.port
+    try:
+        clients = [await CryptoClient.connect(host, port or 0, path) for _ in range(connections)]
+        key, message = os.urandom(8), os.urandom(message_size)
+        latencies: List[float] = []
+        per_task = requests // concurrency
+        start = time.perf_counter()
+        await asyncio.gather(*(_client_loop(clients[i % connections], key, message, per_task, latencies)
+                               for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        for client in clients:
+            await client.close()
+    finally:
+        if service is not None:
+            await service.close()
+    stats = {
+        "requests": len(latencies),
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1e3,
+        "p99_ms": percentile(latencies, 99) * 1e3,
+        "mean_ms": statistics.fmean(latencies) * 1e3,
+    }
+    logger.info(f"{stats['requests']} requests: {stats['requests_per_second']:,.0f} req/s, "
+                f"p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
+    return stats
+
+
+def run(**kwargs) -> dict:
+    return asyncio.run(load(**kwargs))
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run()
@@ -0,0 +1,47 @@
+# cs7349_001c_1252_final.benchmarks.bench_tdes.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.bench_tdes
+
+
+import os
+import time
+
+from cs7349_001c_1252_final.scripts.des_cipher import generate_subkeys, process_block
+from cs7349_001c_1252_final.scripts.des_table import generate_subkeys_int, process_block_int
+from cs7349_001c_1252_final.scripts.tdes_cipher import TDESKey, tdes_crypt_blocks
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+
+def run(n_blocks: int = 4096, n_reference_blocks: int = 256) -> None:
+    key = os.urandom(24)
+    data = os.urandom(8 * n_blocks)
+
+    k1, k2, k3 = (generate_subkeys(key[i:i+8]) for i in (0, 8, 16))
+    start = time.perf_counter()
+    for i in range(0, 8 * n_reference_blocks, 8):
+        process_block(process_block(process_block(data[i:i+8], k1), k2, encrypt=False), k3)
+    chained_bits = n_reference_blocks / (time.perf_counter() - start)
+
+    t1, t2, t3 = (generate_subkeys_int(key[i:i+8]) for i in (0, 8, 16))
+    start = time.perf_counter()
+    for i in range(0, len(data), 8):
+        process_block_int(process_block_int(process_block_int(data[i:i+8], t1), t2, encrypt=False), t3)
+    chained_table = n_blocks / (time.perf_counter() - start)
+
+    tdes_key = TDESKey(key)
+    start = time.perf_counter()
+    tdes_crypt_blocks(data, tdes_key)
+    fused = n_blocks / (time.perf_counter() - start)
+
+    logger.info(f"3x process_block (bits):  {chained_bits:10,.0f} blocks/sec")
+    logger.info(f"3x process_block_int:     {chained_table:10,.0f} blocks/sec")
+    logger.info(f"fused 48-round core:      {fused:10,.0f} blocks/sec")
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    run()
@@ -0,0 +1,231 @@
+# cs7349_001c_1252_final.benchmarks.suite.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.benchmarks.suite [--quick] [-o results.json] [--baseline base.json]
+
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from cs7349_001c_1252_final.scripts.des_cipher import crypt_blocks, generate_subkeys
+from cs7349_001c_1252_final.scripts.des_key import DESKey, clear_key_cache
+from cs7349_001c_1252_final.scripts.des_table import generate_subkeys_int
+from cs7349_001c_1252_final.scripts.rsa_cipher import (
+    RSAPrivateKey, brute_force_private_key, decrypt, encrypt, find_primes_in_range, generate_rsa_keys
+)
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+RESULTS_VERSION = 1
+# A case fails the comparison when it takes this much longer per operation than the baseline
+DEFAULT_THRESHOLD = 0.25
+DES_KEY = b"secr3t_k"
+# Fixed seed so every run factors and decrypts the same numbers
+SEED = 7349
+RSA_MESSAGES = 20
+
+
+class Case(NamedTuple):
+    name: str
+    fn: Callable[[], object]
+    ops: int  # operations performed by one call of fn
+    unit: str
+    repeat: int = 5
+    # min suits deterministic work; cases whose cost is random per call use the median
+    aggregate: Callable[[Sequence[float]], float] = min
+
+
+class Regression(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+
+
+def _des_cases(quick: bool) -> List[Case]:
+    cases = [
+        Case("des.generate_subkeys.bits", lambda: generate_subkeys(DES_KEY), 1, "schedule"),
+        Case("des.generate_subkeys.int", lambda: generate_subkeys_int(DES_KEY), 1, "schedule"),
+    ]
+    sizes = (8, 1024) if quick else (8, 64, 1024, 65536)
+    key = DESKey(DES_KEY)
+    for engine in ("table", "bitslice"):
+        for size in sizes:
+            data = os.urandom(size)
+            cases.append(Case(f"des.{engine}.{size}B.reuse", lambda d=data, e=engine: crypt_blocks(d, key, engine=e),
+                              size // 8, "block"))
+            cases.append(Case(f"des.{engine}.{size}B.fresh", lambda d=data, e=engine: _fresh_key_crypt(d, e),
+                              size // 8, "block"))
+    return cases
+
+
+def _fresh_key_crypt(data: bytes, engine: str) -> bytes:
+    # Raw key bytes with an empty key cache: every message pays for its own key schedule
+    clear_key_cache()
+    return crypt_blocks(data, DES_KEY, engine=engine)
+
+
+def _rsa_cases(quick: bool) -> List[Case]:
+    # Keys and messages are made by the first (untimed) call of a case, so filtered-out cases cost nothing
+    cases: List[Case] = []
+    for bits in ((512, 1024) if quick else (512, 1024, 2048)):
+        # Prime search cost varies wildly between draws, so keygen is timed on the same seeded draws every run
+        keys = 2 if quick else 4
+        cases.append(Case(f"rsa.keygen.{bits}", lambda b=bits: [generate_rsa_keys(b, rng=random.Random(SEED + i))
+                                                                for i in range(keys)], keys, "key", repeat=3))
+        cases.append(Case(f"rsa.encrypt.{bits}", lambda b=bits: _rsa_encrypt(b), RSA_MESSAGES, "op"))
+        cases.append(Case(f"rsa.decrypt.{bits}", lambda b=bits: _rsa_decrypt(b), RSA_MESSAGES, "op"))
+        cases.append(Case(f"rsa.decrypt_crt.{bits}", lambda b=bits: _rsa_key(b).decrypt_many(_rsa_ciphertexts(b)),
+                          RSA_MESSAGES, "op"))
+    return cases
+
+
+@lru_cache(maxsize=None)
+def _rsa_key(bits: int) -> RSAPrivateKey:
+    return generate_rsa_keys(bits, rng=random.Random(SEED + bits))
+
+
+@lru_cache(maxsize=None)
+def _rsa_messages(bits: int) -> List[int]:
+    rng = random.Random(SEED + bits)
+    return [rng.randrange(_rsa_key(bits).n) for _ in range(RSA_MESSAGES)]
+
+
+@lru_cache(maxsize=None)
+def _rsa_ciphertexts(bits: int) -> List[int]:
+    key = _rsa_key(bits)
+    return [pow(m, key.e, key.n) for m in _rsa_messages(bits)]
+
+
+def _rsa_encrypt(bits: int) -> List[int]:
+    key = _rsa_key(bits)
+    return [encrypt(m, key.e, key.n) for m in _rsa_messages(bits)]
+
+
+def _rsa_decrypt(bits: int) -> List[int]:
+    key = _rsa_key(bits)
+    return [decrypt(c, key.d, key.n) for c in _rsa_ciphertexts(bits)]
+
+
+def _search_cases(quick: bool) -> List[Case]:
+    cases = []
+    ranges = ((0, 10**5), (0, 10**6)) if quick else ((0, 10**5), (0, 10**6), (10**9, 10**9 + 10**6))
+    for start, end in ranges:
+        cases.append(Case(f"primes.range.{start}-{end}", lambda s=start, e=end: find_primes_in_range(s, e),
+                          1, "range", repeat=3))
+    for bits in ((32, 48) if quick else (32, 48, 64, 80)):
+        cases.append(Case(f"rsa.brute_force.{bits}", lambda b=bits: _brute_force(b), 1, "key",
+                          aggregate=statistics.median))
+    return cases
+
+
+def _brute_force(bits: int) -> Tuple[int, int, int, float]:
+    key = _rsa_key(bits)
+    return brute_force_private_key(key.e, key.n)
+
+
+SUITES: Dict[str, Callable[[bool], List[Case]]] = {
+    "des": _des_cases,
+    "rsa": _rsa_cases,
+    "search": _search_cases,
+}
+
+
+def time_case(case: Case) -> float:
+    # Seconds per operation, aggregated over case.repeat calls after one warm-up call
+    case.fn()
+    samples = []
+    for _ in range(case.repeat):
+        start = time.perf_counter()
+        case.fn()
+        samples.append((time.perf_counter() - start) / case.ops)
+    return case.aggregate(samples)
+
+
+def run_suite(quick: bool = False, only: Optional[Sequence[str]] = None) -> dict:
+    results: Dict[str, dict] = {}
+    # Building a case is cheap; keys and other fixtures are only made once a selected case runs
+    cases = [case for build in SUITES.values() for case in build(quick)]
+    for case in (c for c in cases if not only or any(pattern in c.name for pattern in only)):
+        seconds = time_case(case)
+        rate = 1 / seconds if seconds else None
+        results[case.name] = {"seconds_per_op": seconds, "ops_per_sec": rate, "unit": case.unit}
+        rate_text = f"{rate:14,.1f}" if rate else f"{'n/a':>14}"
+        logger.info(f"{case.name:40s} {seconds * 1e6:14.2f} us/{case.unit}  {rate_text} {case.unit}s/sec")
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def save_results(results: dict, path: str) -> None:
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path: str) -> dict:
+    with open(path) as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path}: unsupported results version {results.get('version')}.")
+    return results
+
+
+def compare_results(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    # Cases present in only one of the runs are ignored
+    regressions = []
+    for name, entry in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or not base["seconds_per_op"]:
+            continue
+        ratio = entry["seconds_per_op"] / base["seconds_per_op"]
+        logger.info(f"{name:40s} {ratio:6.2f}x baseline")
+        if ratio > 1 + threshold:
+            regressions.append(Regression(name, base["seconds_per_op"], entry["seconds_per_op"], ratio))
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run the cipher benchmarks and compare against a baseline")
+    parser.add_argument("-o", "--output", help="write the results JSON here")
+    parser.add_argument("-b", "--baseline", help="results JSON to compare against")
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown per case as a fraction (0.25 = 25%% slower)")
+    parser.add_argument("-k", "--only", action="append", help="run only cases whose name contains this (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="fewer sizes and keys")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    results = run_suite(args.quick, args.only)
+    if args.output:
+        save_results(results, args.output)
+    if args.baseline:
+        regressions = compare_results(results, load_results(args.baseline), args.threshold)
+        for r in regressions:
+            logger.error(f"{r.name}: {r.current * 1e6:.2f} us vs {r.baseline * 1e6:.2f} us baseline "
+                         f"({r.ratio:.2f}x, limit {1 + args.threshold:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"scripts": "INFO"})
+    sys.exit(main())
@@ -1,8 +1,15 @@
 # cs7349_001c_1252_final.config.logging_config.py
 # Garrett Gruss 4/27/2025
 
+# Importing this module has no side effects. setup_logging() puts a QueueHandler on the root
+# logger, so logging calls only enqueue records; a QueueListener thread does the console and
+# file I/O. The rotating log file is opened when the first record is written to it.
+import atexit
 import logging
-import coloredlogs
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Mapping, Optional, Union
 
 # Format for all log messages
 LOG_FORMAT = "%(asctime)s %(name)s:%(lineno)d %(levelname)s: %(message)s"
@@ -23,21 +30,128 @@ LEVEL_STYLES = {
     'critical': {'color': 'magenta'}
 }
 
-# Plain file handler (no colors)
-FILE_HANDLER = logging.FileHandler('app.log')
-FILE_HANDLER.setLevel('DEBUG')
-FILE_HANDLER.setFormatter(logging.Formatter(LOG_FORMAT))
-
-
-def setup_logging():
-    # Install colored console logging on root
-    coloredlogs.install(
-        level='DEBUG',
-        fmt=LOG_FORMAT,
-        field_styles=FIELD_STYLES,
-        level_styles=LEVEL_STYLES,
-        logger=logging.getLogger()
-    )
-    # Add file handler for persistent logs
+# Plain (uncolored) log file, rotated by size
+LOG_FILE = 'app.log'
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+DEFAULT_LEVEL = 'DEBUG'
+# "OFF" silences a logger completely
+OFF = logging.CRITICAL + 1
+
+# Overrides read by setup_logging: CS7349_LOG_LEVEL=INFO, CS7349_LOG_LEVELS="des_cipher=OFF,rsa_cipher=INFO"
+LEVEL_ENV = 'CS7349_LOG_LEVEL'
+LEVELS_ENV = 'CS7349_LOG_LEVELS'
+
+PACKAGE = 'cs7349_001c_1252_final'
+SUBPACKAGES = ('scripts', 'benchmarks', 'config', 'tests')
+
+Level = Union[int, str]
+
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+_configured_loggers: Dict[str, int] = {}
+
+
+def parse_level(level: Level) -> int:
+    if isinstance(level, int):
+        return level
+    name = level.strip().upper()
+    if name == 'OFF':
+        return OFF
+    value = logging.getLevelName(name)
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level {level!r}.")
+    return value
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    # "des_cipher=OFF, rsa_cipher=INFO" -> {logger name: level}
+    levels: Dict[str, int] = {}
+    for item in spec.split(','):
+        if not item.strip():
+            continue
+        name, sep, level = item.partition('=')
+        if not sep or not name.strip():
+            raise ValueError(f"Expected module=LEVEL, got {item.strip()!r}.")
+        levels[logger_name(name.strip())] = parse_level(level)
+    return levels
+
+
+def logger_name(name: str) -> str:
+    # Short names resolve inside the package: "rsa_cipher" -> <package>.scripts.rsa_cipher,
+    # "scripts" or "benchmarks.suite" -> <package>.scripts / <package>.benchmarks.suite
+    if name == 'root' or name == PACKAGE or name.startswith(PACKAGE + '.'):
+        return name
+    if '.' in name or name in SUBPACKAGES:
+        return f"{PACKAGE}.{name}"
+    return f"{PACKAGE}.scripts.{name}"
+
+
+def _console_handler() -> logging.Handler:
+    handler = logging.StreamHandler()
+    if not handler.stream.isatty():
+        # Plain text when redirected, like coloredlogs.install
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        return handler
+    # coloredlogs is only needed once logging is actually configured
+    import coloredlogs
+    handler.setFormatter(coloredlogs.ColoredFormatter(fmt=LOG_FORMAT, field_styles=FIELD_STYLES,
+                                                      level_styles=LEVEL_STYLES))
+    return handler
+
+
+def _file_handler(path: str, max_bytes: int, backup_count: int) -> logging.Handler:
+    # delay=True: the file is not created until the first record reaches it
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    return handler
+
+
+def setup_logging(level: Optional[Level] = None, levels: Optional[Mapping[str, Level]] = None,
+                  log_file: Optional[str] = LOG_FILE, console: bool = True,
+                  max_bytes: int = LOG_MAX_BYTES, backup_count: int = LOG_BACKUP_COUNT) -> None:
+    # level applies to the root logger (default DEBUG); levels sets individual loggers, e.g.
+    # {"des_cipher": "OFF", "rsa_cipher": "INFO"}. Environment overrides win over both.
+    # Calling it again replaces the previous configuration.
+    shutdown_logging()
     root = logging.getLogger()
-    root.addHandler(FILE_HANDLER)
+    root.setLevel(parse_level(os.environ.get(LEVEL_ENV) or (level if level is not None else DEFAULT_LEVEL)))
+
+    module_levels = {logger_name(name): parse_level(value) for name, value in (levels or {}).items()}
+    module_levels.update(parse_levels(os.environ.get(LEVELS_ENV, '')))
+    for name, value in module_levels.items():
+        logging.getLogger(name).setLevel(value)
+        _configured_loggers[name] = value
+
+    handlers = []
+    if console:
+        handlers.append(_console_handler())
+    if log_file:
+        handlers.append(_file_handler(log_file, max_bytes, backup_count))
+    global _queue_handler, _listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    root.addHandler(_queue_handler)
+
+
+def shutdown_logging() -> None:
+    # Drains the queue, closes the handlers and undoes the per-module levels; safe to call repeatedly
+    global _queue_handler, _listener
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    for name in _configured_loggers:
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    _configured_loggers.clear()
+
+
+# Runs before logging's own shutdown hook, so queued records are written before exit
+atexit.register(shutdown_logging)
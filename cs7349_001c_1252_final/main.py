@@ -0,0 +1,259 @@
+# cs7349_001c_1252_final.main.py
+# Garrett Gruss 4/27/2025
+# Usage: cs7349 des encrypt --key secr3t_k FILE [FILE ...]
+#        python -m cs7349_001c_1252_final.main rsa keygen -o key.json
+
+# Cipher modules (and coloredlogs) are imported inside the subcommands so that
+# startup only pays for what the chosen command uses.
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+DES_SUFFIX = ".des"
+RSA_SUFFIX = ".rsa"
+DECRYPTED_SUFFIX = ".dec"
+RSA_CHUNK_SIZE = 1 << 16
+PARTIAL_SUFFIX = ".part"
+
+
+def expand_inputs(patterns: Sequence[str]) -> List[Tuple[str, str]]:
+    # Returns (path, name relative to the argument it came from) for every input file
+    found: List[Tuple[str, str]] = []
+    seen = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = []
+            for root, _, files in os.walk(pattern):
+                matches += [(os.path.join(root, f), os.path.relpath(os.path.join(root, f), pattern)) for f in sorted(files)]
+        elif glob.has_magic(pattern):
+            matches = [(p, os.path.basename(p)) for p in sorted(glob.glob(pattern, recursive=True)) if os.path.isfile(p)]
+        elif os.path.isfile(pattern):
+            matches = [(pattern, os.path.basename(pattern))]
+        else:
+            raise FileNotFoundError(f"No such file or directory: {pattern}")
+        for path, name in matches:
+            if path not in seen:
+                seen.add(path)
+                found.append((path, name))
+    return found
+
+
+def output_path(path: str, name: str, output_dir: Optional[str], suffix: str, decrypt: bool) -> str:
+    if decrypt:
+        target = name[:-len(suffix)] if name.endswith(suffix) else name + DECRYPTED_SUFFIX
+    else:
+        target = name + suffix
+    if output_dir is None:
+        return os.path.join(os.path.dirname(path), os.path.basename(target))
+    full = os.path.join(output_dir, target)
+    os.makedirs(os.path.dirname(full) or ".", exist_ok=True)
+    return full
+
+
+def parse_des_key(text: str) -> bytes:
+    # Either 8 characters or 16 hex digits
+    if len(text) == 16:
+        try:
+            return bytes.fromhex(text)
+        except ValueError:
+            pass
+    key = text.encode('utf-8')
+    if len(key) != 8:
+        raise argparse.ArgumentTypeError("DES key must be 8 characters or 16 hex digits.")
+    return key
+
+
+@contextmanager
+def _replace_on_success(dst: str) -> Iterator[str]:
+    # Output goes to dst.part and is renamed over dst only once complete, so a failed decrypt
+    # neither leaves a partial file behind nor clobbers an existing one
+    tmp = dst + PARTIAL_SUFFIX
+    try:
+        yield tmp
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, dst)
+
+
+def _des_file(task: Tuple[str, str, bytes, bool, str]) -> int:
+    from cs7349_001c_1252_final.scripts.des_stream import encrypt_file, decrypt_file
+    src, dst, key, decrypt, engine = task
+    with _replace_on_success(dst) as tmp:
+        (decrypt_file if decrypt else encrypt_file)(src, tmp, key, engine=engine)
+    return os.path.getsize(src)
+
+
+def _rsa_file(task: Tuple[str, str, dict, bool]) -> int:
+    # Streams the file through the block codec; each ciphertext is written at the fixed width of n
+    from cs7349_001c_1252_final.scripts.rsa_cipher import RSAPrivateKey
+    from cs7349_001c_1252_final.scripts.utils import iter_pack_blocks, iter_unpack_blocks
+    src, dst, key, decrypting = task
+    n = key["n"]
+    width = (n.bit_length() + 7) // 8
+    with _replace_on_success(dst) as tmp, open(src, 'rb') as fin, open(tmp, 'wb') as fout:
+        if decrypting:
+            private = RSAPrivateKey(key["p"], key["q"], key["e"], key["d"], key.get("primes", [])[2:])
+            for piece in iter_unpack_blocks(map(private.decrypt, _read_ints(fin, width)), n):
+                fout.write(piece)
+        else:
+            e = key["e"]
+            chunks = iter(lambda: fin.read(RSA_CHUNK_SIZE), b'')
+            for block in iter_pack_blocks(chunks, n):
+                fout.write(pow(block, e, n).to_bytes(width, 'big'))
+    return os.path.getsize(src)
+
+
+def _read_ints(f, width: int) -> Iterator[int]:
+    for chunk in iter(lambda: f.read(width * (RSA_CHUNK_SIZE // width + 1)), b''):
+        if len(chunk) % width:
+            raise ValueError(f"Ciphertext length must be a multiple of {width} bytes.")
+        for i in range(0, len(chunk), width):
+            yield int.from_bytes(chunk[i:i+width], 'big')
+
+
+def run_files(fn: Callable, tasks: List[tuple], jobs: int) -> int:
+    start = time.perf_counter()
+    if jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            sizes = list(pool.map(fn, tasks))
+    else:
+        sizes = [fn(task) for task in tasks]
+    elapsed = time.perf_counter() - start
+    total = sum(sizes)
+    rate = total / elapsed / 1e6 if elapsed > 0 else 0.0
+    print(f"{len(tasks)} files, {total} bytes in {elapsed:.3f}s ({rate:.2f} MB/s)")
+    return 0
+
+
+def _load_rsa_key(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def cmd_des(args: argparse.Namespace) -> int:
+    decrypt = args.action == "decrypt"
+    tasks = [(path, output_path(path, name, args.output_dir, DES_SUFFIX, decrypt), args.key, decrypt, args.engine)
+             for path, name in expand_inputs(args.inputs)]
+    return run_files(_des_file, tasks, args.jobs)
+
+
+def cmd_rsa_keygen(args: argparse.Namespace) -> int:
+    from cs7349_001c_1252_final.scripts.rsa_cipher import generate_rsa_keys
+    key = generate_rsa_keys(args.bits, args.e, args.primes)
+    p, q, e, n, d = key
+    fields = {"p": p, "q": q, "e": e, "n": n, "d": d}
+    if len(key.primes) > 2:
+        fields["primes"] = list(key.primes)
+    text = json.dumps(fields, indent=2)
+    if args.output:
+        # Private key material: owner-only, like keyring files
+        with os.fdopen(os.open(args.output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def cmd_rsa_crypt(args: argparse.Namespace) -> int:
+    key = _load_rsa_key(args.key)
+    decrypt = args.action == "decrypt"
+    tasks = [(path, output_path(path, name, args.output_dir, RSA_SUFFIX, decrypt), key, decrypt)
+             for path, name in expand_inputs(args.inputs)]
+    return run_files(_rsa_file, tasks, args.jobs)
+
+
+def cmd_rsa_crack(args: argparse.Namespace) -> int:
+    from cs7349_001c_1252_final.scripts.rsa_cipher import crack_private_key
+    key = _load_rsa_key(args.key)
+    result = crack_private_key(key["e"], key["n"])
+    if result.p is None:
+        print("Failed to factor n")
+        return 1
+    print(json.dumps({"p": result.p, "q": result.q, "e": key["e"], "n": key["n"], "d": result.d,
+                      "method": result.method, "seconds": round(result.elapsed, 4),
+                      "timings": {name: round(t, 4) for name, t in result.timings.items()}}))
+    return 0
+
+
+def cmd_rsa_scan(args: argparse.Namespace) -> int:
+    from cs7349_001c_1252_final.scripts.batch_gcd import load_moduli, scan_moduli
+    moduli: List[int] = []
+    for path, _ in expand_inputs(args.inputs):
+        with open(path) as f:
+            moduli += load_moduli(f)
+    result = scan_moduli(moduli, args.e, workers=args.jobs)
+    for key in result.compromised:
+        print(json.dumps({"index": key.index, "n": key.n, "p": key.p, "q": key.q, "d": key.d}))
+    for index in result.duplicates:
+        print(json.dumps({"index": index, "n": moduli[index], "duplicate": True}))
+    print(f"{result.moduli} moduli, {len(result.compromised)} compromised, {len(result.duplicates)} duplicated "
+          f"in {result.elapsed:.3f}s", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cs7349", description="DES and RSA file tools")
+    parser.add_argument("-v", "--verbose", action="store_true", help="enable colored debug logging")
+    parser.add_argument("--log-levels", metavar="SPEC",
+                        help="per-module levels, e.g. des_cipher=OFF,rsa_cipher=INFO (implies -v)")
+    commands = parser.add_subparsers(dest="cipher", required=True)
+
+    def add_file_options(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument("inputs", nargs="+", help="files, directories or glob patterns")
+        sub.add_argument("-o", "--output-dir", help="write outputs here instead of next to the inputs")
+        sub.add_argument("-j", "--jobs", type=int, default=1, help="number of files processed in parallel")
+
+    des = commands.add_parser("des", help="DES file encryption").add_subparsers(dest="action", required=True)
+    for action in ("encrypt", "decrypt"):
+        sub = des.add_parser(action)
+        sub.add_argument("-k", "--key", type=parse_des_key, required=True, help="8 characters or 16 hex digits")
+        sub.add_argument("--engine", default="bitslice", choices=("bits", "table", "bitslice", "numpy"))
+        add_file_options(sub)
+        sub.set_defaults(func=cmd_des)
+
+    rsa = commands.add_parser("rsa", help="RSA key generation, file encryption and attacks")
+    rsa_actions = rsa.add_subparsers(dest="action", required=True)
+    keygen = rsa_actions.add_parser("keygen")
+    keygen.add_argument("-o", "--output", help="write the key JSON here instead of stdout")
+    keygen.add_argument("-b", "--bits", type=int, default=2048, help="modulus size in bits")
+    keygen.add_argument("-e", type=int, default=65537, help="public exponent")
+    keygen.add_argument("--primes", type=int, default=2, help="number of prime factors (multi-prime RSA)")
+    keygen.set_defaults(func=cmd_rsa_keygen)
+    for action in ("encrypt", "decrypt"):
+        sub = rsa_actions.add_parser(action)
+        sub.add_argument("-k", "--key", required=True, help="key JSON written by rsa keygen")
+        add_file_options(sub)
+        sub.set_defaults(func=cmd_rsa_crypt)
+    crack = rsa_actions.add_parser("crack")
+    crack.add_argument("-k", "--key", required=True, help="key JSON; only e and n are used")
+    crack.set_defaults(func=cmd_rsa_crack)
+    scan = rsa_actions.add_parser("scan", help="batch-GCD scan of many moduli for shared primes")
+    scan.add_argument("inputs", nargs="+", help="files with one modulus per line (decimal or 0x hex)")
+    scan.add_argument("-e", type=int, default=65537, help="public exponent used to recover d")
+    scan.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+    scan.set_defaults(func=cmd_rsa_scan)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        if args.verbose or args.log_levels:
+            from cs7349_001c_1252_final.config.logging_config import parse_levels, setup_logging
+            setup_logging(levels=parse_levels(args.log_levels or ""))
+        return args.func(args)
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+# cs7349_001c_1252_final.scripts.batch_gcd.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.batch_gcd [MODULI_FILE ...]
+
+
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+from cs7349_001c_1252_final.scripts.number_theory import mod_large
+from cs7349_001c_1252_final.scripts.rsa_cipher import DEFAULT_EXPONENT, mod_inv
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# Moduli per worker task; the tree over chunk products is shared, each chunk's subtree stays in its worker
+DEFAULT_CHUNK_SIZE = 4096
+
+
+class CompromisedKey(NamedTuple):
+    index: int
+    n: int
+    p: int
+    q: int
+    d: Optional[int]
+
+
+class BatchGCDResult(NamedTuple):
+    compromised: List[CompromisedKey]
+    moduli: int
+    elapsed: float
+    # Indices whose modulus shares both primes with other keys (typically an exact duplicate) and
+    # could not be split; the keys are reused, but no factor is recovered
+    duplicates: List[int]
+
+
+def product_tree(values: Sequence[int]) -> List[List[int]]:
+    # tree[0] is the leaves, tree[-1] == [product of all values]
+    tree = [list(values)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([level[i] * level[i + 1] if i + 1 < len(level) else level[i] for i in range(0, len(level), 2)])
+    return tree
+
+
+def remainder_tree(tree: List[List[int]], root: int) -> List[int]:
+    # Pushes root down the tree, reducing modulo the square of each node; returns root mod leaf^2
+    remainders = [mod_large(root, tree[-1][0] ** 2)]
+    for level in reversed(tree[:-1]):
+        remainders = [mod_large(remainders[i // 2], value * value) for i, value in enumerate(level)]
+    return remainders
+
+
+def _chunk_product(chunk: List[int]) -> int:
+    return product_tree(chunk)[-1][0]
+
+
+def _chunk_gcds(task: Tuple[List[int], int]) -> List[int]:
+    # gcd(n, product of every other modulus) for each n in one chunk, given P mod (chunk product)^2
+    chunk, remainder = task
+    return [math.gcd(n, r // n) for n, r in zip(chunk, remainder_tree(product_tree(chunk), remainder))]
+
+
+def batch_gcd(moduli: Sequence[int], chunk_size: int = DEFAULT_CHUNK_SIZE, workers: Optional[int] = 1) -> List[int]:
+    # Bernstein's batch GCD: one product tree and one remainder tree over all moduli instead of k^2 gcds.
+    # The levels above the chunks are built once here; each worker owns the subtree of its chunk and
+    # receives only the chunk and its remainder, so no task ever sees the other chunks.
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    chunks = [list(moduli[i:i + chunk_size]) for i in range(0, len(moduli), chunk_size)]
+    if not chunks:
+        return []
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers <= 1 or len(chunks) <= 1:
+        chunk_products = [_chunk_product(chunk) for chunk in chunks]
+        top = product_tree(chunk_products)
+        tasks = zip(chunks, remainder_tree(top, top[-1][0]))
+        return [g for task in tasks for g in _chunk_gcds(task)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        chunk_products = list(pool.map(_chunk_product, chunks))
+        top = product_tree(chunk_products)
+        results = pool.map(_chunk_gcds, zip(chunks, remainder_tree(top, top[-1][0])))
+        return [g for chunk in results for g in chunk]
+
+
+def _split_full_gcds(moduli: Sequence[int], gcds: List[int]) -> List[int]:
+    # g == n means both primes are shared (or n is duplicated); pairwise gcds among those few recover a factor
+    flagged = [i for i, (n, g) in enumerate(zip(moduli, gcds)) if g == n]
+    others = [i for i, g in enumerate(gcds) if g != 1]
+    for i in flagged:
+        for j in others:
+            g = math.gcd(moduli[i], moduli[j])
+            if 1 < g < moduli[i]:
+                gcds[i] = g
+                break
+    return gcds
+
+
+def scan_moduli(moduli: Sequence[int], exponents: Union[int, Sequence[int]] = DEFAULT_EXPONENT,
+                chunk_size: int = DEFAULT_CHUNK_SIZE, workers: Optional[int] = 1) -> BatchGCDResult:
+    start = time.perf_counter()
+    gcds = _split_full_gcds(moduli, batch_gcd(moduli, chunk_size, workers))
+    compromised: List[CompromisedKey] = []
+    duplicates: List[int] = []
+    for i, (n, g) in enumerate(zip(moduli, gcds)):
+        if g == 1:
+            continue
+        if g == n:
+            duplicates.append(i)
+            continue
+        p, q = sorted((g, n // g))
+        e = exponents if isinstance(exponents, int) else exponents[i]
+        try:
+            d = mod_inv(e, (p - 1) * (q - 1))
+        except ValueError:
+            d = None
+        compromised.append(CompromisedKey(i, n, p, q, d))
+    elapsed = time.perf_counter() - start
+    logger.info(f"Scanned {len(moduli)} moduli in {elapsed:.2f}s, {len(compromised)} share a prime")
+    if duplicates:
+        logger.warning(f"{len(duplicates)} moduli share both primes with other keys and could not be split: "
+                       f"indices {duplicates}")
+    return BatchGCDResult(compromised, len(moduli), elapsed, duplicates)
+
+
+def load_moduli(lines: Iterable[str]) -> List[int]:
+    # One modulus per line, decimal or 0x-prefixed hex; blank lines and # comments are skipped
+    moduli = []
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+        if line:
+            moduli.append(int(line, 0))
+    return moduli
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"rsa_cipher": "INFO"})
+    if len(sys.argv) > 1:
+        moduli = []
+        for path in sys.argv[1:]:
+            with open(path) as f:
+                moduli += load_moduli(f)
+    else:
+        from cs7349_001c_1252_final.scripts.number_theory import random_prime
+        primes = [random_prime(256) for _ in range(2000)]
+        moduli = [primes[i] * primes[i + 1] for i in range(0, len(primes), 2)]
+        # Two weak keys that reuse a prime
+        moduli += [primes[0] * random_prime(256), primes[500] * random_prime(256)]
+    result = scan_moduli(moduli, workers=None)
+    for key in result.compromised:
+        logger.info(f"Key {key.index}: p={key.p:x}, q={key.q:x}")
@@ -0,0 +1,312 @@
+# cs7349_001c_1252_final.scripts.crypto_service.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.crypto_service
+
+
+import asyncio
+import itertools
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from cs7349_001c_1252_final.scripts.des_cipher import crypt_blocks, pad, unpad
+from cs7349_001c_1252_final.scripts import rsa_cipher
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# Wire format: every frame is a 4-byte big-endian length followed by the payload.
+# Request payload:  op (1 byte) | request id (4 bytes) | body
+# Response payload: status (1 byte) | request id (4 bytes) | result or UTF-8 error message
+# DES body: key (8 bytes) | data.  RSA body: value, exponent, modulus as 2-byte-length-prefixed big-endian ints.
+OP_DES_ENCRYPT = 1
+OP_DES_DECRYPT = 2
+OP_RSA_ENCRYPT = 3
+OP_RSA_DECRYPT = 4
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+HEADER = struct.Struct(">BI")
+LENGTH = struct.Struct(">I")
+MAX_FRAME = 64 << 20
+
+DEFAULT_BATCH_WINDOW = 0.002
+DEFAULT_MAX_BATCH = 256
+# Batches with at least this many DES blocks per key go through the bitslice engine
+BITSLICE_THRESHOLD = 64
+
+Request = Tuple[int, int, bytes]
+Response = Tuple[int, int, bytes]
+
+
+def encode_frame(payload: bytes) -> bytes:
+    return LENGTH.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[bytes]:
+    try:
+        header = await reader.readexactly(LENGTH.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = LENGTH.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"Frame of {length} bytes exceeds the {MAX_FRAME} byte limit.")
+    return await reader.readexactly(length)
+
+
+def encode_ints(*values: int) -> bytes:
+    out = bytearray()
+    for value in values:
+        raw = value.to_bytes(max(1, (value.bit_length() + 7) // 8), 'big')
+        out += struct.pack(">H", len(raw)) + raw
+    return bytes(out)
+
+
+def decode_ints(body: bytes, count: int) -> List[int]:
+    values: List[int] = []
+    offset = 0
+    for _ in range(count):
+        (size,) = struct.unpack_from(">H", body, offset)
+        values.append(int.from_bytes(body[offset + 2:offset + 2 + size], 'big'))
+        offset += 2 + size
+    return values
+
+
+def _des_group(op: int, key: bytes, bodies: List[bytes]) -> List[Tuple[int, bytes]]:
+    # One engine call for every request sharing a key and direction
+    encrypt = op == OP_DES_ENCRYPT
+    # Decrypt bodies have already been length-checked in process_batch
+    if encrypt:
+        bodies = [pad(body) for body in bodies]
+    data = b''.join(bodies)
+    engine = "bitslice" if len(data) // 8 >= BITSLICE_THRESHOLD else "table"
+    result = crypt_blocks(data, key, encrypt=encrypt, engine=engine)
+    out: List[Tuple[int, bytes]] = []
+    offset = 0
+    for body in bodies:
+        chunk = result[offset:offset + len(body)]
+        offset += len(body)
+        out.append((STATUS_OK, chunk if encrypt else unpad(chunk)))
+    return out
+
+
+def process_batch(requests: List[Request]) -> List[Response]:
+    # Runs in a worker process; groups DES work by key so it is batched through one engine call
+    results: Dict[int, Tuple[int, bytes]] = {}
+    groups: Dict[Tuple[int, bytes], List[Tuple[int, bytes]]] = {}
+    for op, request_id, body in requests:
+        try:
+            if op in (OP_DES_ENCRYPT, OP_DES_DECRYPT):
+                if len(body) < 8:
+                    raise ValueError("Key must be 8 bytes long.")
+                # Checked per request so one malformed body cannot fail the rest of its group
+                if op == OP_DES_DECRYPT and (len(body) == 8 or (len(body) - 8) % 8):
+                    raise ValueError("Ciphertext length must be a non-zero multiple of 8 bytes.")
+                groups.setdefault((op, body[:8]), []).append((request_id, body[8:]))
+            elif op == OP_RSA_ENCRYPT:
+                m, e, n = decode_ints(body, 3)
+                results[request_id] = (STATUS_OK, encode_ints(rsa_cipher.encrypt(m, e, n)))
+            elif op == OP_RSA_DECRYPT:
+                c, d, n = decode_ints(body, 3)
+                results[request_id] = (STATUS_OK, encode_ints(rsa_cipher.decrypt(c, d, n)))
+            else:
+                raise ValueError(f"Unknown operation {op}.")
+        except (ValueError, struct.error) as exc:
+            results[request_id] = (STATUS_ERROR, str(exc).encode('utf-8'))
+    for (op, key), items in groups.items():
+        try:
+            outcomes = _des_group(op, key, [body for _, body in items])
+        except ValueError as exc:
+            outcomes = [(STATUS_ERROR, str(exc).encode('utf-8'))] * len(items)
+        for (request_id, _), outcome in zip(items, outcomes):
+            results[request_id] = outcome
+    return [(status, request_id, payload) for request_id, (status, payload) in results.items()]
+
+
+class CryptoService:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None,
+                 workers: Optional[int] = None, batch_window: float = DEFAULT_BATCH_WINDOW,
+                 max_batch: int = DEFAULT_MAX_BATCH):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._dispatches: set = set()
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._ids = itertools.count()
+
+    async def start(self) -> None:
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+        if self.path:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+            logger.info(f"Listening on {self.path}")
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+            logger.info(f"Listening on {self.host}:{self.port}")
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Closing the transports ends each handler's read loop cleanly
+            for writer in list(self._connections.values()):
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def submit(self, op: int, body: bytes) -> Tuple[int, bytes]:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((op, next(self._ids) & 0xFFFFFFFF, body), future))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            # Coalesce whatever arrives within the window into one worker call
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Request, asyncio.Future]]) -> None:
+        futures = {request[1]: future for request, future in batch}
+        try:
+            responses = await asyncio.get_running_loop().run_in_executor(
+                self._pool, process_batch, [request for request, _ in batch])
+        except Exception as exc:
+            logger.error(f"Batch of {len(batch)} requests failed: {exc}")
+            for future in futures.values():
+                if not future.done():
+                    future.set_result((STATUS_ERROR, str(exc).encode('utf-8')))
+            return
+        for status, request_id, payload in responses:
+            futures[request_id].set_result((status, payload))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        current = asyncio.current_task()
+        self._connections[current] = writer
+        pending = set()
+
+        async def answer(request_id: int, op: int, body: bytes) -> None:
+            status, payload = await self.submit(op, body)
+            writer.write(encode_frame(HEADER.pack(status, request_id) + payload))
+
+        try:
+            while True:
+                frame = await read_frame(reader)
+                if frame is None:
+                    break
+                op, request_id = HEADER.unpack_from(frame)
+                task = asyncio.create_task(answer(request_id, op, frame[HEADER.size:]))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                await writer.drain()
+            if pending:
+                await asyncio.gather(*pending)
+        except (ValueError, struct.error, ConnectionError) as exc:
+            logger.warning(f"Dropping connection: {exc}")
+        finally:
+            del self._connections[current]
+            writer.close()
+
+
+class CryptoClient:
+    # Pipelined client: many requests may be in flight on one connection
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None) -> "CryptoClient":
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._receiver.cancel()
+        try:
+            await self._receiver
+        except asyncio.CancelledError:
+            pass
+
+    async def _receive(self) -> None:
+        while True:
+            frame = await read_frame(self._reader)
+            if frame is None:
+                break
+            status, request_id = HEADER.unpack_from(frame)
+            future = self._pending.pop(request_id, None)
+            if future is None:
+                continue
+            if status == STATUS_OK:
+                future.set_result(frame[HEADER.size:])
+            else:
+                future.set_exception(ValueError(frame[HEADER.size:].decode('utf-8')))
+        for future in self._pending.values():
+            future.set_exception(ConnectionError("Connection closed."))
+
+    async def request(self, op: int, body: bytes) -> bytes:
+        request_id = next(self._ids) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(encode_frame(HEADER.pack(op, request_id) + body))
+        await self._writer.drain()
+        return await future
+
+    async def des_encrypt(self, data: bytes, key: bytes) -> bytes:
+        return await self.request(OP_DES_ENCRYPT, key + data)
+
+    async def des_decrypt(self, data: bytes, key: bytes) -> bytes:
+        return await self.request(OP_DES_DECRYPT, key + data)
+
+    async def rsa_encrypt(self, m: int, e: int, n: int) -> int:
+        return decode_ints(await self.request(OP_RSA_ENCRYPT, encode_ints(m, e, n)), 1)[0]
+
+    async def rsa_decrypt(self, c: int, d: int, n: int) -> int:
+        return decode_ints(await self.request(OP_RSA_DECRYPT, encode_ints(c, d, n)), 1)[0]
+
+
+if __name__ == "__main__":
+    setup_logging(levels={"rsa_cipher": "INFO"})
+    asyncio.run(CryptoService(port=7349).serve_forever())
@@ -0,0 +1,160 @@
+# cs7349_001c_1252_final.scripts.des_bitslice.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.des_bitslice
+
+
+from typing import List, Optional, Sequence, Tuple
+from cs7349_001c_1252_final.config.des_constants import (
+    INITIAL_PERMUTATION, FINAL_PERMUTATION, EXPANSION_PERMUTATION, P_PERMUTATION, S_BOXES
+)
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# Blocks encrypted per pass; each bit-plane is an int of this many bits
+DEFAULT_BATCH_BLOCKS = 8192
+
+# (high minterm index, low minterm indices or None for "always", inverted)
+SboxTerm = Tuple[int, Optional[Tuple[int, ...]], bool]
+
+
+def _sbox_output_bit(sbox: List[List[int]], chunk: int, bit: int) -> int:
+    row = ((chunk >> 4) & 2) | (chunk & 1)
+    col = (chunk >> 1) & 15
+    return (sbox[row][col] >> (3 - bit)) & 1
+
+
+def build_sbox_circuits() -> List[List[List[SboxTerm]]]:
+    # Each output bit is a sum of products: minterm(b1,b2,b3) & OR(minterms(b4,b5,b6)).
+    # When more than half of the low minterms are set the complement is stored instead.
+    circuits: List[List[List[SboxTerm]]] = []
+    for sbox in S_BOXES:
+        outputs: List[List[SboxTerm]] = []
+        for bit in range(4):
+            terms: List[SboxTerm] = []
+            for high in range(8):
+                lows = tuple(low for low in range(8) if _sbox_output_bit(sbox, (high << 3) | low, bit))
+                if not lows:
+                    continue
+                if len(lows) == 8:
+                    terms.append((high, None, False))
+                elif len(lows) > 4:
+                    terms.append((high, tuple(low for low in range(8) if low not in lows), True))
+                else:
+                    terms.append((high, lows, False))
+            outputs.append(terms)
+        circuits.append(outputs)
+    return circuits
+
+
+SBOX_CIRCUITS = build_sbox_circuits()
+
+# Byte translation tables used to move between packed blocks and bit-planes.
+# TO_PLANE[b][i] maps a byte to (1 << i) when its bit b (MSB first) is set.
+# FROM_PLANE[i][b] maps a plane byte to (1 << (7 - b)) when its bit i is set.
+TO_PLANE = [[bytes((1 << i) if (v >> (7 - b)) & 1 else 0 for v in range(256)) for i in range(8)] for b in range(8)]
+FROM_PLANE = [[bytes((1 << (7 - b)) if (v >> i) & 1 else 0 for v in range(256)) for b in range(8)] for i in range(8)]
+
+
+def blocks_to_planes(data: bytes) -> List[int]:
+    # Block j lands in bit j of every plane; len(data) must be a multiple of 64
+    planes: List[int] = []
+    for p in range(8):
+        columns = [data[8 * i + p::64] for i in range(8)]
+        for b in range(8):
+            plane = 0
+            for i, column in enumerate(columns):
+                plane |= int.from_bytes(column.translate(TO_PLANE[b][i]), 'little')
+            planes.append(plane)
+    return planes
+
+
+def planes_to_blocks(planes: Sequence[int], n_blocks: int) -> bytes:
+    size = n_blocks // 8
+    plane_bytes = [plane.to_bytes(size, 'little') for plane in planes]
+    out = bytearray(8 * n_blocks)
+    for p in range(8):
+        for i in range(8):
+            column = 0
+            for b in range(8):
+                column |= int.from_bytes(plane_bytes[8 * p + b].translate(FROM_PLANE[i][b]), 'little')
+            out[8 * i + p::64] = column.to_bytes(size, 'little')
+    return bytes(out)
+
+
+def _minterms(x1: int, x2: int, x3: int, ones: int) -> List[int]:
+    n1, n2, n3 = x1 ^ ones, x2 ^ ones, x3 ^ ones
+    pairs = (n1 & n2, n1 & x2, x1 & n2, x1 & x2)
+    terms: List[int] = []
+    for pair in pairs:
+        terms.append(pair & n3)
+        terms.append(pair & x3)
+    return terms
+
+
+def sbox_planes(bits6: Sequence[int], circuit: List[List[SboxTerm]], ones: int) -> List[int]:
+    high = _minterms(bits6[0], bits6[1], bits6[2], ones)
+    low = _minterms(bits6[3], bits6[4], bits6[5], ones)
+    outputs: List[int] = []
+    for terms in circuit:
+        acc = 0
+        for h, lows, inverted in terms:
+            if lows is None:
+                acc |= high[h]
+                continue
+            inner = 0
+            for l in lows:
+                inner |= low[l]
+            acc |= high[h] & ~inner if inverted else high[h] & inner
+        outputs.append(acc)
+    return outputs
+
+
+def feistel_planes(right: List[int], subkey: List[int], ones: int) -> List[int]:
+    # subkey is a 48-entry bit list exactly as produced by generate_subkeys
+    xored = [right[e - 1] ^ ones if k else right[e - 1] for e, k in zip(EXPANSION_PERMUTATION, subkey)]
+    substituted: List[int] = []
+    for i, circuit in enumerate(SBOX_CIRCUITS):
+        substituted.extend(sbox_planes(xored[i * 6:(i + 1) * 6], circuit, ones))
+    return [substituted[p - 1] for p in P_PERMUTATION]
+
+
+def process_planes(planes: List[int], subkeys: List[List[int]], ones: int) -> List[int]:
+    permuted = [planes[i - 1] for i in INITIAL_PERMUTATION]
+    left, right = permuted[:32], permuted[32:]
+    for key in subkeys:
+        f_out = feistel_planes(right, key, ones)
+        left, right = right, [l ^ f for l, f in zip(left, f_out)]
+    combined = right + left  # swap halves
+    return [combined[i - 1] for i in FINAL_PERMUTATION]
+
+
+def bitslice_crypt(data: bytes, subkeys: List[List[int]], batch_blocks: int = DEFAULT_BATCH_BLOCKS) -> bytes:
+    if len(data) % 8:
+        raise ValueError("Data length must be a multiple of 8 bytes.")
+    if batch_blocks <= 0 or batch_blocks % 8:
+        raise ValueError("batch_blocks must be a positive multiple of 8.")
+    out: List[bytes] = []
+    step = 8 * batch_blocks
+    for start in range(0, len(data), step):
+        chunk = bytes(data[start:start + step])
+        n_blocks = len(chunk) // 8
+        padded_blocks = -(-n_blocks // 8) * 8
+        chunk += bytes(8 * (padded_blocks - n_blocks))
+        ones = (1 << padded_blocks) - 1
+        planes = process_planes(blocks_to_planes(chunk), subkeys, ones)
+        out.append(planes_to_blocks(planes, padded_blocks)[:8 * n_blocks])
+    return b''.join(out)
+
+
+if __name__ == "__main__":
+    setup_logging()
+    from cs7349_001c_1252_final.scripts.des_cipher import generate_subkeys
+    subkeys = generate_subkeys(bytes.fromhex("133457799BBCDFF1"))
+    blocks = bytes.fromhex("0123456789ABCDEF") * 64
+    cipher = bitslice_crypt(blocks, subkeys)
+    logger.info(f"Encrypted {len(blocks) // 8} blocks, first: {cipher[:8].hex()}")
+    plain = bitslice_crypt(cipher, subkeys[::-1])
+    logger.info(f"Decrypted first block: {plain[:8].hex()}")
@@ -3,17 +3,25 @@
 # Usage: python -m cs7349_001c_1252_final.scripts.des_cipher
 
 
-from typing import List
+from struct import pack_into, unpack_from
+from typing import List, Optional, Union
 from cs7349_001c_1252_final.config.des_constants import (
     INITIAL_PERMUTATION, FINAL_PERMUTATION, EXPANSION_PERMUTATION, P_PERMUTATION, PERMUTATION_CHOICE_1, PERMUTATION_CHOICE_2, S_BOXES, SHIFT_SCHEDULE
 )
-from cs7349_001c_1252_final.config.logging_config import setup_logging
+from cs7349_001c_1252_final.scripts.des_table import crypt_block_int, ecb_crypt_int
+from cs7349_001c_1252_final.scripts.des_key import DESKey, get_des_key
+from cs7349_001c_1252_final.scripts.des_bitslice import bitslice_crypt
+from cs7349_001c_1252_final.scripts.des_numpy import numpy_crypt
+from cs7349_001c_1252_final.scripts.des_trace import RoundTracer, LoggingTracer
 
 # Logger Configuration
 import logging
 from cs7349_001c_1252_final.config.logging_config import setup_logging
 logger = logging.getLogger(getattr(__spec__, "name", __name__))
 
+# Anything exposing the buffer protocol: bytes, bytearray, memoryview, mmap, ...
+Buffer = Union[bytes, bytearray, memoryview]
+
 
 def bytes_to_bit_array(data: bytes) -> List[int]:
     bits: List[int] = []
@@ -45,7 +53,7 @@ def xor(bits1: List[int], bits2: List[int]) -> List[int]:
     return [b1 ^ b2 for b1, b2 in zip(bits1, bits2)]
 
 
-def generate_subkeys(key_bytes: bytes) -> List[List[int]]:
+def generate_subkeys(key_bytes: bytes, trace: Optional[RoundTracer] = None) -> List[List[int]]:
     key_bits = bytes_to_bit_array(key_bytes)
     permuted = permute(key_bits, PERMUTATION_CHOICE_1)
     C, D = permuted[:28], permuted[28:]
@@ -55,7 +63,8 @@ def generate_subkeys(key_bytes: bytes) -> List[List[int]]:
         D = left_shift(D, shift)
         combined = C + D
         subkey = permute(combined, PERMUTATION_CHOICE_2)
-        logger.debug(f"Subkey {i+1:2d}: {bit_array_to_bytes(subkey).hex()}")
+        if trace is not None:
+            trace.on_subkey(i + 1, subkey)
         subkeys.append(subkey)
     return subkeys
 
@@ -72,35 +81,38 @@ def sbox_substitution(bits48: List[int]) -> List[int]:
     return output
 
 
-def feistel(right: List[int], subkey: List[int]) -> List[int]:
+def feistel(right: List[int], subkey: List[int], trace: Optional[RoundTracer] = None) -> List[int]:
     expanded = permute(right, EXPANSION_PERMUTATION)
-    logger.debug(f"Expanded R: {bit_array_to_bytes(expanded).hex()}")
     xored = xor(expanded, subkey)
-    logger.debug(f"After XOR:   {bit_array_to_bytes(xored).hex()}")
     substituted = sbox_substitution(xored)
-    logger.debug(f"After S-box: {bit_array_to_bytes(substituted).hex()}")
+    if trace is not None:
+        trace.on_feistel(expanded, xored, substituted)
     return permute(substituted, P_PERMUTATION)
 
 
-def process_block(block: bytes, subkeys: List[List[int]], encrypt: bool = True) -> bytes:
+def process_block(block: bytes, subkeys: List[List[int]], encrypt: bool = True,
+                  trace: Optional[RoundTracer] = None) -> bytes:
     bits = bytes_to_bit_array(block)
     permuted = permute(bits, INITIAL_PERMUTATION)
-    logger.debug(f"Initial Permutation applied: {bit_array_to_bytes(permuted).hex()}")
+    if trace is not None:
+        trace.on_initial_permutation(permuted)
 
     left, right = permuted[:32], permuted[32:]
-    keys = subkeys if encrypt else list(reversed(subkeys))
+    keys = subkeys if encrypt else subkeys[::-1]
 
     for i, key in enumerate(keys, start=1):
         temp = right.copy()
-        f_out = feistel(right, key)
+        f_out = feistel(right, key, trace)
         right = xor(left, f_out)
         left = temp
-        logger.debug(f"Round {i:2d} L={bit_array_to_bytes(left).hex()} R={bit_array_to_bytes(right).hex()}")
+        if trace is not None:
+            trace.on_round(i, left, right)
 
     combined = right + left  # swap halves
     final_bits = permute(combined, FINAL_PERMUTATION)
     output = bit_array_to_bytes(final_bits)
-    logger.debug(f"Final Permutation applied: {output.hex()}")
+    if trace is not None:
+        trace.on_final_permutation(output)
     return output
 
 
@@ -114,33 +126,127 @@ def unpad(data: bytes) -> bytes:
     return data[:-pad_len]
 
 
-def des_encrypt(plaintext: str, key: bytes) -> str:
-    if len(key) != 8:
+# "bits" is the reference bit-list pipeline, "table" the packed-integer SP-table engine,
+# "bitslice" evaluates many blocks at once as bit-planes, "numpy" vectorizes the
+# table engine across all blocks (and falls back to it without NumPy)
+ENGINES = ("bits", "table", "bitslice", "numpy")
+
+
+def crypt_blocks(data: bytes, key: Union[bytes, DESKey], encrypt: bool = True, engine: str = "bits",
+                 trace: Optional[RoundTracer] = None) -> bytes:
+    if trace is not None and engine != "bits":
+        raise ValueError("Tracing is only supported by the 'bits' engine.")
+    if engine == "bits":
+        # Cached schedule unless tracing, which needs the reference key schedule's subkey events
+        if trace is None:
+            subkeys = get_des_key(key).bit_schedule(encrypt)
+        else:
+            subkeys = generate_subkeys(key.key if isinstance(key, DESKey) else key, trace)
+            if not encrypt:
+                subkeys = subkeys[::-1]
+        return b''.join(process_block(data[i:i+8], subkeys, encrypt=True, trace=trace) for i in range(0, len(data), 8))
+    if engine == "table":
+        return ecb_crypt_int(data, get_des_key(key).schedule(encrypt))
+    if engine == "bitslice":
+        return bitslice_crypt(data, get_des_key(key).bit_schedule(encrypt))
+    if engine == "numpy":
+        return numpy_crypt(data, get_des_key(key).schedule(encrypt))
+    raise ValueError(f"Unknown DES engine '{engine}'; expected one of {ENGINES}.")
+
+
+def des_encrypt(plaintext: str, key: Union[bytes, DESKey], engine: str = "bits",
+                trace: Optional[RoundTracer] = None) -> str:
+    if not isinstance(key, DESKey) and len(key) != 8:
         raise ValueError("Key must be 8 bytes long.")
     data = pad(plaintext.encode('utf-8'))
-    subkeys = generate_subkeys(key)
-    encrypted = b''
-    for i in range(0, len(data), 8):
-        encrypted += process_block(data[i:i+8], subkeys, encrypt=True)
-    return encrypted.hex()
+    return crypt_blocks(data, key, encrypt=True, engine=engine, trace=trace).hex()
 
 
-def des_decrypt(ciphertext_hex: str, key: bytes) -> str:
-    if len(key) != 8:
+def des_decrypt(ciphertext_hex: str, key: Union[bytes, DESKey], engine: str = "bits",
+                trace: Optional[RoundTracer] = None) -> str:
+    if not isinstance(key, DESKey) and len(key) != 8:
         raise ValueError("Key must be 8 bytes long.")
     data = bytes.fromhex(ciphertext_hex)
-    subkeys = generate_subkeys(key)
-    decrypted = b''
-    for i in range(0, len(data), 8):
-        decrypted += process_block(data[i:i+8], subkeys, encrypt=False)
-    return unpad(decrypted).decode('utf-8')
+    return unpad(crypt_blocks(data, key, encrypt=False, engine=engine, trace=trace)).decode('utf-8')
+
+
+# Bytes handed to non-table engines per step by encrypt_into/decrypt_into
+INTO_CHUNK_SIZE = 1 << 16
+
+
+def _byte_view(data: Buffer) -> memoryview:
+    view = memoryview(data)
+    return view if view.format == 'B' and view.ndim == 1 else view.cast('B')
+
+
+def padded_length(n: int) -> int:
+    return n + 8 - n % 8
+
+
+def _crypt_into(src: memoryview, dst: memoryview, key: DESKey, encrypt: bool, engine: str) -> None:
+    if engine == "table":
+        # Read and write each block in place; no per-block bytes objects are created
+        subkeys = key.schedule(encrypt)
+        for offset in range(0, len(src), 8):
+            pack_into('>Q', dst, offset, crypt_block_int(unpack_from('>Q', src, offset)[0], subkeys))
+        return
+    for start in range(0, len(src), INTO_CHUNK_SIZE):
+        end = min(start + INTO_CHUNK_SIZE, len(src))
+        dst[start:end] = crypt_blocks(src[start:end], key, encrypt=encrypt, engine=engine)
+
+
+def encrypt_into(src: Buffer, dst: Buffer, key: Union[bytes, DESKey], engine: str = "table") -> int:
+    src_view, dst_view = _byte_view(src), _byte_view(dst)
+    if dst_view.readonly:
+        raise ValueError("Destination buffer must be writable.")
+    total = padded_length(len(src_view))
+    if len(dst_view) < total:
+        raise ValueError(f"Destination buffer must hold at least {total} bytes.")
+    des_key = get_des_key(key)
+    full = len(src_view) - len(src_view) % 8
+    tail = pad(bytes(src_view[full:]))
+    _crypt_into(src_view[:full], dst_view, des_key, True, engine)
+    dst_view[full:total] = crypt_blocks(tail, des_key, encrypt=True, engine=engine)
+    return total
+
+
+def decrypt_into(src: Buffer, dst: Buffer, key: Union[bytes, DESKey], engine: str = "table") -> int:
+    src_view, dst_view = _byte_view(src), _byte_view(dst)
+    if dst_view.readonly:
+        raise ValueError("Destination buffer must be writable.")
+    if len(src_view) == 0 or len(src_view) % 8:
+        raise ValueError("Ciphertext length must be a non-zero multiple of 8 bytes.")
+    des_key = get_des_key(key)
+    body = len(src_view) - 8
+    tail = unpad(crypt_blocks(bytes(src_view[body:]), des_key, encrypt=False, engine=engine))
+    if len(dst_view) < body + len(tail):
+        raise ValueError(f"Destination buffer must hold at least {body + len(tail)} bytes.")
+    _crypt_into(src_view[:body], dst_view, des_key, False, engine)
+    dst_view[body:body + len(tail)] = tail
+    return body + len(tail)
+
+
+def encrypt_bytes(data: Buffer, key: Union[bytes, DESKey], engine: str = "table") -> bytes:
+    view = _byte_view(data)
+    full = len(view) - len(view) % 8
+    des_key = get_des_key(key)
+    return (crypt_blocks(view[:full], des_key, encrypt=True, engine=engine)
+            + crypt_blocks(pad(bytes(view[full:])), des_key, encrypt=True, engine=engine))
+
+
+def decrypt_bytes(data: Buffer, key: Union[bytes, DESKey], engine: str = "table") -> bytes:
+    view = _byte_view(data)
+    if len(view) == 0 or len(view) % 8:
+        raise ValueError("Ciphertext length must be a non-zero multiple of 8 bytes.")
+    return unpad(crypt_blocks(view, get_des_key(key), encrypt=False, engine=engine))
 
 
 if __name__ == "__main__":
     setup_logging()
     key = b"secr3t_k"
     sample = "Hello, DES!"
-    cipher = des_encrypt(sample, key)
+    tracer = LoggingTracer()
+    cipher = des_encrypt(sample, key, trace=tracer)
     logger.info(f"Encrypted: {cipher}")
-    plain = des_decrypt(cipher, key)
+    plain = des_decrypt(cipher, key, trace=tracer)
     logger.info(f"Decrypted: {plain}")
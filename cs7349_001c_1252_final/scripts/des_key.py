@@ -0,0 +1,74 @@
+# cs7349_001c_1252_final.scripts.des_key.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.des_key
+
+
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+from cs7349_001c_1252_final.scripts.des_table import generate_subkeys_int
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# Number of distinct keys whose schedules are kept by get_des_key
+KEY_CACHE_SIZE = 1024
+
+
+class DESKey:
+    __slots__ = ("key", "encrypt_subkeys", "decrypt_subkeys", "_bit_subkeys")
+
+    def __init__(self, key: bytes):
+        if len(key) != 8:
+            raise ValueError("Key must be 8 bytes long.")
+        self.key = bytes(key)
+        self.encrypt_subkeys: Tuple[int, ...] = tuple(generate_subkeys_int(self.key))
+        self.decrypt_subkeys: Tuple[int, ...] = self.encrypt_subkeys[::-1]
+        self._bit_subkeys: Optional[List[List[int]]] = None
+
+    def schedule(self, encrypt: bool = True) -> Tuple[int, ...]:
+        return self.encrypt_subkeys if encrypt else self.decrypt_subkeys
+
+    def bit_schedule(self, encrypt: bool = True) -> List[List[int]]:
+        # Bit-list form used by the reference and bitslice engines, unpacked on first use
+        if self._bit_subkeys is None:
+            self._bit_subkeys = [[(k >> (47 - i)) & 1 for i in range(48)] for k in self.encrypt_subkeys]
+        return self._bit_subkeys if encrypt else self._bit_subkeys[::-1]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, DESKey) and other.key == self.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return "DESKey(<8 bytes>)"
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _cached_key(key: bytes) -> DESKey:
+    return DESKey(key)
+
+
+def get_des_key(key: Union[bytes, bytearray, memoryview, DESKey]) -> DESKey:
+    if isinstance(key, DESKey):
+        return key
+    return _cached_key(bytes(key))
+
+
+def key_cache_info():
+    # (hits, misses, maxsize, currsize) from functools.lru_cache
+    return _cached_key.cache_info()
+
+
+def clear_key_cache() -> None:
+    _cached_key.cache_clear()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    for _ in range(3):
+        get_des_key(b"secr3t_k")
+    get_des_key(b"8bytekey")
+    logger.info(f"Key cache: {key_cache_info()}")
@@ -0,0 +1,179 @@
+# cs7349_001c_1252_final.scripts.des_keysearch.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.des_keysearch
+
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+from cs7349_001c_1252_final.scripts.des_table import (
+    IP_TABLES, MASK_32, generate_subkeys_int, permute_int, rounds_int
+)
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# Least significant bit of every key byte; ignored by the key schedule
+PARITY_MASK = 0x0101010101010101
+# Candidates per task is 2**chunk_bits
+DEFAULT_CHUNK_BITS = 16
+CHECKPOINT_INTERVAL = 5.0
+
+# The key schedule only permutes key bits, so subkeys(k ^ (1 << pos)) = subkeys(k) ^ KEY_BIT_SCHEDULES[pos]
+KEY_BIT_SCHEDULES: List[Tuple[int, ...]] = [
+    tuple(generate_subkeys_int((1 << pos).to_bytes(8, 'big'))) for pos in range(64)
+]
+
+
+class KeySearchResult(NamedTuple):
+    matches: List[bytes]
+    candidates: int
+    elapsed: float
+    keys_per_second: float
+    completed: bool
+
+
+def mask_positions(mask: int) -> List[int]:
+    return [pos for pos in range(64) if (mask >> pos) & 1]
+
+
+def parity_variants(key: int, mask: int) -> List[int]:
+    # Every key that differs from key only in parity bits covered by mask
+    variants = [key]
+    for pos in mask_positions(mask & PARITY_MASK):
+        variants += [v ^ (1 << pos) for v in variants]
+    return sorted(variants)
+
+
+def _search_chunk(task: Tuple[int, int, List[int], List[int], int, int, Tuple[int, int]]) -> Tuple[int, List[int], int]:
+    index, base, prefix_positions, free_positions, left, right, target = task
+    key = base
+    for j, pos in enumerate(prefix_positions):
+        if (index >> j) & 1:
+            key |= 1 << pos
+    schedule = generate_subkeys_int(key.to_bytes(8, 'big'))
+    contributions = [KEY_BIT_SCHEDULES[pos] for pos in free_positions]
+    matches: List[int] = []
+    # Gray-code walk: each step flips one key bit and patches the 16 subkeys
+    for i in range(1 << len(free_positions)):
+        if i:
+            bit = (i & -i).bit_length() - 1
+            key ^= 1 << free_positions[bit]
+            schedule = [s ^ d for s, d in zip(schedule, contributions[bit])]
+        if rounds_int(left, right, schedule) == target:
+            matches.append(key)
+    return index, matches, 1 << len(free_positions)
+
+
+def _load_checkpoint(path: str, params: Dict[str, str]) -> Tuple[Set[int], Set[int], int]:
+    if not path or not os.path.exists(path):
+        return set(), set(), 0
+    with open(path) as f:
+        state = json.load(f)
+    if state["params"] != params:
+        raise ValueError(f"Checkpoint {path} belongs to a different search.")
+    logger.info(f"Resuming from {path}: {len(state['completed'])} tasks already done")
+    return set(state["completed"]), {int(k, 16) for k in state["matches"]}, state["candidates"]
+
+
+def _save_checkpoint(path: str, params: Dict[str, str], completed: Set[int], matches: Set[int], candidates: int) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"params": params, "completed": sorted(completed),
+                   "matches": [f"{k:016x}" for k in sorted(matches)], "candidates": candidates}, f)
+    os.replace(tmp, path)
+
+
+def search_keys(plaintext: bytes, ciphertext: bytes, base_key: bytes, mask: int,
+                workers: Optional[int] = None, chunk_bits: int = DEFAULT_CHUNK_BITS,
+                checkpoint: Optional[str] = None, should_stop: Optional[Callable[[], bool]] = None,
+                stop_on_first: bool = False) -> KeySearchResult:
+    if len(plaintext) != 8 or len(ciphertext) != 8 or len(base_key) != 8:
+        raise ValueError("Plaintext, ciphertext and base key must each be 8 bytes long.")
+
+    # Parity bits never change the result; search the rest and expand matches afterwards
+    search_mask = mask & ~PARITY_MASK & ((1 << 64) - 1)
+    positions = mask_positions(search_mask)
+    free_positions, prefix_positions = positions[:chunk_bits], positions[chunk_bits:]
+    base = int.from_bytes(base_key, 'big') & ~search_mask
+
+    permuted = permute_int(int.from_bytes(plaintext, 'big'), IP_TABLES)
+    # crypt_block_int outputs FP(R16 || L16), so compare the rounds against IP(ciphertext) swapped
+    target_ip = permute_int(int.from_bytes(ciphertext, 'big'), IP_TABLES)
+    target = (target_ip & MASK_32, target_ip >> 32)
+
+    params = {"plaintext": plaintext.hex(), "ciphertext": ciphertext.hex(),
+              "base_key": f"{base:016x}", "mask": f"{search_mask:016x}", "chunk_bits": str(chunk_bits)}
+    completed, found, candidates = _load_checkpoint(checkpoint, params)
+    resumed_from = candidates
+    pending = [i for i in range(1 << len(prefix_positions)) if i not in completed]
+    tasks = ((i, base, prefix_positions, free_positions, permuted >> 32, permuted & MASK_32, target) for i in pending)
+
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    start = time.perf_counter()
+    last_save = start
+
+    def record(result: Tuple[int, List[int], int]) -> bool:
+        nonlocal candidates, last_save
+        index, matches, count = result
+        completed.add(index)
+        found.update(matches)
+        candidates += count
+        if checkpoint and time.perf_counter() - last_save >= CHECKPOINT_INTERVAL:
+            _save_checkpoint(checkpoint, params, completed, found, candidates)
+            last_save = time.perf_counter()
+        return (stop_on_first and bool(found)) or (should_stop is not None and should_stop())
+
+    try:
+        if workers <= 1:
+            for task in tasks:
+                if record(_search_chunk(task)):
+                    break
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                in_flight = set()
+                stopped = False
+                for task in tasks:
+                    in_flight.add(pool.submit(_search_chunk, task))
+                    if len(in_flight) >= 2 * workers:
+                        finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        if any([record(f.result()) for f in finished]):
+                            stopped = True
+                            break
+                if stopped:
+                    for f in in_flight:
+                        f.cancel()
+                else:
+                    for f in in_flight:
+                        record(f.result())
+    finally:
+        if checkpoint:
+            _save_checkpoint(checkpoint, params, completed, found, candidates)
+
+    elapsed = time.perf_counter() - start
+    # A stop on the final chunk still leaves every prefix searched
+    done = len(completed) == 1 << len(prefix_positions)
+    matches = sorted({v for key in found for v in parity_variants(key, mask)})
+    # Only keys tested in this session count towards the rate; candidates includes resumed work
+    tested = candidates - resumed_from
+    rate = tested / elapsed if elapsed > 0 else 0.0
+    logger.info(f"Tested {tested} keys in {elapsed:.2f}s ({rate:,.0f} keys/sec), {candidates} in total, "
+                f"{len(matches)} matching keys")
+    return KeySearchResult([k.to_bytes(8, 'big') for k in matches], candidates, elapsed, rate, done)
+
+
+if __name__ == "__main__":
+    setup_logging()
+    from cs7349_001c_1252_final.scripts.des_table import process_block_int
+    key = b"secr3t_k"
+    plaintext = b"Hello, D"
+    ciphertext = process_block_int(plaintext, generate_subkeys_int(key))
+    # 16 unknown key bits (two of them parity bits) in the last two bytes
+    mask = 0xFFFF
+    guess = bytes(key[:6]) + b"\x00\x00"
+    result = search_keys(plaintext, ciphertext, guess, mask)
+    logger.info(f"Recovered keys: {[k for k in result.matches]}")
@@ -0,0 +1,123 @@
+# cs7349_001c_1252_final.scripts.des_modes.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.des_modes
+
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+from cs7349_001c_1252_final.scripts.des_cipher import crypt_blocks, pad, unpad
+from cs7349_001c_1252_final.scripts.des_key import DESKey, get_des_key
+from cs7349_001c_1252_final.scripts.des_table import crypt_block_int
+from cs7349_001c_1252_final.scripts.tdes_cipher import TDESKey, tdes_crypt_blocks
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+DEFAULT_ENGINE = "bitslice"
+# Bytes handed to each worker; large enough that process overhead is negligible
+DEFAULT_PARALLEL_CHUNK = 1 << 20
+MASK_64 = (1 << 64) - 1
+
+
+def xor_bytes(a: bytes, b: bytes) -> bytes:
+    return (int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')).to_bytes(len(a), 'big')
+
+
+def _check_iv(iv: bytes) -> None:
+    if len(iv) != 8:
+        raise ValueError("IV must be 8 bytes long.")
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    return workers if workers is not None else (os.cpu_count() or 1)
+
+
+def _split(data: bytes, chunk_size: int) -> List[Tuple[int, bytes]]:
+    if chunk_size < 8:
+        raise ValueError("chunk_size must be at least one 8-byte block.")
+    chunk_size -= chunk_size % 8
+    return [(start, data[start:start + chunk_size]) for start in range(0, len(data), chunk_size)]
+
+
+def cbc_encrypt(plaintext: bytes, key: Union[bytes, DESKey], iv: bytes) -> bytes:
+    # Each block depends on the previous ciphertext, so this is inherently sequential
+    _check_iv(iv)
+    subkeys = get_des_key(key).encrypt_subkeys
+    data = pad(bytes(plaintext))
+    prev = int.from_bytes(iv, 'big')
+    out: List[bytes] = []
+    for i in range(0, len(data), 8):
+        prev = crypt_block_int(int.from_bytes(data[i:i+8], 'big') ^ prev, subkeys)
+        out.append(prev.to_bytes(8, 'big'))
+    return b''.join(out)
+
+
+def _cbc_decrypt_chunk(args: Tuple[bytes, bytes, bytes, str]) -> bytes:
+    chunk, prev, key, engine = args
+    decrypted = crypt_blocks(chunk, key, encrypt=False, engine=engine)
+    return xor_bytes(decrypted, prev + chunk[:-8])
+
+
+def cbc_decrypt(ciphertext: bytes, key: Union[bytes, DESKey], iv: bytes, engine: str = DEFAULT_ENGINE,
+                workers: Optional[int] = 1, chunk_size: int = DEFAULT_PARALLEL_CHUNK) -> bytes:
+    _check_iv(iv)
+    if len(ciphertext) == 0 or len(ciphertext) % 8:
+        raise ValueError("Ciphertext length must be a non-zero multiple of 8 bytes.")
+    data = bytes(ciphertext)
+    key_bytes = get_des_key(key).key
+    tasks = [(chunk, data[start - 8:start] if start else iv, key_bytes, engine)
+             for start, chunk in _split(data, chunk_size)]
+    return unpad(b''.join(_run(_cbc_decrypt_chunk, tasks, workers)))
+
+
+def _counter_blocks(counter: int, n_blocks: int) -> bytes:
+    return b''.join(((counter + i) & MASK_64).to_bytes(8, 'big') for i in range(n_blocks))
+
+
+def ctr_chunk(args: Tuple[bytes, int, bytes, str]) -> bytes:
+    # 8-byte keys are DES; 16- and 24-byte keys are 3DES, which has only the one engine
+    chunk, counter, key, engine = args
+    counters = _counter_blocks(counter, -(-len(chunk) // 8))
+    if len(key) == 8:
+        keystream = crypt_blocks(counters, key, encrypt=True, engine=engine)
+    else:
+        keystream = tdes_crypt_blocks(counters, TDESKey(key), encrypt=True)
+    return xor_bytes(chunk, keystream[:len(chunk)])
+
+
+def ctr_crypt(data: bytes, key: Union[bytes, DESKey], iv: bytes, engine: str = DEFAULT_ENGINE,
+              workers: Optional[int] = 1, chunk_size: int = DEFAULT_PARALLEL_CHUNK) -> bytes:
+    # The IV is the initial 64-bit counter block; encryption and decryption are identical
+    _check_iv(iv)
+    counter = int.from_bytes(iv, 'big')
+    key_bytes = get_des_key(key).key
+    tasks = [(chunk, counter + start // 8, key_bytes, engine) for start, chunk in _split(bytes(data), chunk_size)]
+    return b''.join(_run(ctr_chunk, tasks, workers))
+
+
+ctr_encrypt = ctr_crypt
+ctr_decrypt = ctr_crypt
+
+
+def _run(fn, tasks: list, workers: Optional[int]) -> List[bytes]:
+    workers = _resolve_workers(workers)
+    if workers <= 1 or len(tasks) <= 1:
+        return [fn(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return list(pool.map(fn, tasks))
+
+
+if __name__ == "__main__":
+    setup_logging()
+    key = b"secr3t_k"
+    iv = bytes.fromhex("0001020304050607")
+    sample = b"Hello, DES! " * 4
+    cipher = cbc_encrypt(sample, key, iv)
+    logger.info(f"CBC encrypted: {cipher.hex()}")
+    logger.info(f"CBC decrypted: {cbc_decrypt(cipher, key, iv)}")
+    cipher = ctr_crypt(sample, key, iv)
+    logger.info(f"CTR encrypted: {cipher.hex()}")
+    logger.info(f"CTR decrypted: {ctr_crypt(cipher, key, iv)}")
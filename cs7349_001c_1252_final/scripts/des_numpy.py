@@ -0,0 +1,88 @@
+# cs7349_001c_1252_final.scripts.des_numpy.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.des_numpy
+
+
+from typing import List, Sequence
+from cs7349_001c_1252_final.scripts.des_table import (
+    IP_TABLES, FP_TABLES, E_TABLES, SP_TABLES, generate_subkeys_int, ecb_crypt_int
+)
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# NumPy is optional; without it numpy_crypt falls back to the pure-Python table engine
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+# Blocks per vectorized pass, bounds the temporary arrays to a few tens of MB
+DEFAULT_CHUNK_BLOCKS = 1 << 20
+
+if HAVE_NUMPY:
+    IP_ARRAY = np.array(IP_TABLES, dtype=np.uint64)
+    FP_ARRAY = np.array(FP_TABLES, dtype=np.uint64)
+    E_ARRAY = np.array(E_TABLES, dtype=np.uint64)
+    SP_ARRAY = np.array(SP_TABLES, dtype=np.uint64)
+
+
+def _permute_bytes(blocks: "np.ndarray", tables: "np.ndarray") -> "np.ndarray":
+    # blocks is an (N, 8) uint8 array, one row per 64-bit block
+    result = tables[0][blocks[:, 0]]
+    for j in range(1, 8):
+        result |= tables[j][blocks[:, j]]
+    return result
+
+
+def _crypt_chunk(blocks: "np.ndarray", subkeys: Sequence[int]) -> "np.ndarray":
+    permuted = _permute_bytes(blocks, IP_ARRAY)
+    left = permuted >> np.uint64(32)
+    right = permuted & np.uint64(0xFFFFFFFF)
+
+    byte_mask = np.uint64(0xFF)
+    chunk_mask = np.uint64(63)
+    e_shifts = [np.uint64(s) for s in (24, 16, 8, 0)]
+    sp_shifts = [np.uint64(s) for s in (42, 36, 30, 24, 18, 12, 6, 0)]
+
+    for key in subkeys:
+        x = E_ARRAY[0][right >> e_shifts[0]]
+        for j in range(1, 4):
+            x |= E_ARRAY[j][(right >> e_shifts[j]) & byte_mask]
+        x ^= np.uint64(key)
+        f_out = SP_ARRAY[0][x >> sp_shifts[0]]
+        for i in range(1, 8):
+            f_out |= SP_ARRAY[i][(x >> sp_shifts[i]) & chunk_mask]
+        left, right = right, left ^ f_out
+
+    combined = (right << np.uint64(32)) | left  # swap halves
+    as_bytes = combined.astype('>u8').view(np.uint8).reshape(-1, 8)
+    return _permute_bytes(as_bytes, FP_ARRAY).astype('>u8')
+
+
+def numpy_crypt(data: bytes, subkeys: Sequence[int], chunk_blocks: int = DEFAULT_CHUNK_BLOCKS) -> bytes:
+    if len(data) % 8:
+        raise ValueError("Data length must be a multiple of 8 bytes.")
+    if not HAVE_NUMPY:
+        logger.debug("NumPy not installed; using the table engine")
+        return ecb_crypt_int(data, subkeys)
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, 8)
+    out: List[bytes] = []
+    for start in range(0, len(blocks), chunk_blocks):
+        out.append(_crypt_chunk(blocks[start:start + chunk_blocks], subkeys).tobytes())
+    return b''.join(out)
+
+
+if __name__ == "__main__":
+    setup_logging()
+    subkeys = generate_subkeys_int(bytes.fromhex("133457799BBCDFF1"))
+    blocks = bytes.fromhex("0123456789ABCDEF") * 4
+    cipher = numpy_crypt(blocks, subkeys)
+    logger.info(f"NumPy available: {HAVE_NUMPY}")
+    logger.info(f"Encrypted first block: {cipher[:8].hex()}")
+    plain = numpy_crypt(cipher, subkeys[::-1])
+    logger.info(f"Decrypted first block: {plain[:8].hex()}")
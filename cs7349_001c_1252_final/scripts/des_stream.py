@@ -0,0 +1,140 @@
+# cs7349_001c_1252_final.scripts.des_stream.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.des_stream
+
+
+import mmap
+import os
+from typing import BinaryIO, Iterable, Union
+from cs7349_001c_1252_final.scripts.des_cipher import crypt_blocks, pad, unpad
+from cs7349_001c_1252_final.scripts.des_key import DESKey, get_des_key
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# 64 KiB of input per read, one full bitslice batch
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_ENGINE = "bitslice"
+
+
+class DESStreamEncryptor:
+    def __init__(self, key: Union[bytes, DESKey], engine: str = DEFAULT_ENGINE):
+        self._key = get_des_key(key)
+        self._engine = engine
+        self._buffer = bytearray()
+        self._finalized = False
+
+    def update(self, chunk: bytes) -> bytes:
+        if self._finalized:
+            raise ValueError("Encryptor already finalized.")
+        self._buffer += chunk
+        n = len(self._buffer) - len(self._buffer) % 8
+        if n == 0:
+            return b''
+        out = crypt_blocks(bytes(self._buffer[:n]), self._key, encrypt=True, engine=self._engine)
+        del self._buffer[:n]
+        return out
+
+    def finalize(self) -> bytes:
+        if self._finalized:
+            raise ValueError("Encryptor already finalized.")
+        self._finalized = True
+        # PKCS#5 padding is only ever applied to the final partial block
+        out = crypt_blocks(pad(bytes(self._buffer)), self._key, encrypt=True, engine=self._engine)
+        self._buffer.clear()
+        return out
+
+
+class DESStreamDecryptor:
+    def __init__(self, key: Union[bytes, DESKey], engine: str = DEFAULT_ENGINE):
+        self._key = get_des_key(key)
+        self._engine = engine
+        self._buffer = bytearray()
+        self._finalized = False
+
+    def update(self, chunk: bytes) -> bytes:
+        if self._finalized:
+            raise ValueError("Decryptor already finalized.")
+        self._buffer += chunk
+        # Hold back the last full block until finalize so its padding can be removed
+        n = len(self._buffer) - (len(self._buffer) % 8 or 8)
+        if n <= 0:
+            return b''
+        out = crypt_blocks(bytes(self._buffer[:n]), self._key, encrypt=False, engine=self._engine)
+        del self._buffer[:n]
+        return out
+
+    def finalize(self) -> bytes:
+        if self._finalized:
+            raise ValueError("Decryptor already finalized.")
+        self._finalized = True
+        if len(self._buffer) != 8:
+            raise ValueError("Ciphertext length must be a non-zero multiple of 8 bytes.")
+        out = unpad(crypt_blocks(bytes(self._buffer), self._key, encrypt=False, engine=self._engine))
+        self._buffer.clear()
+        return out
+
+
+def _pump(cipher: Union[DESStreamEncryptor, DESStreamDecryptor], chunks: Iterable[bytes], dst: BinaryIO) -> int:
+    written = 0
+    for chunk in chunks:
+        out = cipher.update(chunk)
+        dst.write(out)
+        written += len(out)
+    out = cipher.finalize()
+    dst.write(out)
+    return written + len(out)
+
+
+def _read_chunks(src: BinaryIO, chunk_size: int) -> Iterable[bytes]:
+    return iter(lambda: src.read(chunk_size), b'')
+
+
+def _mmap_chunks(mm: mmap.mmap, chunk_size: int) -> Iterable[bytes]:
+    for start in range(0, len(mm), chunk_size):
+        yield mm[start:start + chunk_size]
+
+
+def encrypt_stream(src: BinaryIO, dst: BinaryIO, key: Union[bytes, DESKey],
+                   engine: str = DEFAULT_ENGINE, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    return _pump(DESStreamEncryptor(key, engine), _read_chunks(src, chunk_size), dst)
+
+
+def decrypt_stream(src: BinaryIO, dst: BinaryIO, key: Union[bytes, DESKey],
+                   engine: str = DEFAULT_ENGINE, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    return _pump(DESStreamDecryptor(key, engine), _read_chunks(src, chunk_size), dst)
+
+
+def _crypt_file(src_path: str, dst_path: str, cipher: Union[DESStreamEncryptor, DESStreamDecryptor],
+                chunk_size: int) -> int:
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        if os.fstat(src.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            return _pump(cipher, (), dst)
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _pump(cipher, _mmap_chunks(mm, chunk_size), dst)
+
+
+def encrypt_file(src_path: str, dst_path: str, key: Union[bytes, DESKey],
+                 engine: str = DEFAULT_ENGINE, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    return _crypt_file(src_path, dst_path, DESStreamEncryptor(key, engine), chunk_size)
+
+
+def decrypt_file(src_path: str, dst_path: str, key: Union[bytes, DESKey],
+                 engine: str = DEFAULT_ENGINE, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    return _crypt_file(src_path, dst_path, DESStreamDecryptor(key, engine), chunk_size)
+
+
+if __name__ == "__main__":
+    setup_logging()
+    import io
+    key = b"secr3t_k"
+    plaintext = b"Hello, DES! " * 10000
+    encrypted = io.BytesIO()
+    written = encrypt_stream(io.BytesIO(plaintext), encrypted, key)
+    logger.info(f"Encrypted {len(plaintext)} bytes into {written} bytes")
+    decrypted = io.BytesIO()
+    decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, key)
+    logger.info(f"Round trip ok: {decrypted.getvalue() == plaintext}")
@@ -0,0 +1,122 @@
+# cs7349_001c_1252_final.scripts.des_table.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.des_table
+
+
+from typing import List, Sequence, Tuple
+from cs7349_001c_1252_final.config.des_constants import (
+    INITIAL_PERMUTATION, FINAL_PERMUTATION, EXPANSION_PERMUTATION, P_PERMUTATION, PERMUTATION_CHOICE_1, PERMUTATION_CHOICE_2, S_BOXES, SHIFT_SCHEDULE
+)
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# One 256-entry table per input byte (most significant byte first)
+PermutationTables = List[List[int]]
+
+MASK_28 = (1 << 28) - 1
+MASK_32 = (1 << 32) - 1
+
+
+def build_permutation_tables(table: Sequence[int], in_bits: int) -> PermutationTables:
+    out_bits = len(table)
+    tables: PermutationTables = []
+    for byte_index in range(in_bits // 8):
+        entries: List[int] = []
+        for value in range(256):
+            out = 0
+            for out_pos, in_pos in enumerate(table):
+                if (in_pos - 1) // 8 != byte_index:
+                    continue
+                if (value >> (7 - (in_pos - 1) % 8)) & 1:
+                    out |= 1 << (out_bits - 1 - out_pos)
+            entries.append(out)
+        tables.append(entries)
+    return tables
+
+
+def build_sp_tables() -> List[List[int]]:
+    # S-box i followed by the P permutation, indexed by the raw 6-bit chunk
+    p_tables = build_permutation_tables(P_PERMUTATION, 32)
+    sp: List[List[int]] = []
+    for i, sbox in enumerate(S_BOXES):
+        entries: List[int] = []
+        for chunk in range(64):
+            row = ((chunk >> 4) & 2) | (chunk & 1)
+            col = (chunk >> 1) & 15
+            entries.append(permute_int(sbox[row][col] << (28 - 4 * i), p_tables))
+        sp.append(entries)
+    return sp
+
+
+def permute_int(value: int, tables: PermutationTables) -> int:
+    result = 0
+    shift = 8 * (len(tables) - 1)
+    for entries in tables:
+        result |= entries[(value >> shift) & 0xFF]
+        shift -= 8
+    return result
+
+
+IP_TABLES = build_permutation_tables(INITIAL_PERMUTATION, 64)
+FP_TABLES = build_permutation_tables(FINAL_PERMUTATION, 64)
+E_TABLES = build_permutation_tables(EXPANSION_PERMUTATION, 32)
+PC1_TABLES = build_permutation_tables(PERMUTATION_CHOICE_1, 64)
+PC2_TABLES = build_permutation_tables(PERMUTATION_CHOICE_2, 56)
+SP_TABLES = build_sp_tables()
+
+
+def generate_subkeys_int(key_bytes: bytes) -> List[int]:
+    permuted = permute_int(int.from_bytes(key_bytes, 'big'), PC1_TABLES)
+    C, D = permuted >> 28, permuted & MASK_28
+    subkeys: List[int] = []
+    for shift in SHIFT_SCHEDULE:
+        C = ((C << shift) | (C >> (28 - shift))) & MASK_28
+        D = ((D << shift) | (D >> (28 - shift))) & MASK_28
+        subkeys.append(permute_int((C << 28) | D, PC2_TABLES))
+    return subkeys
+
+
+def rounds_int(left: int, right: int, subkeys: Sequence[int]) -> Tuple[int, int]:
+    e0, e1, e2, e3 = E_TABLES
+    sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = SP_TABLES
+    for key in subkeys:
+        x = (e0[right >> 24] | e1[(right >> 16) & 0xFF] | e2[(right >> 8) & 0xFF] | e3[right & 0xFF]) ^ key
+        left, right = right, left ^ (
+            sp0[x >> 42] | sp1[(x >> 36) & 63] | sp2[(x >> 30) & 63] | sp3[(x >> 24) & 63]
+            | sp4[(x >> 18) & 63] | sp5[(x >> 12) & 63] | sp6[(x >> 6) & 63] | sp7[x & 63])
+    return left, right
+
+
+def crypt_block_int(block: int, subkeys: Sequence[int]) -> int:
+    ip0, ip1, ip2, ip3, ip4, ip5, ip6, ip7 = IP_TABLES
+    permuted = (ip0[block >> 56] | ip1[(block >> 48) & 0xFF] | ip2[(block >> 40) & 0xFF] | ip3[(block >> 32) & 0xFF]
+                | ip4[(block >> 24) & 0xFF] | ip5[(block >> 16) & 0xFF] | ip6[(block >> 8) & 0xFF] | ip7[block & 0xFF])
+    left, right = rounds_int(permuted >> 32, permuted & MASK_32, subkeys)
+    return permute_int((right << 32) | left, FP_TABLES)  # swap halves
+
+
+def process_block_int(block: bytes, subkeys: Sequence[int], encrypt: bool = True) -> bytes:
+    keys = subkeys if encrypt else subkeys[::-1]
+    return crypt_block_int(int.from_bytes(block, 'big'), keys).to_bytes(8, 'big')
+
+
+def ecb_crypt_int(data: bytes, subkeys: Sequence[int]) -> bytes:
+    from_bytes = int.from_bytes
+    return b''.join(
+        crypt_block_int(from_bytes(data[i:i+8], 'big'), subkeys).to_bytes(8, 'big')
+        for i in range(0, len(data), 8)
+    )
+
+
+if __name__ == "__main__":
+    setup_logging()
+    key = bytes.fromhex("133457799BBCDFF1")
+    block = bytes.fromhex("0123456789ABCDEF")
+    subkeys = generate_subkeys_int(key)
+    cipher = process_block_int(block, subkeys, encrypt=True)
+    logger.info(f"Encrypted: {cipher.hex()}")
+    plain = process_block_int(cipher, subkeys, encrypt=False)
+    logger.info(f"Decrypted: {plain.hex()}")
@@ -0,0 +1,98 @@
+# cs7349_001c_1252_final.scripts.des_trace.py
+# Garrett Gruss 4/27/2025
+
+
+from typing import List, NamedTuple, Optional
+
+# Logger Configuration
+import logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# LoggingTracer writes under the cipher's logger so the demo output is unchanged
+DES_LOGGER_NAME = "cs7349_001c_1252_final.scripts.des_cipher"
+
+
+def bits_to_bytes(bits: List[int]) -> bytes:
+    return int(''.join(map(str, bits)), 2).to_bytes(len(bits) // 8, 'big')
+
+
+class RoundTracer:
+    # Hooks called by the reference pipeline when a tracer is passed; all are no-ops here
+
+    def on_subkey(self, index: int, subkey: List[int]) -> None:
+        pass
+
+    def on_initial_permutation(self, bits: List[int]) -> None:
+        pass
+
+    def on_feistel(self, expanded: List[int], xored: List[int], substituted: List[int]) -> None:
+        pass
+
+    def on_round(self, index: int, left: List[int], right: List[int]) -> None:
+        pass
+
+    def on_final_permutation(self, output: bytes) -> None:
+        pass
+
+
+class RoundRecord(NamedTuple):
+    index: int
+    expanded: bytes
+    xored: bytes
+    substituted: bytes
+    left: bytes
+    right: bytes
+
+
+class BlockRecord:
+    __slots__ = ("initial_permutation", "rounds", "final_permutation")
+
+    def __init__(self, initial_permutation: bytes):
+        self.initial_permutation = initial_permutation
+        self.rounds: List[RoundRecord] = []
+        self.final_permutation: Optional[bytes] = None
+
+
+class RecordingTracer(RoundTracer):
+    def __init__(self):
+        self.subkeys: List[bytes] = []
+        self.blocks: List[BlockRecord] = []
+        self._feistel = (b'', b'', b'')
+
+    def on_subkey(self, index: int, subkey: List[int]) -> None:
+        self.subkeys.append(bits_to_bytes(subkey))
+
+    def on_initial_permutation(self, bits: List[int]) -> None:
+        self.blocks.append(BlockRecord(bits_to_bytes(bits)))
+
+    def on_feistel(self, expanded: List[int], xored: List[int], substituted: List[int]) -> None:
+        self._feistel = (bits_to_bytes(expanded), bits_to_bytes(xored), bits_to_bytes(substituted))
+
+    def on_round(self, index: int, left: List[int], right: List[int]) -> None:
+        self.blocks[-1].rounds.append(RoundRecord(index, *self._feistel, bits_to_bytes(left), bits_to_bytes(right)))
+
+    def on_final_permutation(self, output: bytes) -> None:
+        self.blocks[-1].final_permutation = output
+
+
+class LoggingTracer(RoundTracer):
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.log = log or logging.getLogger(DES_LOGGER_NAME)
+        self.level = level
+
+    def on_subkey(self, index: int, subkey: List[int]) -> None:
+        self.log.log(self.level, f"Subkey {index:2d}: {bits_to_bytes(subkey).hex()}")
+
+    def on_initial_permutation(self, bits: List[int]) -> None:
+        self.log.log(self.level, f"Initial Permutation applied: {bits_to_bytes(bits).hex()}")
+
+    def on_feistel(self, expanded: List[int], xored: List[int], substituted: List[int]) -> None:
+        self.log.log(self.level, f"Expanded R: {bits_to_bytes(expanded).hex()}")
+        self.log.log(self.level, f"After XOR:   {bits_to_bytes(xored).hex()}")
+        self.log.log(self.level, f"After S-box: {bits_to_bytes(substituted).hex()}")
+
+    def on_round(self, index: int, left: List[int], right: List[int]) -> None:
+        self.log.log(self.level, f"Round {index:2d} L={bits_to_bytes(left).hex()} R={bits_to_bytes(right).hex()}")
+
+    def on_final_permutation(self, output: bytes) -> None:
+        self.log.log(self.level, f"Final Permutation applied: {output.hex()}")
@@ -0,0 +1,189 @@
+# cs7349_001c_1252_final.scripts.double_des.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.double_des
+
+
+import time
+from array import array
+from bisect import bisect_left
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+from cs7349_001c_1252_final.scripts.des_cipher import pad, unpad
+from cs7349_001c_1252_final.scripts.des_key import DESKey, get_des_key
+from cs7349_001c_1252_final.scripts.des_numpy import HAVE_NUMPY, np
+from cs7349_001c_1252_final.scripts.des_keysearch import KEY_BIT_SCHEDULES, PARITY_MASK, mask_positions, parity_variants
+from cs7349_001c_1252_final.scripts.des_table import (
+    IP_TABLES, FP_TABLES, MASK_32, crypt_block_int, generate_subkeys_int, permute_int, rounds_int
+)
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# Table entries pack the intermediate value's top bits with the candidate index
+INDEX_BITS = 32
+
+
+class MITMResult(NamedTuple):
+    key_pairs: List[Tuple[bytes, bytes]]
+    table_entries: int
+    table_bytes: int
+    bytes_per_entry: float
+    lookups: int
+    lookups_per_second: float
+    elapsed: float
+
+
+def double_des_crypt_blocks(data: bytes, key1: Union[bytes, DESKey], key2: Union[bytes, DESKey],
+                            encrypt: bool = True) -> bytes:
+    # E_k2(E_k1(m)); decryption runs D_k1(D_k2(c))
+    if len(data) % 8:
+        raise ValueError("Data length must be a multiple of 8 bytes.")
+    k1, k2 = get_des_key(key1), get_des_key(key2)
+    first, second = (k1.encrypt_subkeys, k2.encrypt_subkeys) if encrypt else (k2.decrypt_subkeys, k1.decrypt_subkeys)
+    from_bytes = int.from_bytes
+    return b''.join(
+        crypt_block_int(crypt_block_int(from_bytes(data[i:i+8], 'big'), first), second).to_bytes(8, 'big')
+        for i in range(0, len(data), 8)
+    )
+
+
+def double_des_encrypt(plaintext: bytes, key1: Union[bytes, DESKey], key2: Union[bytes, DESKey]) -> bytes:
+    return double_des_crypt_blocks(pad(plaintext), key1, key2, encrypt=True)
+
+
+def double_des_decrypt(ciphertext: bytes, key1: Union[bytes, DESKey], key2: Union[bytes, DESKey]) -> bytes:
+    return unpad(double_des_crypt_blocks(ciphertext, key1, key2, encrypt=False))
+
+
+def _candidate_keys(base_key: bytes, mask: int) -> Tuple[List[int], int]:
+    search_mask = mask & ~PARITY_MASK & ((1 << 64) - 1)
+    return mask_positions(search_mask), int.from_bytes(base_key, 'big') & ~search_mask
+
+
+def _walk_schedules(base: int, positions: List[int]) -> Iterator[Tuple[int, List[int]]]:
+    # Gray-code order over the free key bits, patching the schedule one bit at a time
+    key = base
+    schedule = generate_subkeys_int(key.to_bytes(8, 'big'))
+    contributions = [KEY_BIT_SCHEDULES[pos] for pos in positions]
+    yield key, schedule
+    for i in range(1, 1 << len(positions)):
+        bit = (i & -i).bit_length() - 1
+        key ^= 1 << positions[bit]
+        schedule = [s ^ d for s, d in zip(schedule, contributions[bit])]
+        yield key, schedule
+
+
+def sort_entries(entries: array) -> array:
+    if HAVE_NUMPY:
+        np.frombuffer(entries, dtype=np.uint64).sort()
+        return entries
+    # Bucket by the top bits, then sort each (small) bucket; peak memory is two arrays
+    bucket_bits = min(20, max(1, len(entries).bit_length() - 4))
+    shift = 64 - bucket_bits
+    counts = array('Q', bytes(8 << bucket_bits))
+    for value in entries:
+        counts[value >> shift] += 1
+    offsets = array('Q', bytes(8 * (len(counts) + 1)))
+    for b, count in enumerate(counts):
+        offsets[b + 1] = offsets[b] + count
+    cursor = array('Q', offsets[:-1])
+    out = array('Q', bytes(8 * len(entries)))
+    for value in entries:
+        b = value >> shift
+        out[cursor[b]] = value
+        cursor[b] += 1
+    for b in range(len(counts)):
+        lo, hi = offsets[b], offsets[b + 1]
+        if hi - lo > 1:
+            out[lo:hi] = array('Q', sorted(out[lo:hi]))
+    return out
+
+
+def build_forward_table(plaintext: bytes, base_key: bytes, mask: int) -> Tuple[array, List[int], int]:
+    # Sorted array('Q') of (middle value << INDEX_BITS | gray index); 8 bytes per entry, no Python objects
+    positions, base = _candidate_keys(base_key, mask)
+    if len(positions) > INDEX_BITS:
+        raise ValueError(f"At most {INDEX_BITS} unknown key bits are supported per key.")
+    permuted = permute_int(int.from_bytes(plaintext, 'big'), IP_TABLES)
+    left, right = permuted >> 32, permuted & MASK_32
+    table = array('Q', bytes(8 << len(positions)))
+    for index, (_, schedule) in enumerate(_walk_schedules(base, positions)):
+        l16, r16 = rounds_int(left, right, schedule)
+        middle = permute_int((r16 << 32) | l16, FP_TABLES)
+        table[index] = ((middle >> INDEX_BITS) << INDEX_BITS) | index
+    return sort_entries(table), positions, base
+
+
+def _gray_key(base: int, positions: List[int], index: int) -> int:
+    # The key visited at step index of _walk_schedules
+    gray = index ^ (index >> 1)
+    key = base
+    for j, pos in enumerate(positions):
+        if (gray >> j) & 1:
+            key ^= 1 << pos
+    return key
+
+
+def meet_in_the_middle(plaintext: bytes, ciphertext: bytes, base_key1: bytes, mask1: int,
+                       base_key2: bytes, mask2: int,
+                       check: Optional[Tuple[bytes, bytes]] = None) -> MITMResult:
+    if len(plaintext) != 8 or len(ciphertext) != 8:
+        raise ValueError("Plaintext and ciphertext must each be 8 bytes long.")
+    start = time.perf_counter()
+    table, positions1, base1 = build_forward_table(plaintext, base_key1, mask1)
+    built = time.perf_counter()
+    logger.info(f"Forward table: {len(table)} entries, {len(table) * table.itemsize / 1e6:.1f} MB "
+                f"({table.itemsize} bytes/entry) in {built - start:.2f}s")
+
+    positions2, base2 = _candidate_keys(base_key2, mask2)
+    permuted = permute_int(int.from_bytes(ciphertext, 'big'), IP_TABLES)
+    left, right = permuted >> 32, permuted & MASK_32
+    keep_mask = ((1 << 64) - 1) ^ ((1 << INDEX_BITS) - 1)
+    index_mask = (1 << INDEX_BITS) - 1
+    pairs = set()
+    lookups = 0
+    size = len(table)
+    for key2, schedule in _walk_schedules(base2, positions2):
+        # Decrypting with the reversed schedule gives the middle value D_k2(c)
+        l16, r16 = rounds_int(left, right, schedule[::-1])
+        middle = permute_int((r16 << 32) | l16, FP_TABLES)
+        lookups += 1
+        probe = middle & keep_mask
+        pos = bisect_left(table, probe)
+        while pos < size and table[pos] & keep_mask == probe:
+            key1 = _gray_key(base1, positions1, table[pos] & index_mask)
+            # The table only stores the top bits, so confirm the full middle value
+            if crypt_block_int(int.from_bytes(plaintext, 'big'), generate_subkeys_int(key1.to_bytes(8, 'big'))) == middle:
+                pairs.add((key1, key2))
+            pos += 1
+    elapsed = time.perf_counter() - start
+    search_time = elapsed - (built - start)
+    lookup_rate = lookups / search_time if search_time > 0 else 0.0
+
+    if check is not None:
+        # A second known pair weeds out the false positives expected for 2**(k1+k2) > 2**64
+        pairs = {(k1, k2) for k1, k2 in pairs
+                 if double_des_crypt_blocks(check[0], k1.to_bytes(8, 'big'), k2.to_bytes(8, 'big')) == check[1]}
+
+    key_pairs = sorted({(v1.to_bytes(8, 'big'), v2.to_bytes(8, 'big'))
+                        for k1, k2 in pairs
+                        for v1 in parity_variants(k1, mask1)
+                        for v2 in parity_variants(k2, mask2)})
+    table_bytes = len(table) * table.itemsize
+    logger.info(f"{lookups} backward lookups at {lookup_rate:,.0f} lookups/sec, {len(key_pairs)} key pairs")
+    return MITMResult(key_pairs, len(table), table_bytes, table_bytes / max(len(table), 1),
+                      lookups, lookup_rate, elapsed)
+
+
+if __name__ == "__main__":
+    setup_logging()
+    key1, key2 = b"secr3t_k", b"8bytekey"
+    plaintext = b"Hello, D"
+    ciphertext = double_des_crypt_blocks(plaintext, key1, key2)
+    # 12 unknown non-parity bits in each key
+    mask = 0xFEFE
+    guess1 = key1[:6] + b"\x00\x00"
+    guess2 = key2[:6] + b"\x00\x00"
+    result = meet_in_the_middle(plaintext, ciphertext, guess1, mask, guess2, mask)
+    logger.info(f"Recovered key pairs: {result.key_pairs[:4]}")
@@ -0,0 +1,249 @@
+# cs7349_001c_1252_final.scripts.envelope.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.envelope
+
+
+import hashlib
+import io
+import os
+import struct
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+from cs7349_001c_1252_final.scripts.des_modes import ctr_chunk
+from cs7349_001c_1252_final.scripts.rsa_cipher import RSAPrivateKey, encrypt
+from cs7349_001c_1252_final.scripts.utils import block_size
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# Layout: header (magic, version, cipher, recipient count, CTR initial counter block), then for each
+# recipient: key id (first 8 bytes of SHA-256 of n), wrapped key length, RSA-wrapped session key.
+# The payload follows, DES/3DES in CTR mode, the same length as the plaintext.
+MAGIC = b"CSEV"
+VERSION = 1
+HEADER = struct.Struct(">4sBBH8s")
+RECIPIENT = struct.Struct(">8sH")
+CIPHERS = {"des": (1, 8), "3des": (2, 24)}
+CIPHER_NAMES = {cipher_id: name for name, (cipher_id, _) in CIPHERS.items()}
+
+DEFAULT_CIPHER = "des"
+DEFAULT_ENGINE = "bitslice"
+DEFAULT_CHUNK_SIZE = 1 << 20
+# 0x00 0x02 + at least 8 non-zero random bytes + 0x00 (PKCS #1 v1.5 encryption padding)
+MIN_WRAP_PADDING = 11
+# A cached session key is retired after this many messages so one key never covers too much data
+DEFAULT_MAX_USES = 1024
+SESSION_CACHE_SIZE = 256
+
+PublicKey = Tuple[int, int]
+
+
+def key_id(n: int) -> bytes:
+    return hashlib.sha256(n.to_bytes((n.bit_length() + 7) // 8, 'big')).digest()[:8]
+
+
+def _wrap(session_key: bytes, e: int, n: int) -> bytes:
+    size = block_size(n)
+    if size < len(session_key) + MIN_WRAP_PADDING:
+        raise ValueError(f"RSA modulus too small to wrap a {len(session_key)}-byte session key.")
+    filler = bytearray()
+    while len(filler) < size - len(session_key) - 3:
+        filler += os.urandom(size).replace(b'\0', b'')
+    block = b'\0\x02' + bytes(filler[:size - len(session_key) - 3]) + b'\0' + session_key
+    return encrypt(int.from_bytes(block, 'big'), e, n).to_bytes((n.bit_length() + 7) // 8, 'big')
+
+
+def _unwrap(wrapped: bytes, key: RSAPrivateKey) -> bytes:
+    value = int.from_bytes(wrapped, 'big')
+    if value >= key.n:
+        raise ValueError("Wrapped session key is corrupt or not for this key.")
+    try:
+        block = key.decrypt(value).to_bytes(block_size(key.n), 'big')
+    except OverflowError:
+        # A tampered key decrypts to a value wider than the padded block
+        raise ValueError("Wrapped session key is corrupt or not for this key.") from None
+    separator = block.find(b'\0', 2)
+    if block[:2] != b'\0\x02' or separator < 10:
+        raise ValueError("Wrapped session key is corrupt or not for this key.")
+    return block[separator + 1:]
+
+
+class SessionKeyCache:
+    # Sealing side: recipient set -> (session key, wrapped keys, uses), so repeated messages to the same
+    # recipients skip every RSA operation. Opening side: wrapped key -> session key.
+    def __init__(self, max_entries: int = SESSION_CACHE_SIZE, max_uses: int = DEFAULT_MAX_USES):
+        self.max_entries = max_entries
+        self.max_uses = max_uses
+        self._sealing: "OrderedDict[tuple, List]" = OrderedDict()
+        self._opening: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self.hits = self.misses = 0
+
+    def _remember(self, table: OrderedDict, key, value) -> None:
+        table[key] = value
+        if len(table) > self.max_entries:
+            table.popitem(last=False)
+
+    def session(self, recipients: Sequence[PublicKey], cipher: str) -> Tuple[bytes, List[bytes]]:
+        cache_key = (cipher, tuple(recipients))
+        entry = self._sealing.get(cache_key)
+        if entry is not None and entry[2] < self.max_uses:
+            entry[2] += 1
+            self._sealing.move_to_end(cache_key)
+            self.hits += 1
+            return entry[0], entry[1]
+        self.misses += 1
+        session_key, wrapped = _new_session(recipients, cipher)
+        self._remember(self._sealing, cache_key, [session_key, wrapped, 1])
+        return session_key, wrapped
+
+    def unwrap(self, wrapped: bytes, key: RSAPrivateKey) -> bytes:
+        session_key = self._opening.get(wrapped)
+        if session_key is not None:
+            self._opening.move_to_end(wrapped)
+            self.hits += 1
+            return session_key
+        self.misses += 1
+        session_key = _unwrap(wrapped, key)
+        self._remember(self._opening, wrapped, session_key)
+        return session_key
+
+    def clear(self) -> None:
+        self._sealing.clear()
+        self._opening.clear()
+
+
+def _new_session(recipients: Sequence[PublicKey], cipher: str) -> Tuple[bytes, List[bytes]]:
+    session_key = os.urandom(CIPHERS[cipher][1])
+    return session_key, [_wrap(session_key, e, n) for e, n in recipients]
+
+
+def _ctr_stream(src: BinaryIO, dst: BinaryIO, session_key: bytes, counter: int, engine: str,
+                workers: Optional[int], chunk_size: int) -> int:
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    chunk_size = max(8, chunk_size - chunk_size % 8)
+    tasks = _chunk_tasks(src, session_key, counter, engine, chunk_size)
+    written = 0
+    if workers <= 1:
+        for task in tasks:
+            written += dst.write(ctr_chunk(task))
+        return written
+    # At most 2 * workers chunks in flight so memory stays bounded for any input size
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for task in tasks:
+            pending.append(pool.submit(ctr_chunk, task))
+            if len(pending) >= 2 * workers:
+                written += dst.write(pending.popleft().result())
+        while pending:
+            written += dst.write(pending.popleft().result())
+    return written
+
+
+def _chunk_tasks(src: BinaryIO, session_key: bytes, counter: int, engine: str,
+                 chunk_size: int) -> Iterator[Tuple[bytes, int, bytes, str]]:
+    # Short reads are regrouped so every task but the last starts on a block boundary
+    pending = b''
+    for chunk in iter(lambda: src.read(chunk_size), b''):
+        pending += chunk
+        n = len(pending) - len(pending) % 8
+        if n:
+            yield pending[:n], counter, session_key, engine
+            counter += n // 8
+            pending = pending[n:]
+    if pending:
+        yield pending, counter, session_key, engine
+
+
+def seal_stream(src: BinaryIO, dst: BinaryIO, recipients: Sequence[PublicKey], cipher: str = DEFAULT_CIPHER,
+                cache: Optional[SessionKeyCache] = None, engine: str = DEFAULT_ENGINE, workers: Optional[int] = 1,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    # recipients are (e, n) public keys; the payload is encrypted once whatever their number
+    if cipher not in CIPHERS:
+        raise ValueError(f"Unknown cipher {cipher!r}; expected one of {', '.join(CIPHERS)}.")
+    if not recipients:
+        raise ValueError("At least one recipient is required.")
+    recipients = [tuple(r) for r in recipients]
+    session_key, wrapped = cache.session(recipients, cipher) if cache is not None else _new_session(recipients, cipher)
+    iv = os.urandom(8)
+    header = bytearray(HEADER.pack(MAGIC, VERSION, CIPHERS[cipher][0], len(recipients), iv))
+    for (_, n), blob in zip(recipients, wrapped):
+        header += RECIPIENT.pack(key_id(n), len(blob)) + blob
+    dst.write(header)
+    return len(header) + _ctr_stream(src, dst, session_key, int.from_bytes(iv, 'big'), engine, workers, chunk_size)
+
+
+def read_header(src: BinaryIO) -> Tuple[str, bytes, Dict[bytes, bytes]]:
+    # Returns (cipher name, IV, {key id: wrapped session key}) and leaves src at the payload
+    raw = src.read(HEADER.size)
+    if len(raw) != HEADER.size:
+        raise ValueError("Truncated envelope header.")
+    magic, version, cipher_id, count, iv = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError("Not an envelope.")
+    if version != VERSION:
+        raise ValueError(f"Unsupported envelope version {version}.")
+    if cipher_id not in CIPHER_NAMES:
+        raise ValueError(f"Unknown cipher id {cipher_id}.")
+    wrapped: Dict[bytes, bytes] = {}
+    for _ in range(count):
+        raw = src.read(RECIPIENT.size)
+        if len(raw) != RECIPIENT.size:
+            raise ValueError("Truncated envelope header.")
+        kid, length = RECIPIENT.unpack(raw)
+        blob = src.read(length)
+        if len(blob) != length:
+            raise ValueError("Truncated envelope header.")
+        wrapped[kid] = blob
+    return CIPHER_NAMES[cipher_id], iv, wrapped
+
+
+def open_stream(src: BinaryIO, dst: BinaryIO, key: RSAPrivateKey, cache: Optional[SessionKeyCache] = None,
+                engine: str = DEFAULT_ENGINE, workers: Optional[int] = 1, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    cipher, iv, wrapped = read_header(src)
+    blob = wrapped.get(key_id(key.n))
+    if blob is None:
+        raise ValueError("Envelope is not addressed to this key.")
+    session_key = cache.unwrap(blob, key) if cache is not None else _unwrap(blob, key)
+    if len(session_key) != CIPHERS[cipher][1]:
+        raise ValueError("Wrapped session key is corrupt or not for this key.")
+    return _ctr_stream(src, dst, session_key, int.from_bytes(iv, 'big'), engine, workers, chunk_size)
+
+
+def seal_file(src_path: str, dst_path: str, recipients: Sequence[PublicKey], **kwargs) -> int:
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        return seal_stream(src, dst, recipients, **kwargs)
+
+
+def open_file(src_path: str, dst_path: str, key: RSAPrivateKey, **kwargs) -> int:
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        return open_stream(src, dst, key, **kwargs)
+
+
+def seal(data: bytes, recipients: Sequence[PublicKey], **kwargs) -> bytes:
+    out = io.BytesIO()
+    seal_stream(io.BytesIO(data), out, recipients, **kwargs)
+    return out.getvalue()
+
+
+def open_envelope(envelope: bytes, key: RSAPrivateKey, **kwargs) -> bytes:
+    out = io.BytesIO()
+    open_stream(io.BytesIO(envelope), out, key, **kwargs)
+    return out.getvalue()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    from cs7349_001c_1252_final.scripts.rsa_cipher import generate_rsa_keys
+    alice, bob = generate_rsa_keys(1024), generate_rsa_keys(1024)
+    cache = SessionKeyCache()
+    message = b"Hello, envelope! " * 1000
+    for cipher in CIPHERS:
+        sealed = seal(message, [alice.public_key(), bob.public_key()], cipher=cipher, cache=cache)
+        logger.info(f"{cipher}: {len(message)} bytes sealed into {len(sealed)} bytes for 2 recipients")
+        logger.info(f"alice ok: {open_envelope(sealed, alice, cache=cache) == message}, "
+                    f"bob ok: {open_envelope(sealed, bob) == message}")
+    seal(message, [alice.public_key(), bob.public_key()], cache=cache)
+    logger.info(f"Session cache: {cache.hits} hits, {cache.misses} misses")
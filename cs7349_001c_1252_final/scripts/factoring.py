@@ -0,0 +1,177 @@
+# cs7349_001c_1252_final.scripts.factoring.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.factoring
+
+
+import math
+import random
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from cs7349_001c_1252_final.scripts.number_theory import is_prime, iter_primes
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# Gaps between numbers coprime to 2*3*5, starting from 7
+WHEEL_PRIMES = (2, 3, 5)
+WHEEL_GAPS = (4, 2, 4, 2, 4, 6, 2, 6)
+
+TRIAL_LIMIT = 1 << 16
+FERMAT_STEPS = 1 << 16
+P_MINUS_1_BOUND = 100_000
+RHO_BATCH = 128
+RHO_MAX_ITERATIONS = 1 << 26
+
+# A method returns a non-trivial factor of n, or None when it gives up
+FactorMethod = Callable[[int], Optional[int]]
+
+
+class FactorResult(NamedTuple):
+    factor: Optional[int]
+    method: Optional[str]
+    timings: Dict[str, float]
+
+
+def trial_division(n: int, limit: Optional[int] = None) -> Optional[int]:
+    # Divides by 2, 3, 5 and then only by numbers coprime to 30, up to limit (default sqrt(n))
+    bound = math.isqrt(n) if limit is None else min(limit, math.isqrt(n))
+    for p in WHEEL_PRIMES:
+        if n % p == 0 and n != p:
+            return p
+    candidate = 7
+    while candidate <= bound:
+        for gap in WHEEL_GAPS:
+            if n % candidate == 0:
+                return candidate
+            candidate += gap
+            if candidate > bound:
+                break
+    return None
+
+
+def fermat(n: int, max_steps: int = FERMAT_STEPS) -> Optional[int]:
+    # Fast when the two factors are close: n = a^2 - b^2 = (a - b)(a + b)
+    if n % 2 == 0:
+        return 2 if n > 2 else None
+    a = math.isqrt(n)
+    if a * a < n:
+        a += 1
+    for _ in range(max_steps):
+        b2 = a * a - n
+        b = math.isqrt(b2)
+        if b * b == b2:
+            factor = a - b
+            return factor if 1 < factor < n else None
+        a += 1
+    return None
+
+
+def pollard_p_minus_1(n: int, bound: int = P_MINUS_1_BOUND) -> Optional[int]:
+    # Finds p when p - 1 is bound-smooth
+    a = 2
+    for i, p in enumerate(iter_primes(2, bound)):
+        power = p
+        while power * p <= bound:
+            power *= p
+        a = pow(a, power, n)
+        if i % 64 == 63:
+            g = math.gcd(a - 1, n)
+            if 1 < g < n:
+                return g
+            if g == n:
+                return None
+    g = math.gcd(a - 1, n)
+    return g if 1 < g < n else None
+
+
+def pollard_rho_brent(n: int, max_iterations: int = RHO_MAX_ITERATIONS, batch: int = RHO_BATCH,
+                      rng: Optional[random.Random] = None) -> Optional[int]:
+    # Brent's cycle detection; |x - y| products are accumulated so one gcd covers batch steps
+    if n % 2 == 0:
+        return 2 if n > 2 else None
+    rng = rng or random.Random()
+    for _ in range(8):
+        y, c = rng.randrange(1, n), rng.randrange(1, n)
+        g = r = q = 1
+        steps = 0
+        while g == 1 and steps < max_iterations:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            steps += r
+            r *= 2
+        if g == n:
+            # The batch overshot; replay it one gcd at a time
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = math.gcd(abs(x - saved), n)
+        if 1 < g < n:
+            return g
+        if steps >= max_iterations:
+            return None
+    return None
+
+
+def _trial(n: int) -> Optional[int]:
+    return trial_division(n, TRIAL_LIMIT)
+
+
+# Cheap, narrow methods first; rho is the general fallback
+DEFAULT_METHODS: List[Tuple[str, FactorMethod]] = [
+    ("trial_division", _trial),
+    ("fermat", fermat),
+    ("pollard_p_minus_1", pollard_p_minus_1),
+    ("pollard_rho_brent", pollard_rho_brent),
+]
+
+
+def find_factor(n: int, methods: Optional[Sequence[Tuple[str, FactorMethod]]] = None) -> FactorResult:
+    timings: Dict[str, float] = {}
+    if n < 4 or is_prime(n):
+        return FactorResult(None, None, timings)
+    for name, method in (methods if methods is not None else DEFAULT_METHODS):
+        start = time.perf_counter()
+        factor = method(n)
+        timings[name] = time.perf_counter() - start
+        logger.debug(f"{name}: {'found ' + str(factor) if factor else 'no factor'} in {timings[name]:.4f}s")
+        if factor:
+            return FactorResult(factor, name, timings)
+    return FactorResult(None, None, timings)
+
+
+def factorize(n: int, methods: Optional[Sequence[Tuple[str, FactorMethod]]] = None) -> List[int]:
+    # Full prime factorization, sorted
+    if n < 2:
+        return []
+    pending, primes = [n], []
+    while pending:
+        m = pending.pop()
+        if is_prime(m):
+            primes.append(m)
+            continue
+        factor = find_factor(m, methods).factor
+        if factor is None:
+            raise ValueError(f"Could not factor {m}.")
+        pending += [factor, m // factor]
+    return sorted(primes)
+
+
+if __name__ == "__main__":
+    setup_logging()
+    from cs7349_001c_1252_final.scripts.number_theory import random_prime
+    for bits in (40, 60, 80):
+        n = random_prime(bits // 2) * random_prime(bits // 2)
+        result = find_factor(n)
+        logger.info(f"{bits}-bit n={n}: {result.factor} by {result.method}, "
+                    f"timings {', '.join(f'{k}={v:.3f}s' for k, v in result.timings.items())}")
@@ -0,0 +1,193 @@
+# cs7349_001c_1252_final.scripts.keyring.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.keyring
+
+
+import mmap
+import os
+import struct
+from typing import Iterator, List, Mapping, Tuple, Union
+from cs7349_001c_1252_final.scripts.des_key import DESKey
+from cs7349_001c_1252_final.scripts.rsa_cipher import RSAPrivateKey
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# File layout:
+#   header  magic (4s) | version (H) | reserved (H) | entry count (I)
+#   index   count fixed-size entries sorted by key id: id (16s, NUL padded) | kind (B) | offset (Q) | length (I)
+#   records DES: the 8 key bytes.  RSA: int count (H), then each int as length (H) + big-endian bytes,
+#           in the order e, p, q, d, dp, dq, q_inv, then r, d_r, t_r for every extra prime
+MAGIC = b"CSKR"
+VERSION = 1
+HEADER = struct.Struct(">4sHHI")
+INDEX_ENTRY = struct.Struct(">16sBxxxQI")
+KEY_ID_SIZE = 16
+KIND_DES = 1
+KIND_RSA = 2
+
+StoredKey = Union[RSAPrivateKey, DESKey]
+
+
+def _encode_id(key_id: Union[str, bytes]) -> bytes:
+    raw = key_id.encode('utf-8') if isinstance(key_id, str) else bytes(key_id)
+    if not raw or len(raw) > KEY_ID_SIZE or b'\0' in raw:
+        raise ValueError(f"Key id must be 1-{KEY_ID_SIZE} bytes without NUL characters.")
+    return raw.ljust(KEY_ID_SIZE, b'\0')
+
+
+def _encode_rsa(key: RSAPrivateKey) -> bytes:
+    values = [key.e, key.p, key.q, key.d, key.dp, key.dq, key.q_inv] + [v for triple in key.extra for v in triple]
+    out = bytearray(struct.pack(">H", len(values)))
+    for value in values:
+        raw = value.to_bytes(max(1, (value.bit_length() + 7) // 8), 'big')
+        out += struct.pack(">H", len(raw)) + raw
+    return bytes(out)
+
+
+def _decode_rsa(record: memoryview) -> RSAPrivateKey:
+    if len(record) < 2:
+        raise ValueError("Keyring record is truncated or corrupt.")
+    (count,) = struct.unpack_from(">H", record)
+    if count < 7 or (count - 7) % 3:
+        raise ValueError("Keyring record is truncated or corrupt.")
+    offset = 2
+    values: List[int] = []
+    for _ in range(count):
+        if offset + 2 > len(record):
+            raise ValueError("Keyring record is truncated or corrupt.")
+        (size,) = struct.unpack_from(">H", record, offset)
+        if offset + 2 + size > len(record):
+            raise ValueError("Keyring record is truncated or corrupt.")
+        values.append(int.from_bytes(record[offset + 2:offset + 2 + size], 'big'))
+        offset += 2 + size
+    e, p, q, d, dp, dq, q_inv = values[:7]
+    extra = [tuple(values[i:i + 3]) for i in range(7, len(values), 3)]
+    return RSAPrivateKey.from_components(p, q, e, d, dp, dq, q_inv, extra)
+
+
+def write_keyring(path: str, keys: Mapping[Union[str, bytes], Union[StoredKey, bytes]]) -> None:
+    entries: List[Tuple[bytes, int, bytes]] = []
+    for key_id, key in keys.items():
+        if isinstance(key, RSAPrivateKey):
+            entries.append((_encode_id(key_id), KIND_RSA, _encode_rsa(key)))
+        elif isinstance(key, DESKey):
+            entries.append((_encode_id(key_id), KIND_DES, key.key))
+        elif isinstance(key, (bytes, bytearray)) and len(key) == 8:
+            entries.append((_encode_id(key_id), KIND_DES, bytes(key)))
+        else:
+            raise ValueError(f"Unsupported key type for {key_id!r}.")
+    entries.sort()
+    if any(a[0] == b[0] for a, b in zip(entries, entries[1:])):
+        raise ValueError("Duplicate key id.")
+    offset = HEADER.size + INDEX_ENTRY.size * len(entries)
+    tmp = path + ".tmp"
+    # Private keys: the file is owner-only from the moment it exists, not after the replace
+    with os.fdopen(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(entries)))
+        for raw_id, kind, record in entries:
+            f.write(INDEX_ENTRY.pack(raw_id, kind, offset, len(record)))
+            offset += len(record)
+        for _, _, record in entries:
+            f.write(record)
+    os.replace(tmp, path)
+
+
+class Keyring:
+    # Read-only view over a keyring file; a lookup binary-searches the index and decodes one record
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty, not a keyring.") from None
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a keyring.")
+        magic, version, _, self._count = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a keyring.")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported keyring version {version}.")
+        if HEADER.size + self._count * INDEX_ENTRY.size > len(self._map):
+            self.close()
+            raise ValueError(f"{path} is truncated or corrupt: index of {self._count} entries exceeds the file.")
+
+    def _entry(self, i: int) -> Tuple[bytes, int, int, int]:
+        return INDEX_ENTRY.unpack_from(self._map, HEADER.size + i * INDEX_ENTRY.size)
+
+    def _find(self, key_id: Union[str, bytes]) -> Tuple[bytes, int, int, int]:
+        target = _encode_id(key_id)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid)[0] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count:
+            entry = self._entry(lo)
+            if entry[0] == target:
+                return entry
+        raise KeyError(key_id)
+
+    def get(self, key_id: Union[str, bytes]) -> StoredKey:
+        _, kind, offset, length = self._find(key_id)
+        if offset + length > len(self._map) or (kind == KIND_DES and length != 8):
+            raise ValueError(f"Keyring record {key_id!r} is truncated or corrupt.")
+        record = memoryview(self._map)[offset:offset + length]
+        try:
+            if kind == KIND_DES:
+                return DESKey(bytes(record))
+            if kind == KIND_RSA:
+                return _decode_rsa(record)
+        except ValueError as exc:
+            raise ValueError(f"Keyring record {key_id!r} is truncated or corrupt.") from exc
+        finally:
+            record.release()
+        raise ValueError(f"Unknown key kind {kind}.")
+
+    __getitem__ = get
+
+    def __contains__(self, key_id: Union[str, bytes]) -> bool:
+        # An id that could never be stored (too long, empty, NUL) is simply absent
+        try:
+            self._find(key_id)
+            return True
+        except (KeyError, ValueError):
+            return False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def ids(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._entry(i)[0].rstrip(b'\0').decode('utf-8')
+
+    def close(self) -> None:
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "Keyring":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    from cs7349_001c_1252_final.scripts.rsa_cipher import generate_rsa_keys
+    path = "keyring.bin"
+    write_keyring(path, {"rsa-demo": generate_rsa_keys(1024), "des-demo": b"secr3t_k"})
+    with Keyring(path) as ring:
+        logger.info(f"{len(ring)} keys: {list(ring.ids())}")
+        logger.info(f"rsa-demo -> {ring['rsa-demo']!r}, des-demo -> {ring['des-demo']!r}")
+    os.remove(path)
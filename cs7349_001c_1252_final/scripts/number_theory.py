@@ -0,0 +1,219 @@
+# cs7349_001c_1252_final.scripts.number_theory.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.number_theory
+
+
+import math
+import random
+from itertools import compress
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+# Odd numbers covered by one sieve segment (one byte each)
+DEFAULT_SEGMENT_SIZE = 1 << 20
+SMALL_PRIME_LIMIT = 1000
+# Random prime search: small primes used to sieve each candidate window, and odd candidates per window
+SIEVE_PRIME_LIMIT = 1 << 14
+PRIME_WINDOW = 1 << 12
+
+# Miller-Rabin with these bases is exact for every n < 3.18 * 10**23, which covers all 64-bit inputs
+DETERMINISTIC_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+DETERMINISTIC_LIMIT = 318665857834031151167461
+
+# Below this many bits the built-in (schoolbook) division is faster than divide and conquer
+DIV_LIMIT = 4000
+
+# Random-base rounds by bit length (smallest bit length, rounds), as used for random candidates by OpenSSL
+ROUNDS_BY_BITS = ((3747, 3), (1345, 4), (476, 5), (400, 6), (347, 7), (308, 8), (55, 27), (0, 34))
+
+
+def simple_sieve(limit: int) -> List[int]:
+    # All primes <= limit
+    if limit < 2:
+        return []
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return [n for n, flag in enumerate(sieve) if flag]
+
+
+SMALL_PRIMES = simple_sieve(SMALL_PRIME_LIMIT)
+SMALL_PRIMES_SET = frozenset(SMALL_PRIMES)
+SMALL_PRIMES_PRODUCT = math.prod(SMALL_PRIMES)
+# (prime, inverse of 2 mod prime) for every odd sieve prime
+SIEVE_TABLE = [(s, (s + 1) // 2) for s in simple_sieve(SIEVE_PRIME_LIMIT)[1:]]
+
+
+def miller_rabin(n: int, bases: Sequence[int]) -> bool:
+    # n must be odd and > 3; True means n is a strong probable prime to every base
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for a in bases:
+        a %= n
+        if a < 2:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def rounds_for_bits(bits: int) -> int:
+    for min_bits, rounds in ROUNDS_BY_BITS:
+        if bits >= min_bits:
+            return rounds
+    return ROUNDS_BY_BITS[-1][1]
+
+
+def is_prime(n: int, rounds: Optional[int] = None, rng: Optional[random.Random] = None) -> bool:
+    if n < 2:
+        return False
+    if n <= SMALL_PRIME_LIMIT:
+        return n in SMALL_PRIMES_SET
+    # One gcd against the primorial replaces trial division by every small prime
+    if math.gcd(n, SMALL_PRIMES_PRODUCT) != 1:
+        return False
+    if n < SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT:
+        return True
+    if n < DETERMINISTIC_LIMIT:
+        return miller_rabin(n, DETERMINISTIC_BASES)
+    if rounds is None:
+        rounds = rounds_for_bits(n.bit_length())
+    rng = rng or random
+    # Base 2 first: it rejects almost every composite for the price of one modexp
+    return miller_rabin(n, [2] + [rng.randrange(3, n - 1) for _ in range(rounds)])
+
+
+def iter_primes(start: int, end: int, segment_size: int = DEFAULT_SEGMENT_SIZE) -> Iterator[int]:
+    # Segmented odd-only sieve over [start, end]; memory is one segment plus the primes <= sqrt(end)
+    if segment_size <= 0:
+        raise ValueError("segment_size must be positive.")
+    if end < 2 or end < start:
+        return
+    if start <= 2:
+        yield 2
+    base_primes = simple_sieve(math.isqrt(end))[1:]
+    low = max(3, start) | 1
+    span = 2 * segment_size
+    while low <= end:
+        high = min(low + span, end + 1)  # segment covers the odd numbers in [low, high)
+        count = (high - low + 1) // 2
+        segment = bytearray([1]) * count
+        for p in base_primes:
+            if p * p >= high:
+                break
+            # First odd multiple of p in the segment, never p itself
+            first = max(p * p, -(-low // p) * p)
+            if not first & 1:
+                first += p
+            index = (first - low) // 2
+            if index < count:
+                segment[index::p] = bytes(len(range(index, count, p)))
+        yield from compress(range(low, high, 2), segment)
+        low += span
+
+
+def next_prime(n: int) -> int:
+    # Smallest prime > n
+    if n < 2:
+        return 2
+    candidate = (n + 1) | 1
+    while not is_prime(candidate):
+        candidate += 2
+    return candidate
+
+
+def random_prime(bits: int, rng: Optional[random.Random] = None, coprime_to: Optional[int] = None) -> int:
+    # Random prime with exactly bits bits and the top two bits set, so a product of two has 2 * bits bits.
+    # With coprime_to=e, primes where e divides p - 1 are skipped.
+    if bits < 3:
+        raise ValueError("bits must be at least 3.")
+    rng = rng or random.SystemRandom()
+    top = 3 << (bits - 2)
+    lowest = top | 1
+    # Never sieve with a prime that could itself be a candidate
+    table = SIEVE_TABLE if lowest > SIEVE_PRIME_LIMIT else [(s, half) for s, half in SIEVE_TABLE if s < lowest]
+    while True:
+        base = rng.getrandbits(bits) | top | 1
+        count = min(PRIME_WINDOW, ((1 << bits) - base + 1) // 2)
+        window = bytearray([1]) * count
+        # base + 2k is divisible by s exactly when k = -base / 2 (mod s)
+        for s, half in table:
+            k = (-(base % s) * half) % s
+            if k < count:
+                window[k::s] = bytes(len(range(k, count, s)))
+        for k in compress(range(count), window):
+            candidate = base + 2 * k
+            if coprime_to is not None and math.gcd(candidate - 1, coprime_to) != 1:
+                continue
+            if is_prime(candidate, rng=rng):
+                return candidate
+
+
+def _div2n1n(a: int, b: int, n: int) -> Tuple[int, int]:
+    # divmod(a, b) for a < 2**n * b and b of n bits, by recursive halving (Burnikel-Ziegler)
+    if a.bit_length() - n <= DIV_LIMIT:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a <<= 1
+        b <<= 1
+        n += 1
+    half = n >> 1
+    mask = (1 << half) - 1
+    b1, b2 = b >> half, b & mask
+    q1, r = _div3n2n(a >> n, (a >> half) & mask, b, b1, b2, half)
+    q2, r = _div3n2n(r, a & mask, b, b1, b2, half)
+    if pad:
+        r >>= 1
+    return q1 << half | q2, r
+
+
+def _div3n2n(a12: int, a3: int, b: int, b1: int, b2: int, n: int) -> Tuple[int, int]:
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _div2n1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+
+def mod_large(a: int, b: int) -> int:
+    # a % b for non-negative a and positive b. CPython's own division is quadratic in the
+    # operand size; this costs a few Karatsuba multiplications instead once b is large.
+    n = b.bit_length()
+    if n <= DIV_LIMIT or a.bit_length() - n <= DIV_LIMIT:
+        return a % b
+    mask = (1 << n) - 1
+    r = 0
+    # Feed a to the 2n-by-n step one base-2**n digit at a time, most significant first
+    for shift in range((a.bit_length() - 1) // n * n, -1, -n):
+        r = _div2n1n((r << n) | ((a >> shift) & mask), b, n)[1]
+    return r
+
+
+if __name__ == "__main__":
+    import time
+    setup_logging()
+    start = time.perf_counter()
+    count = sum(1 for _ in iter_primes(10**10, 10**10 + 10**7))
+    logger.info(f"{count} primes in [1e10, 1e10 + 1e7] in {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    random_prime(1024)
+    logger.info(f"1024-bit random prime in {time.perf_counter() - start:.3f}s")
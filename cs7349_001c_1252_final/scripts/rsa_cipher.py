@@ -4,113 +4,250 @@
 
 
 import math
+import os
+import random
 import time
-from typing import Tuple, List
-from cs7349_001c_1252_final.scripts.utils import str_to_nums, nums_to_str
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from cs7349_001c_1252_final.scripts.utils import block_size, iter_pack_blocks, str_to_blocks, unpack_blocks
+from cs7349_001c_1252_final.scripts.number_theory import is_prime, iter_primes, random_prime
+from cs7349_001c_1252_final.scripts.factoring import factorize, find_factor
 
 # Logger Configuration
 import logging
 from cs7349_001c_1252_final.config.logging_config import setup_logging
 logger = logging.getLogger(getattr(__spec__, "name", __name__))
 
-def is_prime(n: int) -> bool:
-    if n <= 1:
-        return False
-    if n <= 3:
-        return True
-    if n % 2 == 0 or n % 3 == 0:
-        return False
-    i = 5
-    while i * i <= n:
-        if n % i == 0 or n % (i + 2) == 0:
-            return False
-        i += 6
-    return True
-
 def find_primes_in_range(start: int, end: int) -> List[int]:
     logger.debug(f"Finding primes between {start} and {end}")
-    primes = [n for n in range(start, end + 1) if is_prime(n)]
+    primes = list(iter_primes(start, end))
     logger.debug(f"Found {len(primes)} primes in range")
     return primes
 
 
 def ext_euclidean(a: int, b: int) -> Tuple[int, int, int]:
-    if a == 0:
-        return (b, 0, 1)
-    g, y, x = ext_euclidean(b % a, a)
-    return (g, x - (b // a) * y, y)
+    # Returns (g, x, y) with a*x + b*y = g; iterative, same results as the recursive form
+    old_r, r = b, a
+    old_s, s = 1, 0
+    old_t, t = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_s, s = s, old_s - q * s
+        old_t, t = t, old_t - q * t
+    return (old_r, old_t, old_s)
 
 
 def mod_inv(a: int, m: int) -> int:
-    logger.debug(f"Computing modular inverse of {a} mod {m}")
-    g, x, _ = ext_euclidean(a, m)
-    if g != 1:
+    try:
+        return pow(a, -1, m)
+    except ValueError:
         logger.error(f"Modular inverse does not exist for {a} mod {m}")
-        raise ValueError(f"Modular inverse does not exist for {a} mod {m}")
-    inverse = x % m
-    logger.debug(f"Modular inverse is {inverse}")
-    return inverse
-
-
-def generate_rsa_keys() -> Tuple[int, int, int, int, int]:
-    primes = find_primes_in_range(1000, 10000)
-    p = primes[9]   # 10th prime
-    q = primes[18]  # 19th prime
-    logger.debug(f"Selected primes p={p}, q={q}")
-    n = p * q
-    phi = (p - 1) * (q - 1)
-    logger.debug(f"Calculated n={n} and phi={phi}")
-
-    e = 65537
-    if math.gcd(e, phi) != 1:
-        logger.warning("65537 not coprime to phi; finding alternative e")
-        e = 3
-        while math.gcd(e, phi) != 1:
-            e += 2
-    logger.debug(f"Using public exponent e={e}")
+        raise ValueError(f"Modular inverse does not exist for {a} mod {m}") from None
 
-    d = mod_inv(e, phi)
-    logger.debug(f"Computed private exponent d={d}")
-    return p, q, e, n, d
 
+def batch_mod_inv(values: Sequence[int], m: int) -> List[int]:
+    # Montgomery's trick: one inversion plus 3(n - 1) multiplications for n inverses
+    if not values:
+        return []
+    prefix = [values[0] % m]
+    for v in values[1:]:
+        prefix.append(prefix[-1] * v % m)
+    try:
+        inverse = pow(prefix[-1], -1, m)
+    except ValueError:
+        bad = next(v for v in values if math.gcd(v, m) != 1)
+        logger.error(f"Modular inverse does not exist for {bad} mod {m}")
+        raise ValueError(f"Modular inverse does not exist for {bad} mod {m}") from None
+    out = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        out[i] = inverse * prefix[i - 1] % m
+        inverse = inverse * values[i] % m
+    out[0] = inverse
+    return out
 
-def brute_force_private_key(e: int, n: int) -> Tuple[int, int, int, float]:
+
+class RSAPrivateKey:
+    # CRT form of a two- or multi-prime key (PKCS #1 layout: p, q, q_inv, then (r_i, d_i, t_i)
+    # for each additional prime). Iterating yields p, q, e, n, d like the original tuple return.
+    __slots__ = ("p", "q", "e", "n", "d", "dp", "dq", "q_inv", "primes", "extra")
+
+    def __init__(self, p: int, q: int, e: int, d: Optional[int] = None, extra_primes: Sequence[int] = ()):
+        primes = (p, q) + tuple(extra_primes)
+        if len(set(primes)) != len(primes):
+            raise ValueError("RSA primes must be distinct.")
+        self.p, self.q, self.e = p, q, e
+        self.primes = primes
+        self.n = math.prod(primes)
+        self.d = d if d is not None else mod_inv(e, math.prod(r - 1 for r in primes))
+        self.dp = self.d % (p - 1)
+        self.dq = self.d % (q - 1)
+        self.q_inv = mod_inv(q, p)
+        # t_i is the inverse of the product of all earlier primes modulo r_i
+        self.extra: Tuple[Tuple[int, int, int], ...] = ()
+        product = p * q
+        for r in extra_primes:
+            self.extra += ((r, self.d % (r - 1), mod_inv(product, r)),)
+            product *= r
+
+    @classmethod
+    def from_components(cls, p: int, q: int, e: int, d: int, dp: int, dq: int, q_inv: int,
+                        extra: Sequence[Tuple[int, int, int]] = ()) -> "RSAPrivateKey":
+        # Rebuilds a stored key without recomputing any inverse; the caller vouches for the values
+        key = cls.__new__(cls)
+        key.p, key.q, key.e, key.d = p, q, e, d
+        key.dp, key.dq, key.q_inv = dp, dq, q_inv
+        key.extra = tuple(tuple(t) for t in extra)
+        key.primes = (p, q) + tuple(r for r, _, _ in key.extra)
+        key.n = math.prod(key.primes)
+        return key
+
+    def public_key(self) -> Tuple[int, int]:
+        return self.e, self.n
+
+    def decrypt(self, c: int) -> int:
+        # One exponentiation per prime recombined with Garner's algorithm; equals pow(c, d, n)
+        m1 = pow(c, self.dp, self.p)
+        m2 = pow(c, self.dq, self.q)
+        m = m2 + ((self.q_inv * (m1 - m2)) % self.p) * self.q
+        product = self.p * self.q
+        for r, d_r, t_r in self.extra:
+            m += (((pow(c, d_r, r) - m) * t_r) % r) * product
+            product *= r
+        return m
+
+    def sign(self, m: int) -> int:
+        return self.decrypt(m)
+
+    def decrypt_many(self, ciphertexts: Iterable[int]) -> List[int]:
+        if self.extra:
+            return [self.decrypt(c) for c in ciphertexts]
+        p, q, dp, dq, q_inv = self.p, self.q, self.dp, self.dq, self.q_inv
+        out: List[int] = []
+        for c in ciphertexts:
+            m2 = pow(c, dq, q)
+            out.append(m2 + ((q_inv * (pow(c, dp, p) - m2)) % p) * q)
+        return out
+
+    def __iter__(self) -> Iterator[int]:
+        return iter((self.p, self.q, self.e, self.n, self.d))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RSAPrivateKey) and (other.primes, other.e, other.d) == (self.primes, self.e, self.d)
+
+    def __hash__(self) -> int:
+        return hash(self.n)
+
+    def __repr__(self) -> str:
+        return f"RSAPrivateKey(<{self.n.bit_length()}-bit, {len(self.primes)} primes>)"
+
+
+DEFAULT_KEY_BITS = 2048
+DEFAULT_EXPONENT = 65537
+MIN_KEY_BITS = 16
+MIN_PRIME_BITS = 8
+
+
+def generate_rsa_keys(bits: int = DEFAULT_KEY_BITS, e: int = DEFAULT_EXPONENT, primes: int = 2,
+                      rng: Optional[random.Random] = None) -> RSAPrivateKey:
+    # rng defaults to the system CSPRNG; pass a seeded random.Random only for repeatable tests and benchmarks
+    if bits < MIN_KEY_BITS:
+        raise ValueError(f"Key size must be at least {MIN_KEY_BITS} bits.")
+    if e < 3 or e % 2 == 0:
+        raise ValueError("Public exponent must be odd and at least 3.")
+    if primes < 2 or bits // primes < MIN_PRIME_BITS:
+        raise ValueError(f"Need at least 2 primes of at least {MIN_PRIME_BITS} bits each.")
+    sizes = [bits // primes + (1 if i < bits % primes else 0) for i in range(primes)]
+    while True:
+        # Every prime has its top two bits set, which pins the size of a two-prime n;
+        # with more primes the product can fall one bit short, so such sets are redrawn
+        factors = [random_prime(size, rng, coprime_to=e) for size in sizes]
+        if len(set(factors)) == primes and math.prod(factors).bit_length() == bits:
+            break
+    logger.debug(f"Selected primes of {sizes} bits")
+    key = RSAPrivateKey(factors[0], factors[1], e, extra_primes=factors[2:])
+    logger.debug(f"Generated {key.n.bit_length()}-bit modulus with e={e}")
+    return key
+
+
+def _generate_key_task(task: Tuple[int, int, int]) -> RSAPrivateKey:
+    return generate_rsa_keys(*task)
+
+
+def generate_rsa_keypairs(count: int, bits: int = DEFAULT_KEY_BITS, e: int = DEFAULT_EXPONENT,
+                          workers: Optional[int] = None, primes: int = 2) -> List[RSAPrivateKey]:
+    # Independent keys spread over a process pool; workers=None uses every CPU
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    tasks = [(bits, e, primes)] * count
+    if workers <= 1 or count <= 1:
+        return [_generate_key_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, count)) as pool:
+        return list(pool.map(_generate_key_task, tasks))
+
+
+class CrackResult(NamedTuple):
+    p: Optional[int]
+    q: Optional[int]
+    d: Optional[int]
+    elapsed: float
+    method: Optional[str]
+    timings: Dict[str, float]
+
+
+def crack_private_key(e: int, n: int) -> CrackResult:
+    # Factor n with the factoring engine, then d = e^-1 mod phi(n)
     start = time.perf_counter()
-    p = None
-    for candidate in range(2, int(math.isqrt(n)) + 1):
-        if n % candidate == 0 and is_prime(candidate):
-            q = n // candidate
-            if is_prime(q):
-                p = candidate
-                break
-    if p is None:
+    found = find_factor(n)
+    if found.factor is None:
         logger.error("Failed to factor n")
-        return None, None, None, 0.0
-    phi = (p - 1) * (q - 1)
-    d = None
-    for i in range(2, phi):
-        if (e * i) % phi == 1:
-            d = i
-            break
+        return CrackResult(None, None, None, time.perf_counter() - start, None, found.timings)
+    p = min(found.factor, n // found.factor)
+    q = n // p
+    # q may still be composite for multi-prime moduli
+    primes = [p] if is_prime(p) else factorize(p)
+    primes += [q] if is_prime(q) else factorize(q)
+    phi = 1
+    for r in set(primes):
+        phi *= (r - 1) * r ** (primes.count(r) - 1)
+    d = mod_inv(e, phi)
     elapsed = time.perf_counter() - start
+    logger.debug(f"Factored n with {found.method} "
+                 f"({', '.join(f'{name}={t:.4f}s' for name, t in found.timings.items())})")
     logger.debug(f"Brute-forced p={p}, q={q}, d={d} in {elapsed:.4f} seconds")
+    return CrackResult(p, q, d, elapsed, found.method, found.timings)
+
+
+def brute_force_private_key(e: int, n: int) -> Tuple[int, int, int, float]:
+    p, q, d, elapsed, _, _ = crack_private_key(e, n)
+    if p is None:
+        return None, None, None, 0.0
     return p, q, d, elapsed
 
 
 def encrypt(m: int, e: int, n: int) -> int:
-    logger.debug(f"Encrypting message m={m} with e={e}, n={n}")
+    # %-style arguments: the big ints are only converted to text when DEBUG is enabled
+    logger.debug("Encrypting message m=%d with e=%d, n=%d", m, e, n)
     c = pow(m, e, n)
-    logger.debug(f"Encrypted ciphertext c={c}")
+    logger.debug("Encrypted ciphertext c=%d", c)
     return c
 
 
 def decrypt(c: int, d: int, n: int) -> int:
-    logger.debug(f"Decrypting ciphertext c={c} with d={d}, n={n}")
+    logger.debug("Decrypting ciphertext c=%d with d=%d, n=%d", c, d, n)
     m = pow(c, d, n)
-    logger.debug(f"Decrypted message m={m}")
+    logger.debug("Decrypted message m=%d", m)
     return m
 
 
+def encrypt_message(data: bytes, e: int, n: int) -> List[int]:
+    # One exponentiation per block_size(n) bytes rather than per character
+    return [pow(block, e, n) for block in iter_pack_blocks([data], n)]
+
+
+def decrypt_message(ciphertexts: Iterable[int], key: RSAPrivateKey) -> bytes:
+    return unpack_blocks(key.decrypt_many(ciphertexts), key.n)
+
+
 if __name__ == '__main__':
     setup_logging()
 
@@ -119,25 +256,22 @@ if __name__ == '__main__':
     result = is_prime(num)
     logger.info(f"{num} is {'a prime' if result else 'not a prime'}.\n")
 
-    # 2) Generate RSA keys
-    p, q, e, n, d = generate_rsa_keys()
+    # 2) Generate RSA keys (small enough for the brute-force step below)
+    p, q, e, n, d = generate_rsa_keys(bits=22)
     logger.info("Generated RSA key pair:")
     logger.info(f"PU = {{e: {e}, n: {n}}}")
     logger.info(f"PR = {{d: {d}, p: {p}, q: {q}}}\n")
 
-    # 3) Encrypt/decrypt a fixed message "rsa"
+    # 3) Encrypt/decrypt a fixed message "rsa", packing as many bytes as fit below n into each block
     message = "rsa"
     logger.info(f"Original message: \"{message}\"")
-    message_int = str_to_nums(message)
-    logger.info(f"Mapped to integers: {message_int}")
+    message_int = str_to_blocks(message, n)
+    logger.info(f"Packed into {block_size(n)}-byte blocks: {message_int}")
 
-    ciphertexts = [encrypt(m_i, e, n) for m_i in message_int]
+    ciphertexts = encrypt_message(message.encode('utf-8'), e, n)
     logger.info(f"Encrypted ciphertexts: {ciphertexts}")
 
-    decrypted_ints = [decrypt(c_i, d, n) for c_i in ciphertexts]
-    logger.info(f"Decrypted integers: {decrypted_ints}")
-
-    decrypted_msg = nums_to_str(decrypted_ints)
+    decrypted_msg = decrypt_message(ciphertexts, RSAPrivateKey(p, q, e, d)).decode('utf-8')
     logger.info(f"Recovered message: \"{decrypted_msg}\"\n")
 
     # 4) Brute-force the private key and measure time
@@ -0,0 +1,83 @@
+# cs7349_001c_1252_final.scripts.tdes_cipher.py
+# Garrett Gruss 4/27/2025
+# Usage: python -m cs7349_001c_1252_final.scripts.tdes_cipher
+
+
+from typing import Tuple, Union
+from cs7349_001c_1252_final.scripts.des_cipher import pad, unpad
+from cs7349_001c_1252_final.scripts.des_key import get_des_key
+from cs7349_001c_1252_final.scripts.des_table import (
+    IP_TABLES, FP_TABLES, MASK_32, permute_int, rounds_int
+)
+
+# Logger Configuration
+import logging
+from cs7349_001c_1252_final.config.logging_config import setup_logging
+logger = logging.getLogger(getattr(__spec__, "name", __name__))
+
+Schedule = Tuple[int, ...]
+
+
+class TDESKey:
+    __slots__ = ("key", "encrypt_schedules", "decrypt_schedules")
+
+    def __init__(self, key: bytes):
+        # 24 bytes: K1|K2|K3 (keying option 1); 16 bytes: K1|K2 with K3 = K1 (option 2)
+        if len(key) not in (16, 24):
+            raise ValueError("Key must be 16 or 24 bytes long.")
+        self.key = bytes(key)
+        k1, k2 = get_des_key(self.key[:8]), get_des_key(self.key[8:16])
+        k3 = get_des_key(self.key[16:24]) if len(self.key) == 24 else k1
+        # E_k3(D_k2(E_k1(m))) and its inverse D_k1(E_k2(D_k3(c)))
+        self.encrypt_schedules: Tuple[Schedule, Schedule, Schedule] = (
+            k1.encrypt_subkeys, k2.decrypt_subkeys, k3.encrypt_subkeys)
+        self.decrypt_schedules: Tuple[Schedule, Schedule, Schedule] = (
+            k3.decrypt_subkeys, k2.encrypt_subkeys, k1.decrypt_subkeys)
+
+    def schedules(self, encrypt: bool = True) -> Tuple[Schedule, Schedule, Schedule]:
+        return self.encrypt_schedules if encrypt else self.decrypt_schedules
+
+    def __repr__(self) -> str:
+        return f"TDESKey(<{len(self.key)} bytes>)"
+
+
+def crypt_block_tdes(block: int, schedules: Tuple[Schedule, Schedule, Schedule]) -> int:
+    # FP followed by IP between stages cancels out, so only the half swap remains
+    permuted = permute_int(block, IP_TABLES)
+    left, right = permuted >> 32, permuted & MASK_32
+    for schedule in schedules:
+        left, right = rounds_int(left, right, schedule)
+        left, right = right, left
+    return permute_int((left << 32) | right, FP_TABLES)
+
+
+def tdes_crypt_blocks(data: bytes, key: Union[bytes, TDESKey], encrypt: bool = True) -> bytes:
+    if len(data) % 8:
+        raise ValueError("Data length must be a multiple of 8 bytes.")
+    tdes_key = key if isinstance(key, TDESKey) else TDESKey(key)
+    schedules = tdes_key.schedules(encrypt)
+    from_bytes = int.from_bytes
+    return b''.join(
+        crypt_block_tdes(from_bytes(data[i:i+8], 'big'), schedules).to_bytes(8, 'big')
+        for i in range(0, len(data), 8)
+    )
+
+
+def tdes_encrypt(plaintext: str, key: Union[bytes, TDESKey]) -> str:
+    data = pad(plaintext.encode('utf-8'))
+    return tdes_crypt_blocks(data, key, encrypt=True).hex()
+
+
+def tdes_decrypt(ciphertext_hex: str, key: Union[bytes, TDESKey]) -> str:
+    data = bytes.fromhex(ciphertext_hex)
+    return unpad(tdes_crypt_blocks(data, key, encrypt=False)).decode('utf-8')
+
+
+if __name__ == "__main__":
+    setup_logging()
+    key = b"secr3t_k" + b"8bytekey" + b"thirdkey"
+    sample = "Hello, 3DES!"
+    cipher = tdes_encrypt(sample, key)
+    logger.info(f"Encrypted: {cipher}")
+    plain = tdes_decrypt(cipher, key)
+    logger.info(f"Decrypted: {plain}")
@@ -2,6 +2,12 @@
 # Garrett Gruss 4/27/2025
 
 import string
+from typing import Iterable, Iterator, List
+# Re-exported for existing callers; the implementation lives in number_theory
+from cs7349_001c_1252_final.scripts.number_theory import is_prime
+
+# Marks the end of the message in the final block; the rest of that block is zero
+BLOCK_PAD_MARKER = b'\x80'
 
 def str_to_nums(s: str) -> list:
     return [string.ascii_lowercase.index(ch) for ch in s]
@@ -9,16 +15,51 @@ def str_to_nums(s: str) -> list:
 def nums_to_str(nums: list) -> str:
     return ''.join(string.ascii_lowercase[n] for n in nums)
 
-def is_prime(n: int) -> bool:
-    if n <= 1:
-        return False
-    if n <= 3:
-        return True
-    if n % 2 == 0 or n % 3 == 0:
-        return False
-    i = 5
-    while i * i <= n:
-        if n % i == 0 or n % (i + 2) == 0:
-            return False
-        i += 6
-    return True
\ No newline at end of file
+def block_size(n: int) -> int:
+    # Bytes per block: the largest k with 256**k <= n, so every packed block is below n
+    size = (n.bit_length() - 1) // 8
+    if size < 1:
+        raise ValueError("Modulus must be at least 256 to pack bytes.")
+    return size
+
+def iter_pack_blocks(chunks: Iterable[bytes], n: int) -> Iterator[int]:
+    # Streams fixed-size big-endian blocks; the last one carries 0x80 then zeros (ISO/IEC 7816-4)
+    size = block_size(n)
+    buffer = b''
+    for chunk in chunks:
+        buffer += chunk
+        usable = len(buffer) - len(buffer) % size
+        for i in range(0, usable, size):
+            yield int.from_bytes(buffer[i:i+size], 'big')
+        buffer = buffer[usable:]
+    yield int.from_bytes((buffer + BLOCK_PAD_MARKER).ljust(size, b'\0'), 'big')
+
+def iter_unpack_blocks(blocks: Iterable[int], n: int) -> Iterator[bytes]:
+    # Inverse of iter_pack_blocks; holds back one block so the padding can be stripped
+    size = block_size(n)
+    previous = None
+    for block in blocks:
+        if previous is not None:
+            yield previous
+        try:
+            previous = block.to_bytes(size, 'big')
+        except OverflowError:
+            raise ValueError(f"Block {block} does not fit in {size} bytes.") from None
+    if previous is None:
+        raise ValueError("Missing final padding block.")
+    stripped = previous.rstrip(b'\0')
+    if not stripped.endswith(BLOCK_PAD_MARKER):
+        raise ValueError("Invalid block padding.")
+    yield stripped[:-1]
+
+def pack_blocks(data: bytes, n: int) -> List[int]:
+    return list(iter_pack_blocks([data], n))
+
+def unpack_blocks(blocks: Iterable[int], n: int) -> bytes:
+    return b''.join(iter_unpack_blocks(blocks, n))
+
+def str_to_blocks(s: str, n: int) -> List[int]:
+    return pack_blocks(s.encode('utf-8'), n)
+
+def blocks_to_str(blocks: Iterable[int], n: int) -> str:
+    return unpack_blocks(blocks, n).decode('utf-8')
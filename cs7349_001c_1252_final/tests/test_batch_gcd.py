@@ -0,0 +1,64 @@
+# cs7349_001c_1252_final.tests.test_batch_gcd.py
+# Garrett Gruss 4/27/2025
+
+import math
+import random
+import pytest
+from cs7349_001c_1252_final.scripts.batch_gcd import batch_gcd, load_moduli, product_tree, scan_moduli
+from cs7349_001c_1252_final.scripts.number_theory import mod_large, random_prime
+from cs7349_001c_1252_final.scripts.rsa_cipher import generate_rsa_keys
+
+
+def _corpus():
+    rng = random.Random(7)
+    primes = [random_prime(64, rng) for _ in range(120)]
+    moduli = [primes[i] * primes[i + 1] for i in range(0, 120, 2)]
+    # index 60 reuses a prime of key 3, index 61 shares both primes of key 10 (a duplicate)
+    moduli += [primes[6] * random_prime(64, rng), moduli[10]]
+    return moduli
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1000])
+def test_batch_gcd_matches_pairwise(chunk_size):
+    moduli = _corpus()
+    expected = [math.gcd(n, math.prod(moduli[:i] + moduli[i + 1:])) for i, n in enumerate(moduli)]
+    assert batch_gcd(moduli, chunk_size=chunk_size) == expected
+
+
+def test_batch_gcd_parallel():
+    moduli = _corpus()
+    assert batch_gcd(moduli, chunk_size=16, workers=2) == batch_gcd(moduli)
+
+
+def test_scan_recovers_private_keys():
+    keys = [generate_rsa_keys(bits=256) for _ in range(20)]
+    weak = generate_rsa_keys(bits=256)
+    # Rebuild key 4 around one prime of the weak key
+    moduli = [key.n for key in keys] + [weak.n]
+    moduli[4] = weak.p * keys[4].q
+    result = scan_moduli(moduli, chunk_size=8)
+    assert [key.index for key in result.compromised] == [4, 20]
+    for key in result.compromised:
+        assert key.p * key.q == moduli[key.index]
+        assert (65537 * key.d) % ((key.p - 1) * (key.q - 1)) == 1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_scan_reports_duplicates(chunk_size):
+    moduli = _corpus()
+    result = scan_moduli(moduli, chunk_size=chunk_size)
+    assert [key.index for key in result.compromised] == [3, 60]
+    assert result.duplicates == [10, 61]
+
+
+def test_mod_large_and_tree():
+    rng = random.Random(8)
+    for _ in range(50):
+        b = rng.getrandbits(rng.randrange(1, 30000)) | 1
+        a = rng.getrandbits(rng.randrange(1, 90000))
+        assert mod_large(a, b) == a % b
+    assert product_tree([2, 3, 5])[-1] == [30]
+
+
+def test_load_moduli():
+    assert load_moduli(["# comment", "15", "", "0x23  # hex", " 77 "]) == [15, 35, 77]
@@ -0,0 +1,52 @@
+# cs7349_001c_1252_final.tests.test_benchmarks.py
+# Garrett Gruss 4/27/2025
+
+import pytest
+from cs7349_001c_1252_final.benchmarks import suite
+from cs7349_001c_1252_final.benchmarks.suite import (
+    RESULTS_VERSION, compare_results, load_results, main, run_suite, save_results
+)
+
+
+def _results(**seconds):
+    return {"version": RESULTS_VERSION,
+            "results": {name: {"seconds_per_op": s, "ops_per_sec": 1 / s, "unit": "op"} for name, s in seconds.items()}}
+
+
+def test_compare_flags_slowdowns_over_threshold():
+    baseline = _results(a=1.0, b=1.0, c=1.0)
+    current = _results(a=1.2, b=1.3, c=0.5, d=9.0)
+    regressions = compare_results(current, baseline, threshold=0.25)
+    assert [r.name for r in regressions] == ["b"]
+    assert regressions[0].ratio == pytest.approx(1.3)
+    assert compare_results(current, baseline, threshold=0.1)[0].name == "a"
+
+
+def test_run_save_and_compare(tmp_path):
+    suite._rsa_key.cache_clear()
+    results = run_suite(quick=True, only=["generate_subkeys"])
+    # Filtered-out RSA cases never generate their keys
+    assert suite._rsa_key.cache_info().currsize == 0
+    assert set(results["results"]) == {"des.generate_subkeys.bits", "des.generate_subkeys.int"}
+    assert all(entry["seconds_per_op"] > 0 for entry in results["results"].values())
+    path = str(tmp_path / "base.json")
+    save_results(results, path)
+    assert load_results(path) == results
+
+
+def test_zero_time_case(monkeypatch):
+    monkeypatch.setattr(suite, "time_case", lambda case: 0.0)
+    results = run_suite(quick=True, only=["generate_subkeys.int"])
+    assert results["results"]["des.generate_subkeys.int"]["ops_per_sec"] is None
+
+
+def test_main_exit_codes(tmp_path):
+    path = str(tmp_path / "base.json")
+    save_results(_results(**{"des.generate_subkeys.int": 1e-12}), path)
+    assert main(["--quick", "-k", "generate_subkeys.int", "-b", path]) == 1
+    save_results(_results(**{"des.generate_subkeys.int": 10.0}), path)
+    assert main(["--quick", "-k", "generate_subkeys.int", "-b", path, "-o", str(tmp_path / "out.json")]) == 0
+    assert "des.generate_subkeys.int" in load_results(str(tmp_path / "out.json"))["results"]
+    save_results({"version": 99, "results": {}}, path)
+    with pytest.raises(ValueError):
+        load_results(path)
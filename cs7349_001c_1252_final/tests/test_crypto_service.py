@@ -0,0 +1,70 @@
+# cs7349_001c_1252_final.tests.test_crypto_service.py
+# Garrett Gruss 4/27/2025
+
+import asyncio
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.crypto_service import (
+    CryptoService, CryptoClient, process_batch, encode_ints, decode_ints,
+    OP_DES_ENCRYPT, OP_DES_DECRYPT, OP_RSA_ENCRYPT, STATUS_OK, STATUS_ERROR
+)
+from cs7349_001c_1252_final.scripts.des_cipher import encrypt_bytes, decrypt_bytes
+
+KEY = b'secr3t_k'
+
+
+def test_int_codec():
+    values = [0, 1, 65537, 2 ** 300 + 5]
+    assert decode_ints(encode_ints(*values), len(values)) == values
+
+
+def test_process_batch_groups_and_errors():
+    messages = [os.urandom(n) for n in (0, 5, 16, 700)]
+    requests = [(OP_DES_ENCRYPT, i, KEY + m) for i, m in enumerate(messages)]
+    requests.append((OP_DES_DECRYPT, 10, KEY + b'1234567'))
+    requests.append((OP_RSA_ENCRYPT, 11, encode_ints(42, 65537, 1185137)))
+    requests.append((99, 12, b''))
+    results = {request_id: (status, payload) for status, request_id, payload in process_batch(requests)}
+    for i, m in enumerate(messages):
+        assert results[i] == (STATUS_OK, encrypt_bytes(m, KEY))
+    assert results[10][0] == STATUS_ERROR
+    assert results[11] == (STATUS_OK, encode_ints(pow(42, 65537, 1185137)))
+    assert results[12][0] == STATUS_ERROR
+
+
+def test_bad_request_does_not_fail_its_group():
+    good = encrypt_bytes(b'valid message', KEY)
+    # Same key and op: a truncated and an empty ciphertext alongside valid requests
+    requests = [(OP_DES_DECRYPT, 1, KEY + good), (OP_DES_DECRYPT, 2, KEY + b'bad'),
+                (OP_DES_DECRYPT, 3, KEY), (OP_DES_DECRYPT, 4, KEY + good[:-1]),
+                (OP_DES_DECRYPT, 5, KEY + good)]
+    results = {request_id: (status, payload) for status, request_id, payload in process_batch(requests)}
+    assert results[1] == results[5] == (STATUS_OK, b'valid message')
+    assert [results[i][0] for i in (2, 3, 4)] == [STATUS_ERROR] * 3
+
+
+async def _roundtrip(service: CryptoService, **connect) -> None:
+    await service.start()
+    try:
+        client = await CryptoClient.connect(**connect) if connect else \
+            await CryptoClient.connect(port=service.port)
+        messages = [os.urandom(n) for n in range(0, 200, 7)]
+        ciphers = await asyncio.gather(*(client.des_encrypt(m, KEY) for m in messages))
+        assert [decrypt_bytes(c, KEY) for c in ciphers] == messages
+        plains = await asyncio.gather(*(client.des_decrypt(c, KEY) for c in ciphers))
+        assert plains == messages
+        assert await client.rsa_decrypt(await client.rsa_encrypt(42, 65537, 1185137), 200033, 1185137) == 42
+        with pytest.raises(ValueError):
+            await client.des_decrypt(b'short', KEY)
+        await client.close()
+    finally:
+        await service.close()
+
+
+def test_tcp_service():
+    asyncio.run(_roundtrip(CryptoService(port=0, workers=1)))
+
+
+def test_unix_socket_service(tmp_path):
+    path = str(tmp_path / "crypto.sock")
+    asyncio.run(_roundtrip(CryptoService(path=path, workers=1), path=path))
@@ -0,0 +1,61 @@
+# cs7349_001c_1252_final.tests.test_des_bitslice.py
+# Garrett Gruss 4/27/2025
+
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.des_bitslice import (
+    blocks_to_planes, planes_to_blocks, sbox_planes, SBOX_CIRCUITS, bitslice_crypt
+)
+from cs7349_001c_1252_final.scripts.des_cipher import (
+    generate_subkeys, process_block, sbox_substitution,
+    des_encrypt, des_decrypt
+)
+
+
+def test_planes_roundtrip():
+    data = os.urandom(8 * 64)
+    planes = blocks_to_planes(data)
+    assert len(planes) == 64
+    # bit 0 of plane 0 is the most significant bit of block 0
+    assert planes[0] & 1 == data[0] >> 7
+    assert planes_to_blocks(planes, 64) == data
+
+
+def test_sbox_circuits_match_tables():
+    # one lane per possible 6-bit input
+    ones = (1 << 64) - 1
+    inputs = [sum(((chunk >> (5 - bit)) & 1) << chunk for chunk in range(64)) for bit in range(6)]
+    for i, circuit in enumerate(SBOX_CIRCUITS):
+        outputs = sbox_planes(inputs, circuit, ones)
+        for chunk in range(64):
+            bits48 = [0] * 48
+            bits48[i * 6:(i + 1) * 6] = [(chunk >> (5 - b)) & 1 for b in range(6)]
+            expected = sbox_substitution(bits48)[i * 4:(i + 1) * 4]
+            assert [(out >> chunk) & 1 for out in outputs] == expected
+
+
+def test_matches_process_block():
+    key = os.urandom(8)
+    subkeys = generate_subkeys(key)
+    data = os.urandom(8 * 77)
+    reference = b''.join(process_block(data[i:i+8], subkeys) for i in range(0, len(data), 8))
+    assert bitslice_crypt(data, subkeys, batch_blocks=32) == reference
+    assert bitslice_crypt(reference, subkeys[::-1]) == data
+
+
+def test_known_vector():
+    subkeys = generate_subkeys(bytes.fromhex('133457799BBCDFF1'))
+    assert bitslice_crypt(bytes.fromhex('0123456789ABCDEF'), subkeys).hex() == '85e813540f0ab405'
+
+
+def test_engine_selection():
+    key = b'secr3t_k'
+    text = 'The quick brown fox'
+    cipher = des_encrypt(text, key, engine="bitslice")
+    assert cipher == des_encrypt(text, key)
+    assert des_decrypt(cipher, key, engine="bitslice") == text
+
+
+def test_rejects_partial_block():
+    with pytest.raises(ValueError):
+        bitslice_crypt(b'1234567', generate_subkeys(b'secr3t_k'))
@@ -0,0 +1,60 @@
+# cs7349_001c_1252_final.tests.test_des_bytes.py
+# Garrett Gruss 4/27/2025
+
+import mmap
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.des_cipher import (
+    encrypt_bytes, decrypt_bytes, encrypt_into, decrypt_into,
+    padded_length, crypt_blocks, pad, ENGINES
+)
+
+KEY = b'secr3t_k'
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_bytes_roundtrip(engine):
+    data = os.urandom(203)
+    cipher = encrypt_bytes(data, KEY, engine=engine)
+    assert cipher == crypt_blocks(pad(data), KEY, engine="table")
+    assert decrypt_bytes(cipher, KEY, engine=engine) == data
+
+
+def test_accepts_buffer_types():
+    data = os.urandom(64)
+    expected = encrypt_bytes(data, KEY)
+    assert encrypt_bytes(bytearray(data), KEY) == expected
+    assert encrypt_bytes(memoryview(data), KEY) == expected
+    with mmap.mmap(-1, len(data)) as mm:
+        mm.write(data)
+        assert encrypt_bytes(mm, KEY) == expected
+
+
+@pytest.mark.parametrize("engine", ["table", "bitslice"])
+def test_encrypt_into_and_decrypt_into(engine):
+    data = os.urandom(77)
+    out = bytearray(padded_length(len(data)))
+    assert encrypt_into(data, out, KEY, engine=engine) == 80
+    assert bytes(out) == encrypt_bytes(data, KEY)
+    plain = bytearray(80)
+    assert decrypt_into(out, plain, KEY, engine=engine) == 77
+    assert bytes(plain[:77]) == data
+
+
+def test_decrypt_into_in_place():
+    data = os.urandom(40)
+    buffer = bytearray(encrypt_bytes(data, KEY))
+    n = decrypt_into(buffer, buffer, KEY)
+    assert bytes(buffer[:n]) == data
+
+
+def test_into_rejects_bad_destinations():
+    with pytest.raises(ValueError):
+        encrypt_into(b'12345678', bytearray(8), KEY)
+    with pytest.raises(ValueError):
+        encrypt_into(b'1234', bytes(8), KEY)
+
+
+def test_decrypt_bytes_rejects_partial_block():
+    with pytest.raises(ValueError):
+        decrypt_bytes(b'1234567', KEY)
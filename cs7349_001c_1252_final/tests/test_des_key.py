@@ -0,0 +1,59 @@
+# cs7349_001c_1252_final.tests.test_des_key.py
+# Garrett Gruss 4/27/2025
+
+import pytest
+from cs7349_001c_1252_final.scripts.des_key import (
+    DESKey, get_des_key, key_cache_info, clear_key_cache
+)
+from cs7349_001c_1252_final.scripts.des_table import generate_subkeys_int
+from cs7349_001c_1252_final.scripts.des_cipher import (
+    generate_subkeys, des_encrypt, des_decrypt, ENGINES
+)
+
+
+def test_schedules():
+    key = DESKey(b'secr3t_k')
+    assert list(key.encrypt_subkeys) == generate_subkeys_int(b'secr3t_k')
+    assert key.decrypt_subkeys == key.encrypt_subkeys[::-1]
+    assert key.bit_schedule() == generate_subkeys(b'secr3t_k')
+    assert key.bit_schedule(encrypt=False) == generate_subkeys(b'secr3t_k')[::-1]
+
+
+def test_slots():
+    key = DESKey(b'secr3t_k')
+    with pytest.raises(AttributeError):
+        key.extra = 1
+
+
+def test_invalid_key_length():
+    with pytest.raises(ValueError):
+        DESKey(b'short')
+    with pytest.raises(ValueError):
+        get_des_key(b'toolongkey123')
+
+
+def test_cache_hits_and_misses():
+    clear_key_cache()
+    first = get_des_key(b'secr3t_k')
+    assert get_des_key(bytearray(b'secr3t_k')) is first
+    assert get_des_key(first) is first
+    info = key_cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_des_key_in_public_api():
+    key = DESKey(b'secr3t_k')
+    text = 'The quick brown fox'
+    expected = des_encrypt(text, b'secr3t_k')
+    for engine in ENGINES:
+        assert des_encrypt(text, key, engine=engine) == expected
+        assert des_decrypt(expected, key, engine=engine) == text
+
+
+def test_default_path_uses_cache():
+    clear_key_cache()
+    cipher = des_encrypt('Hello, DES!', b'secr3t_k')
+    assert des_decrypt(cipher, b'secr3t_k') == 'Hello, DES!'
+    info = key_cache_info()
+    assert (info.misses, info.hits) == (1, 1)
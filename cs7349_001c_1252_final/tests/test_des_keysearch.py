@@ -0,0 +1,83 @@
+# cs7349_001c_1252_final.tests.test_des_keysearch.py
+# Garrett Gruss 4/27/2025
+
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.des_keysearch import (
+    KEY_BIT_SCHEDULES, PARITY_MASK, parity_variants, search_keys
+)
+from cs7349_001c_1252_final.scripts.des_table import generate_subkeys_int, process_block_int
+
+KEY = b'secr3t_k'
+PLAINTEXT = b'Hello, D'
+CIPHERTEXT = process_block_int(PLAINTEXT, generate_subkeys_int(KEY))
+
+
+def test_key_schedule_is_linear():
+    a, b = os.urandom(8), os.urandom(8)
+    x = bytes(i ^ j for i, j in zip(a, b))
+    combined = [s ^ t for s, t in zip(generate_subkeys_int(a), generate_subkeys_int(b))]
+    assert generate_subkeys_int(x) == combined
+    # parity bits do not reach any subkey
+    assert all(not any(KEY_BIT_SCHEDULES[pos]) for pos in range(0, 64, 8))
+
+
+def test_parity_variants():
+    assert parity_variants(0x10, 0x0301) == [0x10, 0x11, 0x110, 0x111]
+
+
+def test_finds_key_and_parity_equivalents():
+    mask = 0x0000_0000_00FF_0F0F
+    guess = (int.from_bytes(KEY, 'big') & ~mask).to_bytes(8, 'big')
+    result = search_keys(PLAINTEXT, CIPHERTEXT, guess, mask, workers=1, chunk_bits=6)
+    assert result.completed
+    assert result.candidates == 1 << 13
+    assert KEY in result.matches
+    assert len(result.matches) == 1 << 3
+    assert all(int.from_bytes(k, 'big') & ~PARITY_MASK == int.from_bytes(KEY, 'big') & ~PARITY_MASK
+               for k in result.matches)
+
+
+def test_parallel_search():
+    mask = 0xFE00FE
+    guess = (int.from_bytes(KEY, 'big') & ~mask).to_bytes(8, 'big')
+    result = search_keys(PLAINTEXT, CIPHERTEXT, guess, mask, workers=2, chunk_bits=8)
+    assert result.completed
+    assert result.matches == [KEY]
+
+
+def test_checkpoint_resume(tmp_path):
+    mask = 0xFE00FE
+    guess = (int.from_bytes(KEY, 'big') & ~mask).to_bytes(8, 'big')
+    path = str(tmp_path / "search.json")
+    partial = search_keys(PLAINTEXT, CIPHERTEXT, guess, mask, workers=1, chunk_bits=8,
+                          checkpoint=path, should_stop=lambda: True)
+    assert not partial.completed
+    assert partial.candidates == 1 << 8
+    resumed = search_keys(PLAINTEXT, CIPHERTEXT, guess, mask, workers=1, chunk_bits=8, checkpoint=path)
+    assert resumed.completed
+    assert resumed.candidates == 1 << 14
+    assert resumed.matches == [KEY]
+    # The rate only counts keys tested after resuming
+    tested = (1 << 14) - (1 << 8)
+    assert resumed.keys_per_second == pytest.approx(tested / resumed.elapsed)
+    with pytest.raises(ValueError):
+        search_keys(PLAINTEXT, CIPHERTEXT, guess, 0xFF, checkpoint=path)
+
+
+def test_stop_on_first():
+    mask = 0xFE00FE
+    guess = (int.from_bytes(KEY, 'big') & ~mask).to_bytes(8, 'big')
+    result = search_keys(PLAINTEXT, CIPHERTEXT, guess, mask, workers=1, chunk_bits=4, stop_on_first=True)
+    assert result.matches == [KEY]
+
+
+def test_stop_on_first_in_last_chunk():
+    # Every searched bit set: the key is in the last prefix chunk, so stopping there still completes the search
+    mask = 0xFE00FE
+    key = (int.from_bytes(KEY, 'big') | mask).to_bytes(8, 'big')
+    ciphertext = process_block_int(PLAINTEXT, generate_subkeys_int(key))
+    result = search_keys(PLAINTEXT, ciphertext, KEY, mask, workers=1, chunk_bits=4, stop_on_first=True)
+    assert result.matches == [key]
+    assert result.completed
+    assert result.candidates == 1 << 14
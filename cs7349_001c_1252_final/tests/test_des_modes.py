@@ -0,0 +1,80 @@
+# cs7349_001c_1252_final.tests.test_des_modes.py
+# Garrett Gruss 4/27/2025
+
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.des_modes import (
+    xor_bytes, cbc_encrypt, cbc_decrypt, ctr_chunk, ctr_crypt
+)
+from cs7349_001c_1252_final.scripts.des_cipher import (
+    generate_subkeys, process_block, pad
+)
+from cs7349_001c_1252_final.scripts.tdes_cipher import tdes_crypt_blocks
+
+KEY = b'secr3t_k'
+IV = bytes.fromhex('0001020304050607')
+
+
+def test_xor_bytes():
+    assert xor_bytes(b'\x00\xff\x0f', b'\xff\xff\x00') == b'\xff\x00\x0f'
+
+
+def test_cbc_matches_reference_chain():
+    data = os.urandom(45)
+    subkeys = generate_subkeys(KEY)
+    padded = pad(data)
+    prev, expected = IV, b''
+    for i in range(0, len(padded), 8):
+        prev = process_block(xor_bytes(padded[i:i+8], prev), subkeys)
+        expected += prev
+    assert cbc_encrypt(data, KEY, IV) == expected
+    assert cbc_decrypt(expected, KEY, IV) == data
+
+
+def test_cbc_parallel_decrypt():
+    data = os.urandom(4099)
+    cipher = cbc_encrypt(data, KEY, IV)
+    assert cbc_decrypt(cipher, KEY, IV, workers=2, chunk_size=1024) == data
+
+
+def test_ctr_keystream():
+    subkeys = generate_subkeys(KEY)
+    data = os.urandom(20)
+    counter = int.from_bytes(IV, 'big')
+    keystream = b''.join(process_block((counter + i).to_bytes(8, 'big'), subkeys) for i in range(3))
+    assert ctr_crypt(data, KEY, IV) == xor_bytes(data, keystream[:20])
+
+
+def test_ctr_parallel_roundtrip():
+    data = os.urandom(10001)
+    cipher = ctr_crypt(data, KEY, IV, workers=2, chunk_size=2048)
+    assert cipher == ctr_crypt(data, KEY, IV)
+    assert ctr_crypt(cipher, KEY, IV, workers=2, chunk_size=2048) == data
+
+
+def test_ctr_chunk_tdes_key():
+    key = os.urandom(24)
+    data = os.urandom(20)
+    counter = int.from_bytes(IV, 'big')
+    keystream = tdes_crypt_blocks(b''.join((counter + i).to_bytes(8, 'big') for i in range(3)), key)
+    assert ctr_chunk((data, counter, key, "bitslice")) == xor_bytes(data, keystream[:20])
+    assert ctr_chunk((data, counter, KEY, "bitslice")) == ctr_crypt(data, KEY, IV)
+
+
+def test_ctr_counter_wraps():
+    iv = b'\xff' * 8
+    data = os.urandom(16)
+    assert ctr_crypt(ctr_crypt(data, KEY, iv), KEY, iv) == data
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        cbc_encrypt(b'abc', KEY, b'short')
+    with pytest.raises(ValueError):
+        cbc_decrypt(b'1234567', KEY, IV)
+    for chunk_size in (0, -8, 7):
+        with pytest.raises(ValueError):
+            ctr_crypt(b'x' * 32, KEY, IV, chunk_size=chunk_size)
+        with pytest.raises(ValueError):
+            cbc_decrypt(cbc_encrypt(b'x' * 32, KEY, IV), KEY, IV, chunk_size=chunk_size)
+    assert ctr_crypt(ctr_crypt(b'x' * 33, KEY, IV, chunk_size=8), KEY, IV, chunk_size=15) == b'x' * 33
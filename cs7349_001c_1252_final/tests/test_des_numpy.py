@@ -0,0 +1,43 @@
+# cs7349_001c_1252_final.tests.test_des_numpy.py
+# Garrett Gruss 4/27/2025
+
+import os
+import pytest
+from cs7349_001c_1252_final.scripts import des_numpy
+from cs7349_001c_1252_final.scripts.des_numpy import numpy_crypt
+from cs7349_001c_1252_final.scripts.des_table import generate_subkeys_int, ecb_crypt_int
+from cs7349_001c_1252_final.scripts.des_cipher import des_encrypt, des_decrypt
+
+
+def test_matches_table_engine():
+    pytest.importorskip("numpy")
+    subkeys = generate_subkeys_int(os.urandom(8))
+    data = os.urandom(8 * 1001)
+    cipher = numpy_crypt(data, subkeys, chunk_blocks=128)
+    assert cipher == ecb_crypt_int(data, subkeys)
+    assert numpy_crypt(cipher, subkeys[::-1]) == data
+
+
+def test_known_vector():
+    subkeys = generate_subkeys_int(bytes.fromhex('133457799BBCDFF1'))
+    assert numpy_crypt(bytes.fromhex('0123456789ABCDEF'), subkeys).hex() == '85e813540f0ab405'
+
+
+def test_fallback_without_numpy(monkeypatch):
+    monkeypatch.setattr(des_numpy, "HAVE_NUMPY", False)
+    subkeys = generate_subkeys_int(b'secr3t_k')
+    data = os.urandom(8 * 9)
+    assert numpy_crypt(data, subkeys) == ecb_crypt_int(data, subkeys)
+
+
+def test_engine_selection():
+    key = b'secr3t_k'
+    text = 'The quick brown fox'
+    cipher = des_encrypt(text, key, engine="numpy")
+    assert cipher == des_encrypt(text, key)
+    assert des_decrypt(cipher, key, engine="numpy") == text
+
+
+def test_rejects_partial_block():
+    with pytest.raises(ValueError):
+        numpy_crypt(b'1234567', generate_subkeys_int(b'secr3t_k'))
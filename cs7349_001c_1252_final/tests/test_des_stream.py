@@ -0,0 +1,67 @@
+# cs7349_001c_1252_final.tests.test_des_stream.py
+# Garrett Gruss 4/27/2025
+
+import io
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.des_stream import (
+    DESStreamEncryptor, DESStreamDecryptor,
+    encrypt_stream, decrypt_stream, encrypt_file, decrypt_file
+)
+from cs7349_001c_1252_final.scripts.des_cipher import crypt_blocks, pad
+
+
+def test_update_finalize_matches_one_shot():
+    key = b'secr3t_k'
+    data = os.urandom(1000)
+    enc = DESStreamEncryptor(key)
+    pieces = [enc.update(data[i:i+37]) for i in range(0, len(data), 37)]
+    cipher = b''.join(pieces) + enc.finalize()
+    assert cipher == crypt_blocks(pad(data), key, engine="table")
+
+    dec = DESStreamDecryptor(key, engine="table")
+    pieces = [dec.update(cipher[i:i+53]) for i in range(0, len(cipher), 53)]
+    assert b''.join(pieces) + dec.finalize() == data
+
+
+def test_decryptor_holds_back_last_block():
+    key = b'secr3t_k'
+    cipher = crypt_blocks(pad(b'12345678'), key, engine="table")
+    dec = DESStreamDecryptor(key)
+    assert dec.update(cipher) == b'12345678'
+    assert dec.finalize() == b''
+
+
+def test_truncated_ciphertext():
+    dec = DESStreamDecryptor(b'secr3t_k')
+    dec.update(b'\x00' * 12)
+    with pytest.raises(ValueError):
+        dec.finalize()
+
+
+def test_update_after_finalize():
+    enc = DESStreamEncryptor(b'secr3t_k')
+    enc.finalize()
+    with pytest.raises(ValueError):
+        enc.update(b'abc')
+
+
+def test_stream_roundtrip():
+    key = b'secr3t_k'
+    data = os.urandom(5000)
+    encrypted, decrypted = io.BytesIO(), io.BytesIO()
+    written = encrypt_stream(io.BytesIO(data), encrypted, key, chunk_size=512)
+    assert written == len(encrypted.getvalue()) == 5000 + 8 - 5000 % 8
+    decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, key, chunk_size=333)
+    assert decrypted.getvalue() == data
+
+
+@pytest.mark.parametrize("size", [0, 7, 8, 70001])
+def test_file_roundtrip(tmp_path, size):
+    key = b'secr3t_k'
+    data = os.urandom(size)
+    src, enc, dec = tmp_path / "plain", tmp_path / "enc", tmp_path / "dec"
+    src.write_bytes(data)
+    encrypt_file(str(src), str(enc), key, chunk_size=4096)
+    decrypt_file(str(enc), str(dec), key, chunk_size=4096)
+    assert dec.read_bytes() == data
@@ -0,0 +1,65 @@
+# cs7349_001c_1252_final.tests.test_des_table.py
+# Garrett Gruss 4/27/2025
+
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.des_table import (
+    build_permutation_tables, permute_int,
+    generate_subkeys_int, process_block_int, ecb_crypt_int
+)
+from cs7349_001c_1252_final.scripts.des_cipher import (
+    bytes_to_bit_array, bit_array_to_bytes, permute,
+    generate_subkeys, process_block, pad,
+    des_encrypt, des_decrypt
+)
+from cs7349_001c_1252_final.config.des_constants import (
+    INITIAL_PERMUTATION, EXPANSION_PERMUTATION
+)
+
+
+def test_permute_int_matches_permute():
+    block = bytes.fromhex('0123456789abcdef')
+    expected = bit_array_to_bytes(permute(bytes_to_bit_array(block), INITIAL_PERMUTATION))
+    tables = build_permutation_tables(INITIAL_PERMUTATION, 64)
+    assert permute_int(int.from_bytes(block, 'big'), tables).to_bytes(8, 'big') == expected
+
+
+def test_expansion_tables_width():
+    tables = build_permutation_tables(EXPANSION_PERMUTATION, 32)
+    assert len(tables) == 4
+    assert permute_int(0xFFFFFFFF, tables) == (1 << 48) - 1
+
+
+def test_subkeys_match_reference():
+    key = b'secr3t_k'
+    reference = [bit_array_to_bytes(k) for k in generate_subkeys(key)]
+    packed = [k.to_bytes(6, 'big') for k in generate_subkeys_int(key)]
+    assert packed == reference
+
+
+def test_known_vector():
+    key = bytes.fromhex('133457799BBCDFF1')
+    subkeys = generate_subkeys_int(key)
+    cipher = process_block_int(bytes.fromhex('0123456789ABCDEF'), subkeys, encrypt=True)
+    assert cipher.hex() == '85e813540f0ab405'
+    assert process_block_int(cipher, subkeys, encrypt=False).hex() == '0123456789abcdef'
+
+
+def test_blocks_match_reference():
+    key = os.urandom(8)
+    data = pad(os.urandom(61))
+    reference = b''.join(process_block(data[i:i+8], generate_subkeys(key)) for i in range(0, len(data), 8))
+    assert ecb_crypt_int(data, generate_subkeys_int(key)) == reference
+
+
+def test_engine_selection():
+    key = b'secr3t_k'
+    text = 'The quick brown fox'
+    cipher = des_encrypt(text, key, engine="table")
+    assert cipher == des_encrypt(text, key)
+    assert des_decrypt(cipher, key, engine="table") == text
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        des_encrypt('abc', b'secr3t_k', engine="nope")
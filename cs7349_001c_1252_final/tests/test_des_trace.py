@@ -0,0 +1,59 @@
+# cs7349_001c_1252_final.tests.test_des_trace.py
+# Garrett Gruss 4/27/2025
+
+import logging
+import pytest
+from cs7349_001c_1252_final.scripts.des_trace import (
+    RoundTracer, RecordingTracer, LoggingTracer, bits_to_bytes
+)
+from cs7349_001c_1252_final.scripts.des_cipher import (
+    bytes_to_bit_array, generate_subkeys, process_block, bit_array_to_bytes,
+    des_encrypt, des_decrypt
+)
+
+KEY = b'secr3t_k'
+
+
+def test_bits_to_bytes():
+    data = b'\x00\x9f\xff'
+    assert bits_to_bytes(bytes_to_bit_array(data)) == data
+
+
+def test_default_path_does_not_log(caplog):
+    caplog.set_level(logging.DEBUG)
+    des_decrypt(des_encrypt('Hello, DES!', KEY), KEY)
+    assert caplog.records == []
+
+
+def test_recording_tracer():
+    tracer = RecordingTracer()
+    subkeys = generate_subkeys(KEY, tracer)
+    output = process_block(b'Hello, D', subkeys, trace=tracer)
+    assert tracer.subkeys == [bit_array_to_bytes(k) for k in subkeys]
+    assert len(tracer.blocks) == 1
+    record = tracer.blocks[0]
+    assert record.initial_permutation.hex() == '9f00be12007e3d10'
+    assert [r.index for r in record.rounds] == list(range(1, 17))
+    assert record.rounds[0].expanded.hex() == '0003fc1fa8a0'
+    assert record.rounds[0].substituted.hex() == '42220bec'
+    assert record.rounds[0].right.hex() == 'c7701a37'
+    assert record.final_permutation == output
+
+
+def test_logging_tracer_reproduces_demo_output(caplog):
+    caplog.set_level(logging.DEBUG)
+    des_encrypt('Hello, DES!', KEY, trace=LoggingTracer())
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages[0] == 'Subkey  1: 80beee746913'
+    assert messages[16] == 'Initial Permutation applied: 9f00be12007e3d10'
+    assert messages[20] == 'Round  1 L=007e3d10 R=c7701a37'
+    assert all(r.name == 'cs7349_001c_1252_final.scripts.des_cipher' for r in caplog.records)
+
+
+def test_base_tracer_is_noop():
+    assert des_encrypt('abc', KEY, trace=RoundTracer()) == des_encrypt('abc', KEY)
+
+
+def test_trace_requires_bits_engine():
+    with pytest.raises(ValueError):
+        des_encrypt('abc', KEY, engine="table", trace=RecordingTracer())
@@ -0,0 +1,53 @@
+# cs7349_001c_1252_final.tests.test_double_des.py
+# Garrett Gruss 4/27/2025
+
+import os
+import random
+from array import array
+from cs7349_001c_1252_final.scripts import double_des
+from cs7349_001c_1252_final.scripts.double_des import (
+    double_des_crypt_blocks, double_des_encrypt, double_des_decrypt,
+    build_forward_table, sort_entries, meet_in_the_middle
+)
+from cs7349_001c_1252_final.scripts.des_table import generate_subkeys_int, process_block_int
+
+KEY1, KEY2 = b'secr3t_k', b'8bytekey'
+
+
+def test_double_des_composes_single_des():
+    block = os.urandom(8)
+    inner = process_block_int(block, generate_subkeys_int(KEY1))
+    assert double_des_crypt_blocks(block, KEY1, KEY2) == process_block_int(inner, generate_subkeys_int(KEY2))
+
+
+def test_encrypt_decrypt_cycle():
+    data = os.urandom(29)
+    assert double_des_decrypt(double_des_encrypt(data, KEY1, KEY2), KEY1, KEY2) == data
+
+
+def test_sort_entries_without_numpy(monkeypatch):
+    monkeypatch.setattr(double_des, "HAVE_NUMPY", False)
+    entries = array('Q', [random.getrandbits(64) for _ in range(5000)])
+    assert list(sort_entries(array('Q', entries))) == sorted(entries)
+
+
+def test_forward_table_is_compact_and_sorted():
+    table, positions, _ = build_forward_table(b'Hello, D', KEY1, 0xFE)
+    assert table.itemsize == 8
+    assert len(table) == 1 << len(positions) == 1 << 7
+    assert list(table) == sorted(table)
+
+
+def test_meet_in_the_middle_recovers_keys():
+    plaintext = b'Hello, D'
+    ciphertext = double_des_crypt_blocks(plaintext, KEY1, KEY2)
+    check = (b'block #2', double_des_crypt_blocks(b'block #2', KEY1, KEY2))
+    mask1, mask2 = 0xFEFF, 0xFE00FE
+    guess1 = (int.from_bytes(KEY1, 'big') & ~mask1).to_bytes(8, 'big')
+    guess2 = (int.from_bytes(KEY2, 'big') & ~mask2).to_bytes(8, 'big')
+    result = meet_in_the_middle(plaintext, ciphertext, guess1, mask1, guess2, mask2, check=check)
+    assert (KEY1, KEY2) in result.key_pairs
+    # the single parity bit in mask1 doubles the pairs
+    assert len(result.key_pairs) == 2
+    assert result.bytes_per_entry == 8
+    assert result.lookups == 1 << 14
@@ -0,0 +1,106 @@
+# cs7349_001c_1252_final.tests.test_envelope.py
+# Garrett Gruss 4/27/2025
+
+import io
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.des_modes import ctr_crypt
+from cs7349_001c_1252_final.scripts.envelope import (
+    HEADER, SessionKeyCache, _unwrap, _wrap, open_envelope, open_file, read_header, seal, seal_file, seal_stream
+)
+from cs7349_001c_1252_final.scripts.rsa_cipher import generate_rsa_keys
+
+
+@pytest.fixture(scope="module")
+def keys():
+    return [generate_rsa_keys(bits=512) for _ in range(3)]
+
+
+@pytest.mark.parametrize("cipher", ["des", "3des"])
+@pytest.mark.parametrize("size", [0, 1, 8, 1000])
+def test_round_trip(keys, cipher, size):
+    data = os.urandom(size)
+    sealed = seal(data, [k.public_key() for k in keys[:2]], cipher=cipher)
+    assert open_envelope(sealed, keys[0]) == data
+    assert open_envelope(sealed, keys[1]) == data
+    with pytest.raises(ValueError):
+        open_envelope(sealed, keys[2])
+
+
+def test_payload_is_des_ctr(keys):
+    # The payload must be plain DES-CTR under the session key and IV from the header
+    data = os.urandom(100)
+    sealed = seal(data, [keys[0].public_key()])
+    src = io.BytesIO(sealed)
+    cipher, iv, wrapped = read_header(src)
+    session_key = _unwrap(next(iter(wrapped.values())), keys[0])
+    assert cipher == "des" and len(session_key) == 8
+    assert ctr_crypt(src.read(), session_key, iv) == data
+
+
+def test_chunked_and_parallel(keys, tmp_path):
+    data = os.urandom(5000)
+    src, dst, back = tmp_path / "in", tmp_path / "out", tmp_path / "back"
+    src.write_bytes(data)
+    seal_file(str(src), str(dst), [keys[0].public_key()], chunk_size=100, workers=2)
+    open_file(str(dst), str(back), keys[0], chunk_size=333)
+    assert back.read_bytes() == data
+
+
+def test_short_reads(keys):
+    class Trickle(io.BytesIO):
+        def read(self, size=-1):
+            return super().read(min(size, 5) if size and size > 0 else size)
+    data = os.urandom(301)
+    out = io.BytesIO()
+    seal_stream(Trickle(data), out, [keys[0].public_key()], chunk_size=64)
+    assert open_envelope(out.getvalue(), keys[0], chunk_size=64) == data
+
+
+def test_session_cache(keys):
+    cache = SessionKeyCache(max_uses=3)
+    recipients = [k.public_key() for k in keys]
+    sealed = [seal(b"message %d" % i, recipients, cache=cache) for i in range(4)]
+    assert (cache.hits, cache.misses) == (2, 2)
+    # Same wrapped keys while cached, a fresh session key once max_uses is reached
+    headers = [s[HEADER.size:HEADER.size + 200] for s in sealed]
+    assert headers[0] == headers[1] == headers[2] != headers[3]
+    # Different IVs even when the session key is reused
+    assert len({s[:HEADER.size] for s in sealed}) == 4
+    opened = [open_envelope(s, keys[1], cache=cache) for s in sealed]
+    assert opened == [b"message %d" % i for i in range(4)]
+    assert (cache.hits, cache.misses) == (4, 4)
+
+
+def test_wrap_is_randomized(keys):
+    e, n = keys[0].public_key()
+    assert _wrap(b"k" * 8, e, n) != _wrap(b"k" * 8, e, n)
+    assert _unwrap(_wrap(b"k" * 8, e, n), keys[0]) == b"k" * 8
+
+
+def test_rejects_tampered_wrapped_key(keys):
+    e, n = keys[0].public_key()
+    wrapped = _wrap(b"k" * 8, e, n)
+    for i in range(0, len(wrapped), 7):
+        tampered = wrapped[:i] + bytes([wrapped[i] ^ 0x01]) + wrapped[i + 1:]
+        with pytest.raises(ValueError, match="corrupt"):
+            _unwrap(tampered, keys[0])
+    with pytest.raises(ValueError, match="corrupt"):
+        _unwrap(b"\xff" * len(wrapped), keys[0])
+    sealed = bytearray(seal(b"payload", [(e, n)]))
+    sealed[HEADER.size + 12] ^= 0x01
+    with pytest.raises(ValueError):
+        open_envelope(bytes(sealed), keys[0])
+
+
+def test_rejects_bad_input(keys):
+    with pytest.raises(ValueError):
+        seal(b"x", [])
+    with pytest.raises(ValueError):
+        seal(b"x", [keys[0].public_key()], cipher="aes")
+    with pytest.raises(ValueError):
+        seal(b"x", [generate_rsa_keys(bits=64).public_key()])
+    with pytest.raises(ValueError):
+        open_envelope(b"NOPE" + bytes(20), keys[0])
+    with pytest.raises(ValueError):
+        open_envelope(seal(b"x", [keys[0].public_key()])[:20], keys[0])
@@ -0,0 +1,51 @@
+# cs7349_001c_1252_final.tests.test_factoring.py
+# Garrett Gruss 4/27/2025
+
+import random
+import pytest
+from cs7349_001c_1252_final.scripts.factoring import (
+    factorize, fermat, find_factor, pollard_p_minus_1, pollard_rho_brent, trial_division
+)
+from cs7349_001c_1252_final.scripts.number_theory import next_prime, random_prime
+
+
+def test_trial_division_wheel():
+    assert trial_division(7919 * 7927) == 7919
+    assert trial_division(49) == 7
+    assert trial_division(2 * 7919) == 2
+    assert trial_division(7919) is None
+    assert trial_division(1000003 * 1000033, limit=1000) is None
+
+
+def test_fermat_close_factors():
+    p = random_prime(40, random.Random(1))
+    q = next_prime(p)
+    assert fermat(p * q) in (p, q)
+
+
+def test_pollard_p_minus_1_smooth():
+    # 2^2 * 3^4 * 5 * 7 * 11 * 13 + 1 is prime and its p - 1 is very smooth
+    p = 2 ** 2 * 3 ** 4 * 5 * 7 * 11 * 13 + 1
+    q = random_prime(48, random.Random(2))
+    assert pollard_p_minus_1(p * q, bound=100) == p
+
+
+def test_pollard_rho_brent():
+    rng = random.Random(3)
+    p, q = random_prime(28, rng), random_prime(28, rng)
+    assert pollard_rho_brent(p * q, rng=rng) in (p, q)
+
+
+def test_find_factor_reports_timings():
+    rng = random.Random(4)
+    p, q = random_prime(30, rng), random_prime(30, rng)
+    result = find_factor(p * q)
+    assert result.factor in (p, q)
+    assert result.method in result.timings
+    assert find_factor(7919).factor is None
+
+
+@pytest.mark.parametrize("n,expected", [(12, [2, 2, 3]), (1185137, [1061, 1117]), (97, [97]),
+                                        (3 * 5 * 17 * 257 * 65537, [3, 5, 17, 257, 65537])])
+def test_factorize(n, expected):
+    assert factorize(n) == expected
@@ -0,0 +1,105 @@
+# cs7349_001c_1252_final.tests.test_keyring.py
+# Garrett Gruss 4/27/2025
+
+import os
+import stat
+import pytest
+from cs7349_001c_1252_final.scripts.des_key import DESKey
+from cs7349_001c_1252_final.scripts.keyring import HEADER, INDEX_ENTRY, MAGIC, Keyring, write_keyring
+from cs7349_001c_1252_final.scripts.rsa_cipher import generate_rsa_keys
+
+
+@pytest.fixture(scope="module")
+def rsa_keys():
+    return [generate_rsa_keys(bits=512), generate_rsa_keys(bits=512, primes=3)]
+
+
+def test_round_trip(tmp_path, rsa_keys):
+    path = str(tmp_path / "keys.bin")
+    write_keyring(path, {"alice": rsa_keys[0], "bob": rsa_keys[1], "des": b"secr3t_k", "des2": DESKey(b"12345678")})
+    with Keyring(path) as ring:
+        assert len(ring) == 4
+        assert list(ring.ids()) == ["alice", "bob", "des", "des2"]
+        alice, bob = ring.get("alice"), ring["bob"]
+        assert alice == rsa_keys[0] and (alice.dp, alice.dq, alice.q_inv) == (rsa_keys[0].dp, rsa_keys[0].dq, rsa_keys[0].q_inv)
+        assert bob == rsa_keys[1] and bob.extra == rsa_keys[1].extra
+        assert bob.decrypt(pow(12345, bob.e, bob.n)) == 12345
+        assert ring.get("des") == DESKey(b"secr3t_k")
+        assert ring.get(b"des2").key == b"12345678"
+
+
+def test_lookup_among_many(tmp_path, rsa_keys):
+    path = str(tmp_path / "many.bin")
+    keys = {f"key-{i:05d}": (rsa_keys[0] if i % 100 == 0 else i.to_bytes(8, 'big')) for i in range(5000)}
+    write_keyring(path, keys)
+    with Keyring(path) as ring:
+        for i in (0, 1, 2500, 4999):
+            assert ring.get(f"key-{i:05d}") == (rsa_keys[0] if i % 100 == 0 else DESKey(i.to_bytes(8, 'big')))
+        assert "key-04999" in ring
+        assert "key-05000" not in ring and "a" not in ring and "zzz" not in ring
+        assert "x" * 17 not in ring and "" not in ring and "a\0b" not in ring
+        with pytest.raises(KeyError):
+            ring.get("missing")
+
+
+def test_file_is_owner_only(tmp_path):
+    path = str(tmp_path / "private.bin")
+    write_keyring(path, {"des": b"secr3t_k"})
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_corrupt_records(tmp_path, rsa_keys):
+    path = str(tmp_path / "keys.bin")
+    write_keyring(path, {"alice": rsa_keys[0], "des": b"secr3t_k", "zed": rsa_keys[1]})
+    with open(path, 'rb') as f:
+        data = f.read()
+    # Cut into the last record: the index is intact, the record runs past the end of the file
+    with open(path, 'wb') as f:
+        f.write(data[:-40])
+    with Keyring(path) as ring:
+        assert ring.get("alice") == rsa_keys[0]
+        with pytest.raises(ValueError, match="truncated or corrupt"):
+            ring.get("zed")
+    # An RSA record whose int count is not 7 + 3k
+    start = HEADER.size + 3 * INDEX_ENTRY.size
+    with open(path, 'wb') as f:
+        f.write(data[:start] + b"\x00\x08" + data[start + 2:])
+    with Keyring(path) as ring, pytest.raises(ValueError, match="truncated or corrupt"):
+        ring.get("alice")
+    # An int length that runs past its record
+    with open(path, 'wb') as f:
+        f.write(data[:start + 2] + b"\xff\xff" + data[start + 4:])
+    with Keyring(path) as ring, pytest.raises(ValueError, match="truncated or corrupt"):
+        ring.get("alice")
+
+
+def test_empty_keyring(tmp_path):
+    path = str(tmp_path / "empty.bin")
+    write_keyring(path, {})
+    with Keyring(path) as ring:
+        assert len(ring) == 0 and "x" not in ring
+
+
+def test_rejects_bad_input(tmp_path):
+    path = str(tmp_path / "bad.bin")
+    with pytest.raises(ValueError):
+        write_keyring(path, {"x" * 17: b"secr3t_k"})
+    with pytest.raises(ValueError):
+        write_keyring(path, {"x": b"short"})
+    with pytest.raises(ValueError):
+        write_keyring(path, {"x": b"secr3t_k", b"x": b"secr3t_k"})
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(b"NOPE", 1, 0, 0))
+    with pytest.raises(ValueError):
+        Keyring(path)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, 99, 0, 0))
+    with pytest.raises(ValueError):
+        Keyring(path)
+    open(path, 'wb').close()
+    with pytest.raises(ValueError):
+        Keyring(path)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, 1, 0, 3))
+    with pytest.raises(ValueError, match="truncated"):
+        Keyring(path)
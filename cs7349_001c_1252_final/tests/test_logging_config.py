@@ -0,0 +1,99 @@
+# cs7349_001c_1252_final.tests.test_logging_config.py
+# Garrett Gruss 4/27/2025
+
+import logging
+import os
+import subprocess
+import sys
+from logging.handlers import QueueHandler
+import pytest
+from cs7349_001c_1252_final.config import logging_config
+from cs7349_001c_1252_final.config.logging_config import (
+    LEVELS_ENV, OFF, logger_name, parse_levels, setup_logging, shutdown_logging
+)
+
+RSA_LOGGER = "cs7349_001c_1252_final.scripts.rsa_cipher"
+DES_LOGGER = "cs7349_001c_1252_final.scripts.des_cipher"
+
+
+@pytest.fixture(autouse=True)
+def restore_logging(monkeypatch):
+    monkeypatch.delenv(LEVELS_ENV, raising=False)
+    monkeypatch.delenv(logging_config.LEVEL_ENV, raising=False)
+    level = logging.getLogger().level
+    yield
+    shutdown_logging()
+    logging.getLogger().setLevel(level)
+
+
+def _queue_handlers():
+    return [h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)]
+
+
+def test_import_opens_no_file(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    code = "import cs7349_001c_1252_final.scripts.des_cipher, cs7349_001c_1252_final.scripts.rsa_cipher"
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, check=True,
+                   env={**os.environ, "PYTHONPATH": root})
+    assert os.listdir(tmp_path) == []
+
+
+def test_file_is_lazy_and_written_by_listener(tmp_path):
+    path = tmp_path / "app.log"
+    setup_logging(level="INFO", log_file=str(path), console=False)
+    assert not path.exists()
+    logging.getLogger(RSA_LOGGER).debug("hidden")
+    logging.getLogger(RSA_LOGGER).info("hello %s", "world")
+    shutdown_logging()
+    text = path.read_text()
+    assert "hello world" in text and "hidden" not in text and "rsa_cipher" in text
+
+
+def test_per_module_levels(tmp_path):
+    path = tmp_path / "app.log"
+    setup_logging(level="DEBUG", levels={"des_cipher": "OFF", "rsa_cipher": "INFO"}, log_file=str(path), console=False)
+    assert logging.getLogger(DES_LOGGER).level == OFF
+    assert not logging.getLogger(RSA_LOGGER).isEnabledFor(logging.DEBUG)
+    assert logging.getLogger("cs7349_001c_1252_final.scripts.des_table").isEnabledFor(logging.DEBUG)
+    logging.getLogger(DES_LOGGER).critical("des message")
+    logging.getLogger(RSA_LOGGER).info("rsa message")
+    shutdown_logging()
+    text = path.read_text()
+    assert "rsa message" in text and "des message" not in text
+    # Levels set by setup_logging are undone on shutdown
+    assert logging.getLogger(DES_LOGGER).level == logging.NOTSET
+
+
+def test_environment_overrides(tmp_path, monkeypatch):
+    monkeypatch.setenv(LEVELS_ENV, "rsa_cipher=WARNING")
+    setup_logging(levels={"rsa_cipher": "DEBUG"}, log_file=None, console=False)
+    assert logging.getLogger(RSA_LOGGER).level == logging.WARNING
+
+
+def test_setup_twice_keeps_one_handler(tmp_path):
+    setup_logging(log_file=None, console=False)
+    setup_logging(log_file=str(tmp_path / "app.log"))
+    assert len(_queue_handlers()) == 1
+    shutdown_logging()
+    assert _queue_handlers() == []
+
+
+def test_rotation(tmp_path):
+    path = tmp_path / "app.log"
+    setup_logging(log_file=str(path), console=False, max_bytes=2000, backup_count=2)
+    for i in range(200):
+        logging.getLogger(RSA_LOGGER).info("line %d", i)
+    shutdown_logging()
+    assert sorted(os.listdir(tmp_path)) == ["app.log", "app.log.1", "app.log.2"]
+    assert os.path.getsize(path) <= 2000
+
+
+def test_parse_levels():
+    assert parse_levels("des_cipher=OFF, rsa_cipher=info,") == {DES_LOGGER: OFF, RSA_LOGGER: logging.INFO}
+    assert logger_name("scripts") == "cs7349_001c_1252_final.scripts"
+    assert logger_name("benchmarks.suite") == "cs7349_001c_1252_final.benchmarks.suite"
+    assert logger_name(RSA_LOGGER) == RSA_LOGGER
+    with pytest.raises(ValueError):
+        parse_levels("rsa_cipher")
+    with pytest.raises(ValueError):
+        parse_levels("rsa_cipher=LOUD")
@@ -0,0 +1,98 @@
+# cs7349_001c_1252_final.tests.test_main.py
+# Garrett Gruss 4/27/2025
+
+import json
+import os
+import stat
+import subprocess
+import sys
+from cs7349_001c_1252_final.main import main, expand_inputs, parse_des_key
+
+
+def _write_files(directory, count=3):
+    contents = {}
+    for i in range(count):
+        data = os.urandom(100 * i + 5)
+        path = directory / f"file{i}.txt"
+        path.write_bytes(data)
+        contents[path.name] = data
+    return contents
+
+
+def test_des_round_trip_directory(tmp_path, capsys):
+    src = tmp_path / "src"
+    src.mkdir()
+    contents = _write_files(src)
+    enc, dec = tmp_path / "enc", tmp_path / "dec"
+    assert main(["des", "encrypt", "-k", "secr3t_k", "-o", str(enc), str(src)]) == 0
+    assert "3 files" in capsys.readouterr().out
+    assert sorted(os.listdir(enc)) == sorted(name + ".des" for name in contents)
+    assert main(["des", "decrypt", "-k", "secr3t_k", "-j", "2", "-o", str(dec), str(enc / "*.des")]) == 0
+    for name, data in contents.items():
+        assert (dec / name).read_bytes() == data
+
+
+def test_hex_key_matches_text_key():
+    assert parse_des_key("7365637233745f6b") == b"secr3t_k"
+
+
+def test_rsa_keygen_encrypt_decrypt_crack(tmp_path, capsys):
+    key = tmp_path / "key.json"
+    assert main(["rsa", "keygen", "--bits", "20", "-o", str(key)]) == 0
+    assert stat.S_IMODE(os.stat(key).st_mode) == 0o600
+    data = os.urandom(50)
+    (tmp_path / "msg.bin").write_bytes(data)
+    assert main(["rsa", "encrypt", "-k", str(key), str(tmp_path / "msg.bin")]) == 0
+    os.remove(tmp_path / "msg.bin")
+    assert main(["rsa", "decrypt", "-k", str(key), str(tmp_path / "msg.bin.rsa")]) == 0
+    assert (tmp_path / "msg.bin").read_bytes() == data
+    capsys.readouterr()
+    assert main(["rsa", "crack", "-k", str(key)]) == 0
+    assert json.loads(capsys.readouterr().out)["d"] == json.loads(key.read_text())["d"]
+
+
+def test_failed_decrypt_leaves_no_output(tmp_path):
+    (tmp_path / "b.txt").write_bytes(b"not a cipher!")
+    assert main(["des", "decrypt", "-k", "secr3t_k", str(tmp_path / "b.txt")]) == 2
+    assert sorted(os.listdir(tmp_path)) == ["b.txt"]
+    # An existing file with the output's name is left alone
+    (tmp_path / "c.txt.dec").write_bytes(b"keep")
+    (tmp_path / "c.txt").write_bytes(os.urandom(13))
+    assert main(["des", "decrypt", "-k", "secr3t_k", str(tmp_path / "c.txt")]) == 2
+    assert (tmp_path / "c.txt.dec").read_bytes() == b"keep"
+    (tmp_path / "d.rsa").write_bytes(b"odd")
+    assert main(["rsa", "keygen", "--bits", "20", "-o", str(tmp_path / "key.json")]) == 0
+    assert main(["rsa", "decrypt", "-k", str(tmp_path / "key.json"), str(tmp_path / "d.rsa")]) == 2
+    assert not (tmp_path / "d").exists() and not (tmp_path / "d.part").exists()
+
+
+def test_missing_input(tmp_path):
+    assert main(["des", "encrypt", "-k", "secr3t_k", str(tmp_path / "nope")]) == 2
+    assert expand_inputs([str(tmp_path / "*.none")]) == []
+
+
+def test_startup_imports_are_lazy():
+    code = ("import sys; from cs7349_001c_1252_final.main import build_parser; build_parser(); "
+            "print(any(m in sys.modules for m in ('coloredlogs', 'cs7349_001c_1252_final.scripts.des_cipher')))")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "False"
+
+
+def test_rsa_multi_prime_round_trip(tmp_path):
+    key = tmp_path / "key.json"
+    assert main(["rsa", "keygen", "--bits", "256", "--primes", "3", "-o", str(key)]) == 0
+    assert len(json.loads(key.read_text())["primes"]) == 3
+    data = os.urandom(100)
+    (tmp_path / "msg.bin").write_bytes(data)
+    assert main(["rsa", "encrypt", "-k", str(key), "-o", str(tmp_path / "enc"), str(tmp_path / "msg.bin")]) == 0
+    assert main(["rsa", "decrypt", "-k", str(key), "-o", str(tmp_path / "dec"), str(tmp_path / "enc")]) == 0
+    assert (tmp_path / "dec" / "msg.bin").read_bytes() == data
+
+
+def test_rsa_scan(tmp_path, capsys):
+    from cs7349_001c_1252_final.scripts.number_theory import random_prime
+    p, q, r = (random_prime(64) for _ in range(3))
+    (tmp_path / "moduli.txt").write_text(f"{p * q}\n{hex(p * r)}\n{random_prime(64) * random_prime(64)}\n")
+    assert main(["rsa", "scan", str(tmp_path / "moduli.txt")]) == 0
+    found = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [key["index"] for key in found] == [0, 1]
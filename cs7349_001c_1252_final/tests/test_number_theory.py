@@ -0,0 +1,49 @@
+# cs7349_001c_1252_final.tests.test_number_theory.py
+# Garrett Gruss 4/27/2025
+
+import random
+import pytest
+from cs7349_001c_1252_final.scripts.number_theory import (
+    is_prime, iter_primes, next_prime, simple_sieve
+)
+
+
+def _trial_division(n):
+    return n > 1 and all(n % i for i in range(2, int(n ** 0.5) + 1))
+
+
+def test_is_prime_matches_trial_division():
+    assert [n for n in range(5000) if is_prime(n)] == [n for n in range(5000) if _trial_division(n)]
+
+
+def test_strong_pseudoprimes_rejected():
+    # Carmichael number, a base-2..23 strong pseudoprime and the smallest base-2..37 one
+    for n in (561, 3825123056546413051, 318665857834031151167461):
+        assert not is_prime(n)
+
+
+def test_large_primes():
+    assert is_prime(2 ** 61 - 1)
+    assert is_prime(2 ** 127 - 1)
+    assert not is_prime(2 ** 127 + 1)
+    assert is_prime(2 ** 521 - 1, rng=random.Random(1))
+    assert not is_prime((2 ** 521 - 1) * (2 ** 607 - 1))
+
+
+@pytest.mark.parametrize("start,end", [(0, 1), (0, 2), (3, 3), (9, 9), (10, 20), (1000, 3000), (999983, 1000100)])
+def test_iter_primes_small_segments(start, end):
+    expected = [n for n in range(start, end + 1) if _trial_division(n)]
+    assert list(iter_primes(start, end, segment_size=7)) == expected
+    assert list(iter_primes(start, end)) == expected
+
+
+def test_iter_primes_high_window():
+    window = list(iter_primes(10 ** 10, 10 ** 10 + 1000))
+    assert window == [n for n in range(10 ** 10, 10 ** 10 + 1001) if is_prime(n)]
+    assert window[0] == 10000000019
+
+
+def test_simple_sieve_and_next_prime():
+    assert simple_sieve(30) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert next_prime(7919) == 7927
+    assert next_prime(1) == 2
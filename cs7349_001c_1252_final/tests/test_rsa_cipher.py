@@ -1,10 +1,12 @@
 # cs7349_001c_1252_final.tests.test_rsa_cipher.py
 # Garrett Gruss 4/27/2025
 
+import random
 import pytest
 from cs7349_001c_1252_final.scripts.rsa_cipher import (
-    is_prime, find_primes_in_range, ext_euclidean, mod_inv,
-    generate_rsa_keys, encrypt, decrypt
+    is_prime, find_primes_in_range, ext_euclidean, mod_inv, batch_mod_inv,
+    generate_rsa_keys, generate_rsa_keypairs, encrypt, decrypt, RSAPrivateKey,
+    brute_force_private_key, crack_private_key
 )
 from cs7349_001c_1252_final.scripts.utils import (
     str_to_nums, nums_to_str
@@ -33,18 +35,41 @@ def test_mod_inv_and_ext_euclidean():
 
 
 def test_generate_keys_properties():
-    p, q, e, n, d = generate_rsa_keys()
-    # p and q are prime and in correct range
-    assert is_prime(p) and 1000 < p < 10000
-    assert is_prime(q) and 1000 < q < 10000
-    # n = p*q and e*d ≡ 1 mod phi
+    p, q, e, n, d = generate_rsa_keys(bits=512)
+    # p and q are distinct primes of half the modulus size
+    assert is_prime(p) and p.bit_length() == 256
+    assert is_prime(q) and q.bit_length() == 256
+    assert p != q
+    # n = p*q has exactly the requested size and e*d ≡ 1 mod phi
     phi = (p - 1) * (q - 1)
-    assert n == p * q
+    assert n == p * q and n.bit_length() == 512
+    assert e == 65537
     assert (e * d) % phi == 1
 
 
+def test_generate_keys_default_and_odd_sizes():
+    key = generate_rsa_keys()
+    assert key.n.bit_length() == 2048
+    assert generate_rsa_keys(bits=25, e=3).n.bit_length() == 25
+    with pytest.raises(ValueError):
+        generate_rsa_keys(bits=8)
+    with pytest.raises(ValueError):
+        generate_rsa_keys(bits=64, e=4)
+
+
+def test_generate_keys_seeded_rng():
+    assert generate_rsa_keys(256, rng=random.Random(1)) == generate_rsa_keys(256, rng=random.Random(1))
+    assert generate_rsa_keys(256, rng=random.Random(1)) != generate_rsa_keys(256, rng=random.Random(2))
+
+
+def test_generate_keypairs_parallel():
+    keys = generate_rsa_keypairs(3, bits=128, workers=2)
+    assert len({key.n for key in keys}) == 3
+    assert all(key.n.bit_length() == 128 for key in keys)
+
+
 def test_encrypt_decrypt_integer():
-    p, q, e, n, d = generate_rsa_keys()
+    p, q, e, n, d = generate_rsa_keys(bits=512)
     m = 42
     c = encrypt(m, e, n)
     m2 = decrypt(c, d, n)
@@ -55,7 +80,7 @@ def test_encrypt_decrypt_message_rsa():
     # Test string 'rsa'
     msg = 'rsa'
     nums = str_to_nums(msg)
-    p, q, e, n, d = generate_rsa_keys()
+    p, q, e, n, d = generate_rsa_keys(bits=64)
     decrypted_nums = []
     for m in nums:
         c = encrypt(m, e, n)
@@ -63,3 +88,71 @@ def test_encrypt_decrypt_message_rsa():
         decrypted_nums.append(m2)
     assert decrypted_nums == nums
     assert nums_to_str(decrypted_nums) == msg
+
+
+def test_crt_decrypt_matches_plain_decrypt():
+    key = generate_rsa_keys(bits=512)
+    p, q, e, n, d = key
+    assert (key.dp, key.dq) == (d % (p - 1), d % (q - 1))
+    assert (key.q_inv * q) % p == 1
+    messages = [0, 1, 2, n - 1, 123456789] + [random.randrange(n) for _ in range(20)]
+    ciphertexts = [encrypt(m, e, n) for m in messages]
+    assert [key.decrypt(c) for c in ciphertexts] == [decrypt(c, d, n) for c in ciphertexts] == messages
+    assert key.decrypt_many(ciphertexts) == messages
+    # Out-of-range inputs reduce exactly like pow(c, d, n)
+    assert key.decrypt(n + 5) == decrypt(n + 5, d, n)
+    assert key.sign(42) == decrypt(42, d, n)
+    assert encrypt(key.sign(42), e, n) == 42
+
+
+def test_private_key_from_primes():
+    key = RSAPrivateKey(1061, 1117, 65537)
+    assert tuple(key) == (1061, 1117, 65537, 1185137, 200033)
+    assert key == RSAPrivateKey(1061, 1117, 65537, 200033)
+    assert key.public_key() == (65537, 1185137)
+    with pytest.raises(ValueError):
+        RSAPrivateKey(1061, 1061, 65537)
+
+
+@pytest.mark.parametrize("primes", [3, 4])
+def test_multi_prime_keys(primes):
+    key = generate_rsa_keys(bits=1024, primes=primes)
+    e, n, d = key.e, key.n, key.d
+    assert len(key.primes) == primes and all(is_prime(r) for r in key.primes)
+    assert n.bit_length() == 1024
+    messages = [0, 1, n - 1] + [random.randrange(n) for _ in range(10)]
+    # encrypt is unchanged; Garner recombination must agree with pow(c, d, n)
+    ciphertexts = [encrypt(m, e, n) for m in messages]
+    assert key.decrypt_many(ciphertexts) == [decrypt(c, d, n) for c in ciphertexts] == messages
+    with pytest.raises(ValueError):
+        generate_rsa_keys(bits=24, primes=4)
+
+
+@pytest.mark.parametrize("bits,primes", [(48, 2), (64, 2), (60, 3)])
+def test_crack_private_key(bits, primes):
+    key = generate_rsa_keys(bits=bits, primes=primes)
+    result = crack_private_key(key.e, key.n)
+    assert result.p * result.q == key.n
+    assert result.d == key.d
+    assert result.method in result.timings
+    assert brute_force_private_key(key.e, key.n)[2] == key.d
+
+
+def test_ext_euclidean_large_inputs():
+    # Consecutive Fibonacci numbers are the worst case for Euclid's step count
+    a, b = 1, 1
+    for _ in range(5000):
+        a, b = b, a + b
+    g, x, y = ext_euclidean(a, b)
+    assert g == 1 and a * x + b * y == 1
+    assert mod_inv(a, b) == x % b
+
+
+def test_batch_mod_inv():
+    m = (1 << 127) - 1
+    values = [random.randrange(1, m) for _ in range(50)]
+    assert batch_mod_inv(values, m) == [mod_inv(v, m) for v in values]
+    assert batch_mod_inv([], m) == []
+    assert batch_mod_inv([3, 7], 20) == [7, 3]
+    with pytest.raises(ValueError):
+        batch_mod_inv([3, 4, 7], 20)
@@ -0,0 +1,50 @@
+# cs7349_001c_1252_final.tests.test_tdes_cipher.py
+# Garrett Gruss 4/27/2025
+
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.tdes_cipher import (
+    TDESKey, tdes_crypt_blocks, tdes_encrypt, tdes_decrypt
+)
+from cs7349_001c_1252_final.scripts.des_cipher import generate_subkeys, process_block
+
+# NIST SP 800-67 Rev. 1 example (keying option 1)
+NIST_KEY = bytes.fromhex('0123456789ABCDEF' '23456789ABCDEF01' '456789ABCDEF0123')
+NIST_PLAINTEXT = b'The qufck brown fox jump'
+NIST_CIPHERTEXT = bytes.fromhex('A826FD8CE53B855F' 'CCE21C8112256FE6' '68D5C05DD9B6B900')
+
+
+def test_nist_vector():
+    assert tdes_crypt_blocks(NIST_PLAINTEXT, NIST_KEY) == NIST_CIPHERTEXT
+    assert tdes_crypt_blocks(NIST_CIPHERTEXT, NIST_KEY, encrypt=False) == NIST_PLAINTEXT
+
+
+def test_matches_chained_process_block():
+    key = os.urandom(24)
+    k1, k2, k3 = (generate_subkeys(key[i:i+8]) for i in (0, 8, 16))
+    block = os.urandom(8)
+    expected = process_block(process_block(process_block(block, k1), k2, encrypt=False), k3)
+    assert tdes_crypt_blocks(block, TDESKey(key)) == expected
+
+
+def test_two_key_option():
+    key = os.urandom(16)
+    block = os.urandom(8)
+    assert tdes_crypt_blocks(block, key) == tdes_crypt_blocks(block, key + key[:8])
+
+
+def test_degenerates_to_single_des():
+    key = b'secr3t_k'
+    block = os.urandom(8)
+    assert tdes_crypt_blocks(block, key * 3) == process_block(block, generate_subkeys(key))
+
+
+def test_encrypt_decrypt_cycle():
+    key = os.urandom(24)
+    text = 'The quick brown fox'
+    assert tdes_decrypt(tdes_encrypt(text, key), key) == text
+
+
+def test_invalid_key_length():
+    with pytest.raises(ValueError):
+        tdes_encrypt('abc', b'secr3t_k')
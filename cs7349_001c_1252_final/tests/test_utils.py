@@ -0,0 +1,53 @@
+# cs7349_001c_1252_final.tests.test_utils.py
+# Garrett Gruss 4/27/2025
+
+import os
+import pytest
+from cs7349_001c_1252_final.scripts.rsa_cipher import decrypt_message, encrypt_message, generate_rsa_keys
+from cs7349_001c_1252_final.scripts.utils import (
+    block_size, iter_pack_blocks, iter_unpack_blocks, pack_blocks, unpack_blocks, str_to_blocks, blocks_to_str
+)
+
+
+def test_round_trip_lengths():
+    n = (1 << 63) + 12345  # 7-byte blocks
+    assert block_size(n) == 7
+    for length in (0, 1, 6, 7, 8, 14, 100):
+        data = os.urandom(length)
+        blocks = pack_blocks(data, n)
+        assert len(blocks) == length // 7 + 1
+        assert all(0 <= b < n for b in blocks)
+        assert unpack_blocks(blocks, n) == data
+
+
+def test_streaming_matches_one_shot():
+    n = (1 << 100) + 1
+    data = os.urandom(1000)
+    chunks = [data[i:i+13] for i in range(0, len(data), 13)]
+    assert list(iter_pack_blocks(chunks, n)) == pack_blocks(data, n)
+    assert b''.join(iter_unpack_blocks(iter(pack_blocks(data, n)), n)) == data
+
+
+def test_utf8_text():
+    n = (1 << 255) + 19
+    text = "naïve résumé – ☃ rsa"
+    assert blocks_to_str(str_to_blocks(text, n), n) == text
+
+
+def test_invalid_input():
+    n = (1 << 63) + 1
+    with pytest.raises(ValueError):
+        block_size(255)
+    with pytest.raises(ValueError):
+        unpack_blocks([], n)
+    with pytest.raises(ValueError):
+        unpack_blocks([5], n)
+
+
+def test_message_costs_one_exponentiation_per_block():
+    key = generate_rsa_keys(bits=512)
+    data = os.urandom(1024)
+    ciphertexts = encrypt_message(data, key.e, key.n)
+    # 63-byte blocks plus the padding block, instead of one per byte
+    assert len(ciphertexts) == 1024 // 63 + 1
+    assert decrypt_message(ciphertexts, key) == data